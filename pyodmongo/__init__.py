@@ -2,6 +2,13 @@ from .engines.engines import AsyncDbEngine, DbEngine
 from .models.db_model import DbModel, MainBaseModel
 from .models.id_model import Id
 from .models.db_decimal import DbDecimal
-from .models.paginate import ResponsePaginate
+from .models.paginate import ResponsePaginate, ResponseKeysetPaginate
 from .models.responses import DbResponse
+from .models.index_plan import IndexPlan
 from .models.fields import Field
+from .services.read_cache import ReadCache
+from .services.cache_backends import (
+    CacheBackend,
+    MemoryCacheBackend,
+    SqliteCacheBackend,
+)
@@ -0,0 +1,268 @@
+from asyncio import Future as AsyncFuture, Task, gather, get_running_loop
+from concurrent.futures import Future
+from threading import Lock, RLock, Timer
+from ..models.db_model import DbModel
+from ..models.responses import DbResponse
+
+
+class _BufferedWriterBase:
+    """
+    Common state of the buffered writers: the pending objects, grouped by collection.
+
+    Attributes:
+        _engine (AsyncDbEngine | DbEngine): The engine used to write the batches.
+        _max_operations (int): The number of pending objects of a collection that
+                               triggers a flush of that collection.
+        _flush_interval (float): The maximum time, in seconds, an object waits in the
+                                 buffer before being written.
+        _populate (bool): If True, referenced objects are saved embedded.
+        _buffers (dict[str, list[tuple[DbModel, Future]]]): The pending objects and
+                                 their flush futures keyed by collection name.
+    """
+
+    def __init__(
+        self,
+        engine,
+        max_operations: int = 1000,
+        flush_interval_ms: int = 1000,
+        populate: bool = False,
+    ):
+        if max_operations < 1:
+            raise ValueError("max_operations must be greater than zero")
+        self._engine = engine
+        self._max_operations = max_operations
+        self._flush_interval = flush_interval_ms / 1000
+        self._populate = populate
+        self._buffers = {}
+
+    @property
+    def pending(self) -> int:
+        return sum(len(buffer) for buffer in self._buffers.values())
+
+    def _set_results(self, items: list, response: dict[str, DbResponse]):
+        for obj, future in items:
+            if not future.done():
+                future.set_result(response[obj._collection])
+
+    def _set_exception(self, items: list, error: BaseException):
+        for _, future in items:
+            if not future.done():
+                future.set_exception(error)
+
+
+class AsyncBufferedWriter(_BufferedWriterBase):
+    """
+    Write-behind buffer for AsyncDbEngine that batches saves per collection.
+
+    Objects passed to `add` are written with one bulk write per collection when the
+    collection reaches `max_operations` pending objects, when `flush_interval_ms`
+    elapses, when `flush` is called or when the `async with` block exits. Ids and
+    timestamps are filled in on the objects exactly as `save_all` does.
+    """
+
+    def __init__(
+        self,
+        engine,
+        max_operations: int = 1000,
+        flush_interval_ms: int = 1000,
+        populate: bool = False,
+    ):
+        super().__init__(
+            engine=engine,
+            max_operations=max_operations,
+            flush_interval_ms=flush_interval_ms,
+            populate=populate,
+        )
+        self._timer = None
+        self._tasks: set[Task] = set()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    def add(self, obj: DbModel) -> AsyncFuture:
+        """
+        Buffer an object to be saved.
+
+        Args:
+            obj (DbModel): The database model object.
+
+        Returns:
+            asyncio.Future: Resolves to the DbResponse of the bulk write that saved the
+                object, or raises the error of that write.
+        """
+        loop = get_running_loop()
+        future = loop.create_future()
+        buffer = self._buffers.setdefault(obj._collection, [])
+        buffer.append((obj, future))
+        if len(buffer) >= self._max_operations:
+            self._start_flush(collection_names=[obj._collection])
+        elif self._timer is None:
+            self._timer = loop.call_later(self._flush_interval, self._on_timer)
+        return future
+
+    async def flush(self):
+        """
+        Write all the pending objects and wait for every flush in progress.
+        """
+        self._cancel_timer()
+        self._start_flush(collection_names=list(self._buffers))
+        while self._tasks:
+            await gather(*self._tasks, return_exceptions=True)
+
+    async def close(self):
+        """
+        Flush the pending objects. The writer can still be used afterwards.
+        """
+        await self.flush()
+
+    def _on_timer(self):
+        self._timer = None
+        self._start_flush(collection_names=list(self._buffers))
+
+    def _cancel_timer(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+    def _start_flush(self, collection_names: list[str]):
+        items = []
+        for collection_name in collection_names:
+            items += self._buffers.pop(collection_name, [])
+        if not self._buffers:
+            self._cancel_timer()
+        if not items:
+            return
+        task = get_running_loop().create_task(self._write(items=items))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _write(self, items: list):
+        try:
+            response = await self._engine._save_chunk(
+                obj_list=[obj for obj, _ in items],
+                populate=self._populate,
+                insert_new=False,
+                ordered=True,
+                max_concurrency=None,
+            )
+        except Exception as error:
+            self._set_exception(items=items, error=error)
+        else:
+            self._set_results(items=items, response=response)
+
+
+class BufferedWriter(_BufferedWriterBase):
+    """
+    Write-behind buffer for DbEngine that batches saves per collection.
+
+    Objects passed to `add` are written with one bulk write per collection when the
+    collection reaches `max_operations` pending objects (in the calling thread), when
+    `flush_interval_ms` elapses (in a timer thread), when `flush` is called or when the
+    `with` block exits. Ids and timestamps are filled in on the objects exactly as
+    `save_all` does. Writes run one at a time, so `flush` also waits for a write
+    started by the timer or by another thread.
+    """
+
+    def __init__(
+        self,
+        engine,
+        max_operations: int = 1000,
+        flush_interval_ms: int = 1000,
+        populate: bool = False,
+    ):
+        super().__init__(
+            engine=engine,
+            max_operations=max_operations,
+            flush_interval_ms=flush_interval_ms,
+            populate=populate,
+        )
+        self._timer = None
+        self._lock = Lock()
+        # Reentrant because future callbacks run in the writing thread and may add.
+        self._write_lock = RLock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def add(self, obj: DbModel) -> Future:
+        """
+        Buffer an object to be saved.
+
+        Args:
+            obj (DbModel): The database model object.
+
+        Returns:
+            concurrent.futures.Future: Resolves to the DbResponse of the bulk write that
+                saved the object, or raises the error of that write.
+        """
+        future = Future()
+        with self._lock:
+            buffer = self._buffers.setdefault(obj._collection, [])
+            buffer.append((obj, future))
+            full = len(buffer) >= self._max_operations
+            if not full and self._timer is None:
+                self._timer = Timer(self._flush_interval, self._on_timer)
+                self._timer.daemon = True
+                self._timer.start()
+        if full:
+            self._flush_collections(collection_names=[obj._collection])
+        return future
+
+    def flush(self):
+        """
+        Write all the pending objects and wait for the write in progress, if any.
+        """
+        self._flush_collections(collection_names=None)
+
+    def close(self):
+        """
+        Flush the pending objects. The writer can still be used afterwards.
+        """
+        self.flush()
+
+    def _on_timer(self):
+        with self._lock:
+            self._timer = None
+        self._flush_collections(collection_names=None)
+
+    def _flush_collections(self, collection_names: list[str] | None):
+        with self._write_lock:
+            with self._lock:
+                items = self._pop_items(
+                    collection_names=(
+                        list(self._buffers)
+                        if collection_names is None
+                        else collection_names
+                    )
+                )
+            self._write(items=items)
+
+    def _pop_items(self, collection_names: list[str]) -> list:
+        items = []
+        for collection_name in collection_names:
+            items += self._buffers.pop(collection_name, [])
+        if not self._buffers and self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        return items
+
+    def _write(self, items: list):
+        if not items:
+            return
+        try:
+            response = self._engine._save_chunk(
+                obj_list=[obj for obj, _ in items],
+                populate=self._populate,
+                insert_new=False,
+                ordered=True,
+            )
+        except Exception as error:
+            self._set_exception(items=items, error=error)
+        else:
+            self._set_results(items=items, response=response)
@@ -1,25 +1,78 @@
 from motor.motor_asyncio import AsyncIOMotorClient
-from pymongo import MongoClient, UpdateMany, DeleteOne, DeleteMany
+from pymongo import (
+    MongoClient,
+    InsertOne,
+    UpdateMany,
+    DeleteOne,
+    DeleteMany,
+    IndexModel,
+)
 from pymongo.results import BulkWriteResult
 from datetime import datetime, timezone
-from bson import ObjectId
+from bson import ObjectId, encode as bson_encode
 from bson.codec_options import CodecOptions
 from ..models.db_model import DbModel
 from ..models.id_model import Id
 from ..models.responses import DbResponse
 from ..models.query_operators import QueryOperator
 from ..models.sort_operators import SortOperator
-from ..models.paginate import ResponsePaginate
+from ..models.paginate import ResponsePaginate, ResponseKeysetPaginate
+from ..models.index_plan import IndexPlan
 from ..models.db_field_info import DbField
-from typing import TypeVar, Type, Union
-from concurrent.futures import ThreadPoolExecutor
-from .utils import consolidate_dict, mount_base_pipeline
+from typing import TypeVar, Type, Union, AsyncIterator, Iterator, Iterable, Callable
+from concurrent.futures import (
+    Executor,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait as wait_futures,
+)
+from collections import Counter, deque
+from threading import Lock
+from .buffered_writer import AsyncBufferedWriter, BufferedWriter
+from .session import AsyncSession, Session
+from .utils import (
+    MAX_DOCS_PER_PAGE,
+    id_from_query,
+    consolidate_dict,
+    changed_fields,
+    without_none,
+    mount_base_pipeline,
+    hydrate_models,
+    _sort_depends_on_paths,
+)
 from ..services.verify_subclasses import is_subclass
-from asyncio import gather
+from ..services.index_manager import resolve_index_plan
+from ..services.reference_pipeline import (
+    POPULATE_STRATEGIES,
+    reference_pipeline_template,
+)
+from ..services.projection import partial_model, is_partial_model
+from ..services.hydration import construct_model
+from ..services.cache_backends import CacheBackend, MemoryCacheBackend
+from ..services.query_cache import pipeline_collections, version_key, query_cache_key
+from ..services.keyset import keyset_sort, keyset_match, decode_token, keyset_page
+from ..services.client_populate import (
+    reference_paths,
+    collect_reference_ids,
+    stitch_references,
+)
+from asyncio import (
+    gather,
+    wait,
+    create_task,
+    get_running_loop,
+    sleep,
+    Semaphore,
+    FIRST_COMPLETED,
+)
 from math import ceil
+from hashlib import sha1
 
 
 Model = TypeVar("Model", bound=DbModel)
+CLIENT_POPULATE_BATCH_SIZE = 100
+COUNT_STRATEGIES = ("exact", "facet", "estimated", "none", "cached")
+COUNT_CACHE_SIZE = 1024
 
 
 class _Engine:
@@ -30,9 +83,28 @@ class _Engine:
         _client (MongoClient): The MongoDB client.
         _db (Database): The database instance.
         _tz_info (timezone): The timezone information.
+        _populate_strategy (str): How references are populated, "unwind" or "array".
+        _trusted (bool): Whether documents read are built without validation by default.
+        _cache_backend (CacheBackend): The store of the counts of paginated finds
+            with `count="cached"` and of the results of the models that declare a
+            `_query_cache_ttl`.
+        _synced_indexes (dict[str, set[str]]): The names of the indexes already
+            synchronized by this engine, keyed by collection name.
+        _pending_invalidations (deque[Callable]): The cache invalidations that
+            failed and are retried before the caches are used again.
     """
 
-    def __init__(self, Client, mongo_uri, db_name, tz_info: timezone = None):
+    def __init__(
+        self,
+        Client,
+        mongo_uri,
+        db_name,
+        tz_info: timezone = None,
+        populate_strategy: str = "unwind",
+        trusted: bool = False,
+        count_cache_ttl: float = 60,
+        cache_backend: CacheBackend | None = None,
+    ):
         """
         Initialize the database engine.
 
@@ -41,10 +113,38 @@ class _Engine:
             mongo_uri (str): The MongoDB URI.
             db_name (str): The database name.
             tz_info (timezone, optional): The timezone information. Defaults to None.
+            populate_strategy (str, optional): How references are populated. "unwind"
+                resolves references inside lists of embedded models with $unwind and
+                $group; "array" keeps the arrays intact and stitches the populated
+                documents back with $map. Defaults to "unwind".
+            trusted (bool, optional): If True, documents read are built with the
+                construction plan of their model (see `construct_model`) instead of
+                being validated, unless a find call sets `trusted`. Defaults to False.
+            count_cache_ttl (float, optional): How many seconds a count is reused by
+                paginated finds with `count="cached"`. Defaults to 60.
+            cache_backend (CacheBackend, optional): The store of the counts reused
+                by paginated finds with `count="cached"` and of the query results
+                of the models that declare a `_query_cache_ttl`. Defaults to None
+                (an in-process `MemoryCacheBackend`).
         """
+        if populate_strategy not in POPULATE_STRATEGIES:
+            raise ValueError(
+                f"populate_strategy must be one of {list(POPULATE_STRATEGIES)}"
+            )
         self._client = Client(mongo_uri)
         self._db = self._client[db_name]
         self._tz_info = tz_info
+        self._populate_strategy = populate_strategy
+        self._trusted = trusted
+        self._count_cache_ttl = count_cache_ttl
+        self._cache_backend = (
+            MemoryCacheBackend(max_size=COUNT_CACHE_SIZE)
+            if cache_backend is None
+            else cache_backend
+        )
+        self._synced_indexes = {}
+        self._pending_invalidations = deque()
+        self._invalidations_lock = Lock()
 
     def _query(self, query: QueryOperator, raw_query: dict) -> dict:
         """
@@ -107,18 +207,74 @@ class _Engine:
 
         Returns:
             UpdateMany: The UpdateMany operation.
+
+        Description:
+            If the object has a snapshot of its stored state (see `_track_changes`),
+            only the changed paths are sent in `$set`/`$unset`, with references
+            embedded if `populate` is True. Otherwise the whole document is sent in
+            `$set`. Objects saved with a query are sent whole, unless they are
+            partial models (see `partial_model`): their fields that were not read
+            are None, so they are always saved from their snapshot and never sent
+            in `$setOnInsert` while None.
+
+        Raises:
+            ValueError: If the object is a partial model without a snapshot.
         """
         dct = consolidate_dict(obj=obj, dct={}, populate=populate)
         find_filter = query_dict or {"_id": ObjectId(dct.get("_id"))}
-        dct[obj.__class__.updated_at.field_alias] = now
+        created_at_alias = obj.__class__.created_at.field_alias
+        updated_at_alias = obj.__class__.updated_at.field_alias
+        dct[updated_at_alias] = now
         dct.pop("_id")
-        dct.pop(obj.__class__.created_at.field_alias)
-        to_save = {
-            "$set": dct,
-            "$setOnInsert": {obj.__class__.created_at.field_alias: now},
+        dct.pop(created_at_alias)
+        partial = is_partial_model(obj.__class__)
+        snapshot = obj._snapshot if not query_dict or partial else None
+        if snapshot is None:
+            if partial:
+                raise ValueError(
+                    "Partial models can only be saved after being read by the engines"
+                )
+            to_save = {
+                "$set": dct,
+                "$setOnInsert": {created_at_alias: now},
+            }
+            return UpdateMany(filter=find_filter, update=to_save, upsert=upsert)
+        snapshot = {
+            key: value
+            for key, value in snapshot.items()
+            if key not in ("_id", created_at_alias)
+        }
+        to_set, to_unset = changed_fields(old=snapshot, new=dct)
+        changed_roots = {path.split(".")[0] for path in [*to_set, *to_unset]}
+        set_on_insert = {
+            key: value for key, value in dct.items() if key not in changed_roots
         }
+        if partial:
+            set_on_insert = without_none(set_on_insert)
+        set_on_insert[created_at_alias] = now
+        to_save = {"$set": to_set, "$setOnInsert": set_on_insert}
+        if to_unset:
+            to_save["$unset"] = to_unset
         return UpdateMany(filter=find_filter, update=to_save, upsert=upsert)
 
+    def _insert_one_operation(self, obj: Type[Model], now, populate: bool):
+        """
+        Create an InsertOne operation for a new object, with an ObjectId assigned client-side.
+
+        Args:
+            obj (DbModel): The database model object without an id.
+            now (datetime): The current datetime.
+            populate (bool): Flag to indicate whether referenced objects are embedded.
+
+        Returns:
+            tuple: A tuple containing the InsertOne operation and the assigned ObjectId.
+        """
+        dct = consolidate_dict(obj=obj, dct={}, populate=populate)
+        dct["_id"] = ObjectId()
+        dct[obj.__class__.created_at.field_alias] = now
+        dct[obj.__class__.updated_at.field_alias] = now
+        return InsertOne(dct), dct["_id"]
+
     def _create_delete_operations_list(
         self, query: QueryOperator, raw_query: dict, delete_one: bool
     ):
@@ -145,6 +301,7 @@ class _Engine:
         raw_query: dict,
         upsert: bool,
         populate: bool,
+        insert_new: bool = False,
     ):
         """
         Create lists of indexes and save operations for bulk writes.
@@ -153,35 +310,133 @@ class _Engine:
             objs (list[DbModel]): The list of database model objects.
             query (QueryOperator): The query operator.
             raw_query (dict): The raw query dictionary.
+            insert_new (bool): If True, objects without an id are sent as InsertOne
+                operations with a client-side ObjectId instead of upserts.
 
         Returns:
-            tuple: A tuple containing indexes, operations, and the current datetime.
+            tuple: A tuple containing indexes, operations, the ObjectIds assigned to
+                inserted objects (keyed by collection and operation index) and the
+                current datetime.
         """
         operations = {}
         indexes = {}
+        inserted_ids = {}
         query = self._query(query=query, raw_query=raw_query)
         now = datetime.now(self._tz_info)
         now = now.replace(microsecond=int(now.microsecond / 1000) * 1000)
         for obj in objs:
             obj: Model
-            operation = self._update_many_operation(
-                obj=obj, query_dict=query, now=now, upsert=upsert, populate=populate
-            )
             collection_name = obj._collection
-            try:
-                operations[collection_name] += [operation]
-            except KeyError:
-                operations[collection_name] = [operation]
+            collection_operations = operations.setdefault(collection_name, [])
+            if insert_new and not query and obj.id is None:
+                operation, obj_id = self._insert_one_operation(
+                    obj=obj, now=now, populate=populate
+                )
+                inserted_ids.setdefault(collection_name, {})[
+                    len(collection_operations)
+                ] = obj_id
+            else:
+                operation = self._update_many_operation(
+                    obj=obj, query_dict=query, now=now, upsert=upsert, populate=populate
+                )
+            collection_operations.append(operation)
 
-            try:
-                obj_indexes = obj._indexes
-            except AttributeError:
-                obj_indexes = obj._init_indexes
-            indexes[collection_name] = obj_indexes
-        return indexes, operations, now
+            indexes[collection_name] = self._model_indexes(Model=obj)
+        return indexes, operations, inserted_ids, now
+
+    def _model_indexes(self, Model: Type[Model]) -> list[IndexModel]:
+        """
+        Get the indexes declared by a model class or instance.
+
+        Args:
+            Model (DbModel): The database model class or instance.
+
+        Returns:
+            list[IndexModel]: The custom `_indexes` if defined, otherwise the indexes
+                resolved from the model fields.
+        """
+        try:
+            return Model._indexes
+        except AttributeError:
+            return Model._init_indexes
+
+    def _pending_indexes(self, indexes: dict[str, list[IndexModel]]):
+        """
+        Filter out the indexes that were already synchronized by this engine.
+
+        Args:
+            indexes (dict[str, list[IndexModel]]): The indexes keyed by collection name.
+
+        Returns:
+            dict[str, list[IndexModel]]: Only the collections and indexes that still
+                need to be created.
+        """
+        pending = {}
+        for collection_name, index_list in indexes.items():
+            synced = self._synced_indexes.get(collection_name, set())
+            to_create = [
+                index for index in index_list if index.document["name"] not in synced
+            ]
+            if to_create:
+                pending[collection_name] = to_create
+        return pending
+
+    def _register_synced_indexes(
+        self, collection_name: str, index_list: list[IndexModel]
+    ):
+        """
+        Record indexes as synchronized so later saves skip creating them again.
+
+        Args:
+            collection_name (str): The name of the collection.
+            index_list (list[IndexModel]): The indexes created on the collection.
+        """
+        self._synced_indexes.setdefault(collection_name, set()).update(
+            index.document["name"] for index in index_list
+        )
+
+    def _indexes_from_models(self, models: list[Type[Model]]):
+        """
+        Group the indexes declared by a list of model classes by collection.
+
+        Args:
+            models (list[DbModel]): The database model classes.
+
+        Returns:
+            dict[str, list[IndexModel]]: The indexes keyed by collection name.
+        """
+        indexes = {}
+        for Model in models:
+            by_name = indexes.setdefault(Model._collection, {})
+            for index in self._model_indexes(Model=Model):
+                by_name[index.document["name"]] = index
+        return {
+            collection_name: list(by_name.values())
+            for collection_name, by_name in indexes.items()
+        }
+
+    def _plan_indexes_to_create(self, plan: IndexPlan, index_list: list[IndexModel]):
+        """
+        Select the declared indexes that a plan needs to create or rebuild.
+
+        Args:
+            plan (IndexPlan): The index plan of the collection.
+            index_list (list[IndexModel]): The indexes declared for the collection.
+
+        Returns:
+            list[IndexModel]: The indexes to be created.
+        """
+        names = plan.create + plan.rebuild
+        return [index for index in index_list if index.document["name"] in names]
 
     def _after_save(
-        self, result: BulkWriteResult, objs: list[Model], collection_name: str, now
+        self,
+        result: BulkWriteResult,
+        objs: list[Model],
+        collection_name: str,
+        now,
+        populate: bool,
+        inserted_ids: dict[int, ObjectId] | None = None,
     ):
         """
         Perform post-save operations.
@@ -191,14 +446,147 @@ class _Engine:
             objs (list[DbModel]): The list of database model objects.
             collection_name (str): The name of the collection.
             now (datetime): The current datetime.
+            populate (bool): Whether referenced objects were saved embedded. The
+                snapshot of tracked objects is taken the same way, so it matches the
+                stored document.
+            inserted_ids (dict[int, ObjectId], optional): The ObjectIds assigned to the
+                objects sent as InsertOne operations, keyed by operation index.
         """
         objs_from_collection = list(
             filter(lambda x: x._collection == collection_name, objs)
         )
-        for index, obj_id in result.upserted_ids.items():
+        self._invalidate_query_cache(collection_name=collection_name)
+        for obj in objs_from_collection:
+            if obj.id is not None:
+                self._invalidate_read_cache(Model=type(obj), ids=[obj.id])
+        upserted_ids = {**(inserted_ids or {}), **result.upserted_ids}
+        for index, obj_id in upserted_ids.items():
             objs_from_collection[index].id = Id(obj_id)
             objs_from_collection[index].created_at = now
             objs_from_collection[index].updated_at = now
+        for obj in objs_from_collection:
+            if obj._track_changes:
+                obj._snapshot = consolidate_dict(obj=obj, dct={}, populate=populate)
+
+    def _model_from_doc(
+        self,
+        Model: Type[Model],
+        doc: dict,
+        fields: list[DbField] | None = None,
+        trusted: bool | None = None,
+    ) -> Model:
+        """
+        Build a model instance from a document read from the database.
+
+        Args:
+            Model (DbModel): The database model class.
+            doc (dict): The document read from the database.
+            fields (list[DbField] | None): The fields projected in the document. If
+                given, the instance is built with the partial model of `Model`.
+            trusted (bool | None): If True, the instance is built without validation
+                by `construct_model`. None uses the default of the engine.
+
+        Returns:
+            DbModel: The model instance, with a snapshot of its stored state if the
+                model tracks changes.
+        """
+        if fields:
+            Model = partial_model(Model)
+        if self._trusted if trusted is None else trusted:
+            obj = construct_model(cls=Model, doc=doc)
+        else:
+            obj = Model(**doc)
+        if Model._track_changes:
+            obj._snapshot = consolidate_dict(obj=obj, dct={}, populate=False)
+        return obj
+
+    def _models_from_docs(
+        self,
+        Model: Type[Model],
+        docs: list[dict],
+        fields: list[DbField] | None = None,
+        trusted: bool | None = None,
+    ) -> list[Model]:
+        """
+        Build the model instances of a batch of documents read from the database.
+
+        Args:
+            Model (DbModel): The database model class.
+            docs (list[dict]): The documents read from the database.
+            fields (list[DbField] | None): The fields projected in the documents. If
+                given, the instances are built with the partial model of `Model`.
+            trusted (bool | None): If True, the instances are built without validation
+                by `construct_model`. None uses the default of the engine.
+
+        Returns:
+            list[DbModel]: The model instances, validated in a single call with the
+                cached `TypeAdapter(list[Model])` unless trusted.
+        """
+        return hydrate_models(
+            Model=Model,
+            docs=docs,
+            partial=bool(fields),
+            trusted=self._trusted if trusted is None else trusted,
+        )
+
+    def _chunks(self, objs: Iterable[Model], chunk_size: int):
+        """
+        Split an iterable of objects into lists of at most `chunk_size` objects.
+
+        Args:
+            objs (Iterable[DbModel]): The objects, possibly produced by a generator.
+            chunk_size (int): The maximum number of objects per chunk.
+
+        Yields:
+            list[DbModel]: The chunks of objects, in order.
+        """
+        chunk = []
+        for obj in objs:
+            chunk.append(obj)
+            if len(chunk) >= chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+    def _merge_db_responses(
+        self, responses: list[tuple[Counter, dict[str, DbResponse]]]
+    ) -> dict[str, DbResponse]:
+        """
+        Aggregate the responses of chunked saves into one response per collection.
+
+        Args:
+            responses (list[tuple[Counter, dict[str, DbResponse]]]): For each chunk, in
+                order, the number of objects per collection and the save response.
+
+        Returns:
+            dict[str, DbResponse]: The summed responses, with the upserted ids indexed
+                by the position of the object among all the objects of the collection.
+        """
+        merged = {}
+        offsets = Counter()
+        for counts, response in responses:
+            for collection_name, db_response in response.items():
+                offset = offsets[collection_name]
+                upserted_ids = {
+                    index + offset: obj_id
+                    for index, obj_id in db_response.upserted_ids.items()
+                }
+                current = merged.get(collection_name)
+                if current is None:
+                    merged[collection_name] = db_response.model_copy(
+                        update={"upserted_ids": upserted_ids}
+                    )
+                    continue
+                current.acknowledged = current.acknowledged and db_response.acknowledged
+                current.deleted_count += db_response.deleted_count
+                current.inserted_count += db_response.inserted_count
+                current.matched_count += db_response.matched_count
+                current.modified_count += db_response.modified_count
+                current.upserted_count += db_response.upserted_count
+                current.upserted_ids.update(upserted_ids)
+            offsets.update(counts)
+        return merged
 
     def _db_response(self, result: BulkWriteResult):
         """
@@ -225,6 +613,7 @@ class _Engine:
         Model: Type[Model],
         pipeline,
         tz_info: timezone,
+        batch_size: int | None = None,
     ):
         """
         Create an aggregation cursor with the specified pipeline and timezone information.
@@ -233,16 +622,318 @@ class _Engine:
             Model (DbModel): The database model class.
             pipeline (list): The aggregation pipeline.
             tz_info (timezone): The timezone information.
+            batch_size (int, optional): The number of documents returned by the server
+                in each cursor batch. Defaults to the server's default.
 
         Returns:
             CommandCursor: The aggregation cursor.
         """
+        collection = self._db[Model._collection].with_options(
+            codec_options=self._codec_options(tz_info=tz_info)
+        )
+        kwargs = {"batchSize": batch_size} if batch_size else {}
+        return collection.aggregate(pipeline, **kwargs)
+
+    def _codec_options(self, tz_info: timezone) -> CodecOptions:
+        """
+        Build the codec options used to decode the documents read.
+
+        Args:
+            tz_info (timezone): The timezone information.
+
+        Returns:
+            CodecOptions: The codec options, timezone aware if there is a timezone.
+        """
         tz_info = self._set_tz_info(tz_info=tz_info)
         tz_aware = True if tz_info else False
-        collection = self._db[Model._collection].with_options(
-            codec_options=CodecOptions(tz_aware=tz_aware, tzinfo=tz_info)
+        return CodecOptions(tz_aware=tz_aware, tzinfo=tz_info)
+
+    def _apply_pending_invalidations(self) -> bool:
+        """
+        Retry the cache invalidations that failed, in the order they were requested.
+
+        Returns:
+            bool: True if no invalidation is pending anymore.
+        """
+        with self._invalidations_lock:
+            while self._pending_invalidations:
+                try:
+                    self._pending_invalidations[0]()
+                except Exception:
+                    return False
+                self._pending_invalidations.popleft()
+        return True
+
+    def _invalidate_cache(self, invalidation: Callable):
+        """
+        Invalidate cache entries after a write, without failing the write.
+
+        Args:
+            invalidation (Callable): The function that removes the entries.
+
+        Description:
+            If the cache backend fails, for example with a locked SQLite database,
+            the invalidation is kept and retried before the caches are used again,
+            and the caches are bypassed until it succeeds.
+        """
+        self._pending_invalidations.append(invalidation)
+        self._apply_pending_invalidations()
+
+    def _cache_call(self, operation: Callable):
+        """
+        Read from or write to a cache, degrading to a miss if the cache fails.
+
+        Args:
+            operation (Callable): The function that reads or writes the cache.
+
+        Returns:
+            The result of the operation, or None if the backend raised an error or
+            a failed invalidation is still pending.
+        """
+        if not self._apply_pending_invalidations():
+            return None
+        try:
+            return operation()
+        except Exception:
+            return None
+
+    def _read_cache_key(
+        self,
+        Model: Type[Model],
+        query: QueryOperator,
+        raw_query: dict,
+        populate: bool | str,
+        pipeline: list | None,
+        fields: list[DbField] | None,
+    ) -> str | None:
+        """
+        Build the read cache key of a `find_one`, if the read cache can answer it.
+
+        Args:
+            Model (DbModel): The database model class.
+            query (QueryOperator): The query operator.
+            raw_query (dict): The raw query dictionary.
+            populate (bool | str): The populate argument of the find.
+            pipeline (list | None): The custom pipeline of the find.
+            fields (list[DbField] | None): The projected fields of the find.
+
+        Returns:
+            str | None: The collection name, the id and the current version of the
+                id in the read cache, or None if the model has no read cache or the
+                find is not a plain lookup by id.
+
+        Description:
+            The version is read before the document, so a write that invalidates
+            the id while the document is being read leaves it stored under a
+            version that is no longer current.
+        """
+        if Model._read_cache is None or populate or pipeline or Model._pipeline:
+            return None
+        if fields:
+            return None
+        _id = id_from_query(self._query(query=query, raw_query=raw_query))
+        if _id is None:
+            return None
+        return self._cache_call(
+            lambda: Model._read_cache.versioned_key(f"{Model._collection}/{_id}")
+        )
+
+    def _read_cached(self, Model: Type[Model], key: str, tz_info: timezone):
+        """
+        Read a document from the read cache of a model.
+
+        Args:
+            Model (DbModel): The database model class.
+            key (str): The key built by `_read_cache_key`.
+            tz_info (timezone): The timezone information.
+
+        Returns:
+            dict | None: A new copy of the cached document, or None on a miss.
+        """
+        codec_options = self._codec_options(tz_info=tz_info)
+        return self._cache_call(
+            lambda: Model._read_cache.get(key, codec_options=codec_options)
+        )
+
+    def _store_read_cache(self, Model: Type[Model], key: str | None, docs: list[dict]):
+        """
+        Store the document read by a `find_one` in the read cache of a model.
+
+        Args:
+            Model (DbModel): The database model class.
+            key (str | None): The key built by `_read_cache_key`, or None.
+            docs (list[dict]): The documents read, before they are hydrated.
+        """
+        if key is not None and docs:
+            self._cache_call(lambda: Model._read_cache.set(key, docs[0]))
+
+    def _invalidate_read_cache(self, Model: Type[Model], ids: list | None = None):
+        """
+        Invalidate the read cache of a model after a write.
+
+        Args:
+            Model (DbModel): The database model class.
+            ids (list | None): The ids of the written documents, or None if they are
+                not known, in which case the whole cache is cleared.
+        """
+        read_cache = getattr(Model, "_read_cache", None)
+        if read_cache is None:
+            return
+        if ids is None:
+            prefix = f"{Model._collection}/"
+            self._invalidate_cache(lambda: read_cache.clear(prefix=prefix))
+        else:
+            keys = [f"{Model._collection}/{_id}" for _id in ids]
+            self._invalidate_cache(lambda: read_cache.delete(keys))
+
+    def _query_cache_key(
+        self, Model: Type[Model], pipeline: list, tz_info: timezone
+    ) -> str | None:
+        """
+        Build the key of the result of an aggregation in the cache backend.
+
+        Args:
+            Model (DbModel): The database model class.
+            pipeline (list): The final aggregation pipeline.
+            tz_info (timezone): The timezone information.
+
+        Returns:
+            str | None: The key built by `query_cache_key` with the current versions
+                of the collections read by the pipeline, or None if the model does
+                not declare a `_query_cache_ttl`.
+
+        Description:
+            A collection that has no version yet, because it was never read through
+            the cache or was written since, gets a new random one. The versions are
+            read before the aggregation runs, so a write that happens meanwhile
+            always leaves the result stored under a version that is no longer
+            current.
+        """
+        if Model._query_cache_ttl is None:
+            return None
+        keys = [
+            version_key(collection)
+            for collection in pipeline_collections(Model._collection, pipeline)
+        ]
+
+        def _versions():
+            versions = self._cache_backend.get_many(keys)
+            for key in keys:
+                if key not in versions:
+                    versions[key] = {"v": ObjectId()}
+                    self._cache_backend.set(key, versions[key])
+            return versions
+
+        versions = self._cache_call(_versions)
+        if versions is None:
+            return None
+        return query_cache_key(
+            collection=Model._collection,
+            pipeline=pipeline,
+            codec_options=self._codec_options(tz_info=tz_info),
+            versions=[versions[key]["v"] for key in keys],
+        )
+
+    def _query_cached(self, key: str, tz_info: timezone) -> list[dict] | None:
+        """
+        Read the result of an aggregation from the cache backend.
+
+        Args:
+            key (str): The key built by `_query_cache_key`.
+            tz_info (timezone): The timezone information.
+
+        Returns:
+            list[dict] | None: New copies of the cached documents, or None on a miss.
+        """
+        codec_options = self._codec_options(tz_info=tz_info)
+        cached = self._cache_call(
+            lambda: self._cache_backend.get(key, codec_options=codec_options)
+        )
+        return None if cached is None else cached["docs"]
+
+    def _store_query_cache(self, Model: Type[Model], key: str | None, docs: list):
+        """
+        Store the result of an aggregation for the `_query_cache_ttl` of the model.
+
+        Args:
+            Model (DbModel): The database model class.
+            key (str | None): The key built by `_query_cache_key`, or None.
+            docs (list[dict]): The documents read, before they are hydrated.
+        """
+        if key is not None:
+            self._cache_call(
+                lambda: self._cache_backend.set(
+                    key, {"docs": docs}, ttl=Model._query_cache_ttl
+                )
+            )
+
+    def _invalidate_query_cache(self, collection_name: str):
+        """
+        Invalidate the cached query results that read a collection, after a write.
+
+        Args:
+            collection_name (str): The name of the written collection.
+        """
+        keys = [version_key(collection_name)]
+        self._invalidate_cache(lambda: self._cache_backend.delete(keys))
+
+    def _count_cache_key(self, Model: Type[Model], query: dict) -> str:
+        """
+        Build the key of a count in the cache backend.
+
+        Args:
+            Model (DbModel): The database model class.
+            query (dict): The query dictionary.
+
+        Returns:
+            str: The collection name and a hash of the BSON encoding of the query.
+        """
+        query_hash = sha1(bson_encode(query)).hexdigest()
+        return f"count/{Model._collection}/{query_hash}"
+
+    def _cached_count(self, key: str) -> int | None:
+        """
+        Read a count from the cache backend.
+
+        Args:
+            key (str): The key of the count, as returned by `_count_cache_key`.
+
+        Returns:
+            int | None: The count, or None if it is not cached or has expired.
+        """
+        cached = self._cache_call(lambda: self._cache_backend.get(key))
+        return None if cached is None else cached["count"]
+
+    def _cache_count(self, key: str, count: int):
+        """
+        Store a count in the cache backend for `count_cache_ttl` seconds.
+
+        Args:
+            key (str): The key of the count, as returned by `_count_cache_key`.
+            count (int): The number of documents matched.
+        """
+        self._cache_call(
+            lambda: self._cache_backend.set(
+                key, {"count": count}, ttl=self._count_cache_ttl
+            )
         )
-        return collection.aggregate(pipeline)
+
+    def _facet_result(self, docs: list[dict]) -> tuple[list[dict], int]:
+        """
+        Unpack the result of a paginated aggregation counted with `$facet`.
+
+        Args:
+            docs (list[dict]): The documents returned by the aggregation, a single
+                document with the `docs` and `total` facets.
+
+        Returns:
+            tuple[list[dict], int]: The documents of the page and the number of
+                documents matched.
+        """
+        if not docs:
+            return [], 0
+        total = docs[0]["total"]
+        return docs[0]["docs"], total[0]["count"] if total else 0
 
     def _aggregate_pipeline(
         self,
@@ -258,6 +949,10 @@ class _Engine:
         current_page: int,
         docs_per_page: int,
         no_paginate_limit: int | None,
+        fields: list[DbField] | None = None,
+        after: str | None = None,
+        before: str | None = None,
+        count: str = "exact",
     ) -> dict:
         """
         Construct an aggregation pipeline.
@@ -268,25 +963,73 @@ class _Engine:
             raw_query (dict): The raw query dictionary.
             sort (SortOperator): The sort operator.
             raw_sort (dict): The raw sort dictionary.
-            populate (bool): Flag to indicate whether to populate related documents.
+            populate (bool | str): Flag to indicate whether to populate related documents
+                in the pipeline. "client" populates them after the query instead, so
+                the documents cannot be sorted by a populated field.
+            paginate (bool | str): Flag to indicate whether to paginate with `$skip`.
+                "keyset" reads `docs_per_page + 1` documents after or before a token
+                instead, sorted by the sort keys and `_id`.
+            after (str | None): The token of the document after which to read, when
+                paginating by keyset.
+            before (str | None): The token of the document before which to read, when
+                paginating by keyset.
+            count (str): How the documents are counted when paginating with `$skip`
+                (see `COUNT_STRATEGIES`). "facet" reads the page and the total in a
+                single `$facet`; "none" reads one more document than the page
+                instead of counting.
 
         Returns:
             tuple: A tuple containing the pipeline, query, and sort dictionaries.
+
+        Raises:
+            ValueError: If `populate` is "client" and a sort key reads a populated
+                field.
         """
+        if isinstance(populate, str) and populate != "client":
+            raise ValueError('populate must be a bool or "client"')
+        if isinstance(paginate, str) and paginate != "keyset":
+            raise ValueError('paginate must be a bool or "keyset"')
+        if count not in COUNT_STRATEGIES:
+            raise ValueError(f"count must be one of {list(COUNT_STRATEGIES)}")
         query = self._query(query=query, raw_query=raw_query)
         sort = self._sort(sort=sort, raw_sort=raw_sort)
+        if populate == "client" and sort:
+            _, populated_paths = reference_pipeline_template(
+                cls=Model,
+                populate_db_fields=populate_db_fields,
+                populate_strategy=self._populate_strategy,
+            )
+            if _sort_depends_on_paths(sort=sort, paths=populated_paths):
+                raise ValueError(
+                    "Client-side populate cannot sort by a populated field"
+                )
+        keyset = paginate == "keyset"
+        if keyset:
+            if after and before:
+                raise ValueError("after and before cannot be used together")
+            sort = keyset_sort(sort=sort, reverse=bool(before))
+            if after or before:
+                match = keyset_match(sort=sort, values=decode_token(after or before))
+                query = {"$and": [query, match]} if query else match
+            paginate = False
+            no_paginate_limit = docs_per_page + 1
         return (
             mount_base_pipeline(
                 Model=Model,
                 query=query,
                 sort=sort,
-                populate=populate,
+                populate=populate is True,
                 pipeline=pipeline,
                 populate_db_fields=populate_db_fields,
                 paginate=paginate,
                 current_page=current_page,
                 docs_per_page=docs_per_page,
                 no_paginate_limit=no_paginate_limit,
+                populate_strategy=self._populate_strategy,
+                fields=fields,
+                keyset=keyset,
+                facet=paginate is True and count == "facet",
+                read_ahead=paginate is True and count == "none",
             ),
             query,
             sort,
@@ -298,7 +1041,18 @@ class AsyncDbEngine(_Engine):
     Asynchronous database engine class that extends the base engine to provide asynchronous operations.
     """
 
-    def __init__(self, mongo_uri, db_name, tz_info: timezone = None):
+    def __init__(
+        self,
+        mongo_uri,
+        db_name,
+        tz_info: timezone = None,
+        populate_strategy: str = "unwind",
+        trusted: bool = False,
+        count_cache_ttl: float = 60,
+        cache_backend: CacheBackend | None = None,
+        hydration_executor: Executor | None = None,
+        hydration_chunk_size: int | None = None,
+    ):
         """
         Initialize the asynchronous database engine.
 
@@ -306,41 +1060,376 @@ class AsyncDbEngine(_Engine):
             mongo_uri (str): The MongoDB URI.
             db_name (str): The database name.
             tz_info (timezone, optional): The timezone information. Defaults to None.
+            populate_strategy (str, optional): How references are populated, "unwind"
+                or "array". Defaults to "unwind".
+            trusted (bool, optional): If True, documents read are built without
+                validation by default. Defaults to False.
+            count_cache_ttl (float, optional): How many seconds a count is reused by
+                paginated finds with `count="cached"`. Defaults to 60.
+            cache_backend (CacheBackend, optional): The store of the counts reused
+                by paginated finds with `count="cached"` and of the query results
+                of the models that declare a `_query_cache_ttl`. Defaults to None
+                (an in-process `MemoryCacheBackend`).
+            hydration_executor (Executor, optional): The executor in which documents
+                read are built into model instances, off the event loop thread. A
+                ThreadPoolExecutor works with any model; a ProcessPoolExecutor needs
+                models importable by the worker processes and builds projected
+                reads on the event loop. Defaults to None (event loop thread).
+            hydration_chunk_size (int, optional): If given, documents are built in
+                chunks of this size. Without an executor, the engine yields to the
+                event loop between chunks; with one, the chunks are built
+                concurrently. Defaults to None (a single chunk).
         """
+        if hydration_chunk_size is not None and hydration_chunk_size < 1:
+            raise ValueError("hydration_chunk_size must be a positive integer")
         super().__init__(
             Client=AsyncIOMotorClient,
             mongo_uri=mongo_uri,
             db_name=db_name,
             tz_info=tz_info,
+            populate_strategy=populate_strategy,
+            trusted=trusted,
+            count_cache_ttl=count_cache_ttl,
+            cache_backend=cache_backend,
         )
+        self._hydration_executor = hydration_executor
+        self._hydration_chunk_size = hydration_chunk_size
+
+    async def _hydrate(
+        self,
+        Model: Type[Model],
+        docs: list[dict],
+        fields: list[DbField] | None = None,
+        trusted: bool | None = None,
+    ) -> list[Model]:
+        """
+        Asynchronously build the model instances of documents read from the database.
+
+        Args:
+            Model (DbModel): The database model class.
+            docs (list[dict]): The documents read from the database.
+            fields (list[DbField] | None): The fields projected in the documents.
+            trusted (bool | None): If True, the instances are built without
+                validation. None uses the default of the engine.
+
+        Returns:
+            list[DbModel]: The model instances, in the order of the documents.
+
+        Description:
+            The documents are split in chunks of `hydration_chunk_size` and built by
+            `hydrate_models`, in the hydration executor if the engine has one, or on
+            the event loop thread yielding to other tasks between chunks.
+        """
+        if not docs:
+            return []
+        partial = bool(fields)
+        trusted = self._trusted if trusted is None else trusted
+        chunk_size = self._hydration_chunk_size or len(docs)
+        chunks = [docs[i : i + chunk_size] for i in range(0, len(docs), chunk_size)]
+        executor = self._hydration_executor
+        if executor is not None and not (
+            partial and isinstance(executor, ProcessPoolExecutor)
+        ):
+            loop = get_running_loop()
+            results = await gather(
+                *[
+                    loop.run_in_executor(
+                        executor, hydrate_models, Model, chunk, partial, trusted
+                    )
+                    for chunk in chunks
+                ]
+            )
+        else:
+            results = []
+            for chunk in chunks:
+                if results:
+                    await sleep(0)
+                results.append(
+                    hydrate_models(
+                        Model=Model, docs=chunk, partial=partial, trusted=trusted
+                    )
+                )
+        return [obj for objs in results for obj in objs]
+
+    async def _aggregate_docs(
+        self, Model: Type[Model], pipeline: list, tz_info: timezone
+    ) -> list[dict]:
+        """
+        Read the documents of an aggregation, through the query cache of the model.
+
+        Args:
+            Model (DbModel): The database model class.
+            pipeline (list): The final aggregation pipeline.
+            tz_info (timezone): The timezone information.
+
+        Returns:
+            list[dict]: The documents read from the database or, if the model
+                declares a `_query_cache_ttl`, from the cache backend.
+        """
+        key = self._query_cache_key(Model=Model, pipeline=pipeline, tz_info=tz_info)
+        docs = self._query_cached(key=key, tz_info=tz_info) if key else None
+        if docs is not None:
+            return docs
+        cursor = self._aggregate_cursor(Model=Model, pipeline=pipeline, tz_info=tz_info)
+        docs = await cursor.to_list(length=None)
+        self._store_query_cache(Model=Model, key=key, docs=docs)
+        return docs
+
+    async def sync_indexes(self, models: list[Type[Model]]) -> dict[str, list[str]]:
+        """
+        Create the indexes declared by the given models, typically once at startup.
+
+        Indexes already synchronized by this engine are skipped, and the collections
+        synchronized here are not touched again by later saves.
+
+        Args:
+            models (list[DbModel]): The database model classes.
+
+        Returns:
+            dict[str, list[str]]: The names of the created indexes keyed by collection name.
+        """
+        created = {}
+        indexes = self._indexes_from_models(models=models)
+        for collection_name, index_list in self._pending_indexes(indexes).items():
+            created[collection_name] = await self._db[collection_name].create_indexes(
+                index_list
+            )
+            self._register_synced_indexes(collection_name, index_list)
+        return created
+
+    async def reconcile_indexes(
+        self,
+        models: list[Type[Model]],
+        dry_run: bool = False,
+        drop_unknown: bool = False,
+    ) -> dict[str, IndexPlan]:
+        """
+        Converge the indexes of the models collections with the declared indexes.
+
+        The existing indexes of each collection are read with `list_indexes()` and
+        diffed against the models `_indexes`/`_init_indexes`. Only missing indexes are
+        created, indexes whose keys or options changed are rebuilt and, optionally,
+        indexes no longer declared are dropped.
+
+        Args:
+            models (list[DbModel]): The database model classes.
+            dry_run (bool, optional): If True, only computes the plans. Defaults to False.
+            drop_unknown (bool, optional): If True, drops the existing indexes that are
+                not declared by any model of the collection, including indexes
+                created by hand or by other applications. Defaults to False.
+
+        Returns:
+            dict[str, IndexPlan]: The index plan of each collection.
+        """
+        plans = {}
+        indexes = self._indexes_from_models(models=models)
+        for collection_name, index_list in indexes.items():
+            collection = self._db[collection_name]
+            existing = await collection.list_indexes().to_list(length=None)
+            plan = resolve_index_plan(
+                collection_name=collection_name,
+                declared=index_list,
+                existing=existing,
+                drop_unknown=drop_unknown,
+            )
+            plans[collection_name] = plan
+            if dry_run:
+                continue
+            for name in plan.drop + plan.rebuild:
+                await collection.drop_index(name)
+            to_create = self._plan_indexes_to_create(plan=plan, index_list=index_list)
+            if to_create:
+                await collection.create_indexes(to_create)
+            self._register_synced_indexes(collection_name, index_list)
+            plan.applied = True
+        return plans
 
     async def save_all(
         self,
-        obj_list: list[Model],
+        obj_list: Iterable[Model],
         populate: bool = False,
+        insert_new: bool = False,
+        ordered: bool = True,
+        max_concurrency: int | None = None,
+        chunk_size: int | None = None,
+        max_in_flight: int = 2,
     ) -> dict[str, DbResponse]:
         """
         Save a list of objects to the database.
 
+        The bulk writes of different collections run concurrently, so the latency of
+        a mixed-collection save is close to the slowest collection rather than the
+        sum of all of them.
+
+        Args:
+            obj_list (Iterable[DbModel]): The database model objects. When `chunk_size`
+                is set, any iterable (e.g. a generator) is accepted.
+            populate (bool, optional): If True, referenced objects are saved embedded
+                instead of by id. Defaults to False.
+            insert_new (bool, optional): If True, objects without an id get an ObjectId
+                assigned client-side and are sent as pure inserts, skipping the upsert
+                lookup on the server. Inserted objects are counted in `inserted_count`
+                instead of `upserted_count`. Defaults to False.
+            ordered (bool, optional): If False, the server may apply the operations of
+                each collection in any order and keeps going after an error. With
+                `chunk_size`, True also writes the chunks one after another, so that
+                they are applied in order and no chunk is written after one fails.
+                Defaults to True.
+            max_concurrency (int, optional): The maximum number of collections written
+                at the same time. Defaults to None (all collections at once).
+            chunk_size (int, optional): If set, the objects are serialized and written
+                in chunks of at most this many objects, keeping memory bounded for very
+                large imports. Defaults to None (a single batch).
+            max_in_flight (int, optional): The maximum number of chunks being written
+                at the same time when `chunk_size` is set and `ordered` is False.
+                Defaults to 2.
+
+        Returns:
+            dict[str, DbResponse]: The response of each collection. With `chunk_size`,
+                the responses of all the chunks are summed.
+        """
+        if not chunk_size:
+            return await self._save_chunk(
+                obj_list=obj_list,
+                populate=populate,
+                insert_new=insert_new,
+                ordered=ordered,
+                max_concurrency=max_concurrency,
+            )
+
+        async def _save_one_chunk(chunk: list[Model]):
+            response = await self._save_chunk(
+                obj_list=chunk,
+                populate=populate,
+                insert_new=insert_new,
+                ordered=ordered,
+                max_concurrency=max_concurrency,
+            )
+            return Counter(obj._collection for obj in chunk), response
+
+        if ordered:
+            max_in_flight = 1
+        tasks = []
+        try:
+            for chunk in self._chunks(objs=obj_list, chunk_size=chunk_size):
+                in_flight = [task for task in tasks if not task.done()]
+                if len(in_flight) >= max_in_flight:
+                    done, _ = await wait(in_flight, return_when=FIRST_COMPLETED)
+                    for task in done:
+                        task.result()
+                tasks.append(create_task(_save_one_chunk(chunk)))
+            responses = await gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+        return self._merge_db_responses(responses=responses)
+
+    async def _save_chunk(
+        self,
+        obj_list: list[Model],
+        populate: bool,
+        insert_new: bool,
+        ordered: bool,
+        max_concurrency: int | None,
+    ) -> dict[str, DbResponse]:
+        """
+        Save a batch of objects with one bulk write per collection.
+
         Args:
             obj_list (list[DbModel]): The list of database model objects.
+            populate (bool): If True, referenced objects are saved embedded.
+            insert_new (bool): If True, new objects are sent as pure inserts.
+            ordered (bool): Whether the bulk writes are ordered.
+            max_concurrency (int | None): The maximum number of collections written at
+                the same time.
+
+        Returns:
+            dict[str, DbResponse]: The response of each collection.
         """
-        response = {}
-        indexes, operations, now = self._create_save_operations_list(
-            objs=obj_list, query=None, raw_query=None, upsert=True, populate=populate
+        indexes, operations, inserted_ids, now = self._create_save_operations_list(
+            objs=obj_list,
+            query=None,
+            raw_query=None,
+            upsert=True,
+            populate=populate,
+            insert_new=insert_new,
         )
-        for collection_name, index_list in indexes.items():
-            if index_list:
-                await self._db[collection_name].create_indexes(index_list)
-        for collection_name, operation_list in operations.items():
-            result: BulkWriteResult = await self._db[collection_name].bulk_write(
-                operation_list
-            )
+        pending_indexes = self._pending_indexes(indexes)
+        await gather(
+            *[
+                self._db[collection_name].create_indexes(index_list)
+                for collection_name, index_list in pending_indexes.items()
+            ]
+        )
+        for collection_name, index_list in pending_indexes.items():
+            self._register_synced_indexes(collection_name, index_list)
+        semaphore = Semaphore(max_concurrency or max(len(operations), 1))
+
+        async def _bulk_write(collection_name: str, operation_list: list):
+            async with semaphore:
+                result: BulkWriteResult = await self._db[collection_name].bulk_write(
+                    operation_list, ordered=ordered
+                )
             self._after_save(
-                result=result, objs=obj_list, collection_name=collection_name, now=now
+                result=result,
+                objs=obj_list,
+                collection_name=collection_name,
+                now=now,
+                populate=populate,
+                inserted_ids=inserted_ids.get(collection_name),
             )
-            response[collection_name] = self._db_response(result=result)
-        return response
+            return collection_name, self._db_response(result=result)
+
+        responses = await gather(
+            *[
+                _bulk_write(collection_name, operation_list)
+                for collection_name, operation_list in operations.items()
+            ]
+        )
+        return dict(responses)
+
+    def buffered_writer(
+        self,
+        max_operations: int = 1000,
+        flush_interval_ms: int = 1000,
+        populate: bool = False,
+    ) -> AsyncBufferedWriter:
+        """
+        Create a write-behind buffer that batches saves per collection.
+
+        Args:
+            max_operations (int, optional): The number of pending objects of a
+                collection that triggers a flush of that collection. Defaults to 1000.
+            flush_interval_ms (int, optional): The maximum time, in milliseconds, an
+                object waits in the buffer before being written. Defaults to 1000.
+            populate (bool, optional): If True, referenced objects are saved embedded
+                instead of by id. Defaults to False.
+
+        Returns:
+            AsyncBufferedWriter: The buffered writer. Use it as a context manager so pending
+                objects are flushed on exit.
+        """
+        return AsyncBufferedWriter(
+            engine=self,
+            max_operations=max_operations,
+            flush_interval_ms=flush_interval_ms,
+            populate=populate,
+        )
+
+    def session(self, populate: bool = False) -> AsyncSession:
+        """
+        Create a session with an identity map and a unit of work.
+
+        Args:
+            populate (bool, optional): If True, referenced objects are saved embedded
+                instead of by id when the session is flushed. Defaults to False.
+
+        Returns:
+            AsyncSession: The session. Use it as a context manager (`async with`) so the objects
+                added to it are saved, one bulk write per collection, on exit.
+        """
+        return AsyncSession(engine=self, populate=populate)
 
     async def save(
         self,
@@ -361,7 +1450,7 @@ class AsyncDbEngine(_Engine):
         Returns:
             DbResponse: The database response object.
         """
-        indexes, operations, now = self._create_save_operations_list(
+        indexes, operations, _, now = self._create_save_operations_list(
             objs=[obj],
             query=query,
             raw_query=raw_query,
@@ -369,17 +1458,88 @@ class AsyncDbEngine(_Engine):
             populate=populate,
         )
         collection_name = obj._collection
-        index_list = indexes[collection_name]
-        if index_list:
+        for index_list in self._pending_indexes(indexes).values():
             await self._db[collection_name].create_indexes(index_list)
+            self._register_synced_indexes(collection_name, index_list)
         operation_list = operations[collection_name]
         result: BulkWriteResult = await self._db[collection_name].bulk_write(
             operation_list
         )
-        self._after_save(
-            result=result, objs=[obj], collection_name=collection_name, now=now
+        self._after_save(
+            result=result,
+            objs=[obj],
+            collection_name=collection_name,
+            now=now,
+            populate=populate,
+        )
+        if query or raw_query:
+            self._invalidate_read_cache(Model=type(obj))
+        return self._db_response(result=result)
+
+    async def _populate_client(
+        self,
+        Model: Type[Model],
+        docs: list[dict],
+        populate_db_fields: list[DbField] | None,
+        tz_info: timezone,
+    ) -> list[dict]:
+        """
+        Populate the references of raw documents with one `$in` query per referenced
+        model, run concurrently. Referenced documents are populated recursively.
+
+        Args:
+            Model (DbModel): The database model class of the documents.
+            docs (list[dict]): The raw documents, modified in place.
+            populate_db_fields (list[DbField] | None): The DbFields to populate.
+            tz_info (timezone): The timezone information.
+
+        Returns:
+            list[dict]: The populated documents.
+        """
+        paths = reference_paths(cls=Model, populate_db_fields=populate_db_fields)
+
+        async def _fetch(RefModel, ids):
+            cursor = self._aggregate_cursor(
+                Model=RefModel,
+                pipeline=[{"$match": {"_id": {"$in": ids}}}],
+                tz_info=tz_info,
+            )
+            ref_docs = await cursor.to_list(length=None)
+            await self._populate_client(
+                Model=RefModel,
+                docs=ref_docs,
+                populate_db_fields=populate_db_fields,
+                tz_info=tz_info,
+            )
+            return RefModel, {doc["_id"]: doc for doc in ref_docs}
+
+        ids_by_model = collect_reference_ids(docs=docs, paths=paths)
+        found = await gather(
+            *[_fetch(RefModel, ids) for RefModel, ids in ids_by_model.items()]
+        )
+        return stitch_references(docs=docs, paths=paths, found=dict(found))
+
+    async def _client_populated_result(
+        self,
+        Model: Type[Model],
+        docs: list[dict],
+        populate_db_fields: list[DbField] | None,
+        as_dict: bool,
+        tz_info: timezone,
+        fields: list[DbField] | None = None,
+        trusted: bool | None = None,
+    ) -> list:
+        docs = await self._populate_client(
+            Model=Model,
+            docs=docs,
+            populate_db_fields=populate_db_fields,
+            tz_info=tz_info,
+        )
+        if as_dict:
+            return docs
+        return await self._hydrate(
+            Model=Model, docs=docs, fields=fields, trusted=trusted
         )
-        return self._db_response(result=result)
 
     async def find_one(
         self,
@@ -388,17 +1548,21 @@ class AsyncDbEngine(_Engine):
         raw_query: dict = None,
         sort: SortOperator = None,
         raw_sort: dict = None,
-        populate: bool = False,
+        populate: bool | str = False,
         pipeline: list = None,
         populate_db_fields: list[DbField] | None = None,
         as_dict: bool = False,
         tz_info: timezone = None,
+        fields: list[DbField] | None = None,
+        trusted: bool | None = None,
     ) -> Model:
         """
         Asynchronously finds a single document in the database that matches the query criteria.
 
         This method constructs and executes an aggregation pipeline to find one document.
         It supports complex queries, sorting, and populating referenced fields.
+        If the model declares a `_read_cache`, queries by id only, without populate,
+        projection or custom pipeline, are answered from it when possible.
 
         Args:
             Model: The DbModel class to perform the query on.
@@ -406,16 +1570,42 @@ class AsyncDbEngine(_Engine):
             raw_query: A raw dictionary for MongoDB query. Defaults to None.
             sort: A SortOperator for sorting the result. Defaults to None.
             raw_sort: A raw dictionary for MongoDB sorting. Defaults to None.
-            populate: If True, populates referenced documents. Defaults to False.
+            populate: If True, populates referenced documents. If "client", the
+                referenced documents are fetched with one `$in` query per referenced
+                model and stitched in by the engine. Defaults to False.
             pipeline: A custom aggregation pipeline to use. Defaults to None.
             populate_db_fields: A list of specific DbFields to populate. Defaults to None.
             as_dict: If True, returns the document as a dictionary. Defaults to False.
             tz_info: Timezone information for decoding datetime objects. Defaults to None.
+            fields: The DbFields to read, like [Model.id, Model.address.city]. Only
+                these fields are projected, also in populated references, and documents
+                are returned as partial models (see `partial_model`) or dictionaries.
+                Defaults to None (entire documents).
+            trusted: If True, documents are built without validation (see
+                `construct_model`). Defaults to None (the default of the engine).
 
         Returns:
             The matched document as a model instance or a dictionary, or None if no
             document is found.
         """
+        read_cache_key = self._read_cache_key(
+            Model=Model,
+            query=query,
+            raw_query=raw_query,
+            populate=populate,
+            pipeline=pipeline,
+            fields=fields,
+        )
+        if read_cache_key is not None:
+            doc = self._read_cached(Model=Model, key=read_cache_key, tz_info=tz_info)
+            if doc is not None:
+                return (
+                    doc
+                    if as_dict
+                    else (
+                        await self._hydrate(Model=Model, docs=[doc], trusted=trusted)
+                    )[0]
+                )
         pipeline, _, _ = self._aggregate_pipeline(
             Model=Model,
             query=query,
@@ -425,16 +1615,34 @@ class AsyncDbEngine(_Engine):
             populate=populate,
             pipeline=pipeline,
             populate_db_fields=populate_db_fields,
+            fields=fields,
             paginate=False,
             current_page=1,
             docs_per_page=1,
             no_paginate_limit=1,
         )
-        cursor = self._aggregate_cursor(Model=Model, pipeline=pipeline, tz_info=tz_info)
-        if as_dict:
-            result = await cursor.to_list(length=None)
+        docs = await self._aggregate_docs(
+            Model=Model, pipeline=pipeline, tz_info=tz_info
+        )
+        if populate == "client":
+            result = await self._client_populated_result(
+                Model=Model,
+                docs=docs,
+                populate_db_fields=populate_db_fields,
+                as_dict=as_dict,
+                tz_info=tz_info,
+                fields=fields,
+                trusted=trusted,
+            )
         else:
-            result = [Model(**doc) async for doc in cursor]
+            self._store_read_cache(Model=Model, key=read_cache_key, docs=docs)
+            result = (
+                docs
+                if as_dict
+                else await self._hydrate(
+                    Model=Model, docs=docs, fields=fields, trusted=trusted
+                )
+            )
         try:
             return result[0]
         except IndexError:
@@ -447,16 +1655,21 @@ class AsyncDbEngine(_Engine):
         raw_query: dict = None,
         sort: SortOperator = None,
         raw_sort: dict = None,
-        populate: bool = False,
+        populate: bool | str = False,
         pipeline: list = None,
         populate_db_fields: list[DbField] | None = None,
         as_dict: bool = False,
         tz_info: timezone = None,
-        paginate: bool = False,
+        paginate: bool | str = False,
         current_page: int = 1,
         docs_per_page: int = 1000,
         no_paginate_limit: int | None = None,
-    ) -> Union[list[Model], ResponsePaginate]:
+        fields: list[DbField] | None = None,
+        trusted: bool | None = None,
+        after: str | None = None,
+        before: str | None = None,
+        count: str = "exact",
+    ) -> Union[list[Model], ResponsePaginate, ResponseKeysetPaginate]:
         """
         Asynchronously finds multiple documents in the database that match the query criteria.
 
@@ -469,20 +1682,47 @@ class AsyncDbEngine(_Engine):
             raw_query: A raw dictionary for MongoDB query. Defaults to None.
             sort: A SortOperator for sorting the results. Defaults to None.
             raw_sort: A raw dictionary for MongoDB sorting. Defaults to None.
-            populate: If True, populates referenced documents. Defaults to False.
+            populate: If True, populates referenced documents. If "client", the
+                referenced documents are fetched with one `$in` query per referenced
+                model and stitched in by the engine. Defaults to False.
             pipeline: A custom aggregation pipeline to use. Defaults to None.
             populate_db_fields: A list of specific DbFields to populate. Defaults to None.
             as_dict: If True, returns documents as dictionaries. Defaults to False.
             tz_info: Timezone information for decoding datetime objects. Defaults to None.
-            paginate: If True, enables pagination. Defaults to False.
+            paginate: If True, enables pagination. If "keyset", the page is read after
+                or before a token instead of skipping the previous pages, and a
+                ResponseKeysetPaginate is returned. Defaults to False.
             current_page: The page number to retrieve. Defaults to 1.
-            docs_per_page: The number of documents per page. Defaults to 1000.
+            docs_per_page: The number of documents per page. Pagination with
+                `$skip` reads at most 1000. Defaults to 1000.
             no_paginate_limit: The maximum number of documents to return when pagination is disabled. Defaults to None.
+            fields: The DbFields to read, like [Model.id, Model.address.city]. Only
+                these fields are projected, also in populated references, and documents
+                are returned as partial models (see `partial_model`) or dictionaries.
+                Defaults to None (entire documents).
+            trusted: If True, documents are built without validation (see
+                `construct_model`). Defaults to None (the default of the engine).
+            after: With `paginate="keyset"`, a `next_token` from a previous response,
+                to read the page that follows it. Defaults to None (first page).
+            before: With `paginate="keyset"`, a `previous_token` from a previous
+                response, to read the page that precedes it. Defaults to None.
+            count: How `docs_quantity` is counted when paginating. "exact" runs a
+                `count_documents` with the query alongside the aggregation; "facet"
+                reads the page and the total in a single aggregation, counting the
+                output of the custom pipeline too, but returns the whole page,
+                populated references included, in one document, which fails when
+                it exceeds the 16MB BSON limit, so large populated pages should use
+                another strategy; "estimated" uses the collection metadata when
+                there is no query; "cached" reuses the count of the same query for
+                `count_cache_ttl` seconds; "none" does not count and only tells
+                whether there is a next page. The strategy that produced
+                the count is returned in `count_strategy`. Defaults to "exact".
 
         Returns:
-            A list of documents or a ResponsePaginate object with the paginated results.
+            A list of documents, a ResponsePaginate object with the paginated results
+            or, with `paginate="keyset"`, a ResponseKeysetPaginate object.
         """
-        pipeline, query, _ = self._aggregate_pipeline(
+        pipeline, query, sort = self._aggregate_pipeline(
             Model=Model,
             query=query,
             raw_query=raw_query,
@@ -491,39 +1731,204 @@ class AsyncDbEngine(_Engine):
             populate=populate,
             pipeline=pipeline,
             populate_db_fields=populate_db_fields,
+            fields=fields,
             paginate=paginate,
             current_page=current_page,
             docs_per_page=docs_per_page,
             no_paginate_limit=no_paginate_limit,
+            after=after,
+            before=before,
+            count=count,
         )
 
-        async def _result():
-            cursor = self._aggregate_cursor(
+        async def _docs():
+            return await self._aggregate_docs(
                 Model=Model, pipeline=pipeline, tz_info=tz_info
             )
-            if as_dict:
-                result = await cursor.to_list(length=None)
+
+        async def _result(docs: list[dict] | None = None):
+            docs = await _docs() if docs is None else docs
+            if populate == "client":
+                result = await self._client_populated_result(
+                    Model=Model,
+                    docs=docs,
+                    populate_db_fields=populate_db_fields,
+                    as_dict=as_dict,
+                    tz_info=tz_info,
+                    fields=fields,
+                    trusted=trusted,
+                )
+            elif as_dict:
+                result = docs
             else:
-                result = [Model(**doc) async for doc in cursor]
+                result = await self._hydrate(
+                    Model=Model, docs=docs, fields=fields, trusted=trusted
+                )
             return result
 
         if not paginate:
             return await _result()
 
+        if paginate == "keyset":
+            docs, previous_token, next_token = keyset_page(
+                docs=await _docs(),
+                sort=sort,
+                docs_per_page=docs_per_page,
+                after=bool(after),
+                before=bool(before),
+            )
+            return ResponseKeysetPaginate(
+                docs_per_page=docs_per_page,
+                previous_token=previous_token,
+                next_token=next_token,
+                docs=await _result(docs=docs),
+            )
+
         async def _count():
+            collection = self._db[Model._collection]
+            if count == "estimated" and not query:
+                return "estimated", await collection.estimated_document_count()
+            key = self._count_cache_key(Model, query) if count == "cached" else None
+            cached = self._cached_count(key) if key else None
+            if cached is not None:
+                return "cached", cached
             kwargs = {"hint": "_id_"} if not query else {}
-            return await self._db[Model._collection].count_documents(
-                filter=query, **kwargs
+            docs_quantity = await collection.count_documents(filter=query, **kwargs)
+            if key:
+                self._cache_count(key, docs_quantity)
+            return "exact", docs_quantity
+
+        if count == "none":
+            page_size = min(docs_per_page, MAX_DOCS_PER_PAGE)
+            docs = await _docs()
+            return ResponsePaginate(
+                current_page=current_page,
+                page_quantity=None,
+                docs_quantity=None,
+                docs=await _result(docs=docs[:page_size]),
+                count_strategy="none",
+                has_next=len(docs) > page_size,
             )
-
-        result, count = await gather(_result(), _count())
-        page_quantity = ceil(count / docs_per_page)
+        if count == "facet":
+            docs, docs_quantity = self._facet_result(docs=await _docs())
+            result = await _result(docs=docs)
+            count_strategy = "facet"
+        else:
+            result, (count_strategy, docs_quantity) = await gather(_result(), _count())
+        page_quantity = ceil(docs_quantity / docs_per_page)
         return ResponsePaginate(
             current_page=current_page,
             page_quantity=page_quantity,
-            docs_quantity=count,
+            docs_quantity=docs_quantity,
             docs=result,
+            count_strategy=count_strategy,
+            has_next=current_page < page_quantity,
+        )
+
+    async def find_iter(
+        self,
+        Model: Type[Model],
+        query: QueryOperator = None,
+        raw_query: dict = None,
+        sort: SortOperator = None,
+        raw_sort: dict = None,
+        populate: bool | str = False,
+        pipeline: list = None,
+        populate_db_fields: list[DbField] | None = None,
+        as_dict: bool = False,
+        tz_info: timezone = None,
+        no_paginate_limit: int | None = None,
+        batch_size: int | None = None,
+        fields: list[DbField] | None = None,
+        trusted: bool | None = None,
+    ) -> AsyncIterator[Model]:
+        """
+        Asynchronously iterates over the documents that match the query criteria.
+
+        Unlike `find_many`, documents are hydrated one at a time as they are read
+        from the cursor, so memory usage does not grow with the size of the result
+        set. The server cursor is closed when the iteration finishes or when the
+        consumer stops early.
+
+        Args:
+            Model: The DbModel class to perform the query on.
+            query: A QueryOperator for filtering documents. Defaults to None.
+            raw_query: A raw dictionary for MongoDB query. Defaults to None.
+            sort: A SortOperator for sorting the results. Defaults to None.
+            raw_sort: A raw dictionary for MongoDB sorting. Defaults to None.
+            populate: If True, populates referenced documents. If "client", the
+                referenced documents are fetched with one `$in` query per referenced
+                model and stitched in by the engine. Defaults to False.
+            pipeline: A custom aggregation pipeline to use. Defaults to None.
+            populate_db_fields: A list of specific DbFields to populate. Defaults to None.
+            as_dict: If True, yields documents as dictionaries. Defaults to False.
+            tz_info: Timezone information for decoding datetime objects. Defaults to None.
+            no_paginate_limit: The maximum number of documents to return. Defaults to None.
+            batch_size: The number of documents fetched from the server per cursor
+                batch. Defaults to None (server default).
+            fields: The DbFields to read, like [Model.id, Model.address.city]. Only
+                these fields are projected, also in populated references, and documents
+                are returned as partial models (see `partial_model`) or dictionaries.
+                Defaults to None (entire documents).
+            trusted: If True, documents are built without validation (see
+                `construct_model`). Defaults to None (the default of the engine).
+
+        Yields:
+            The matched documents as model instances or dictionaries.
+        """
+        pipeline, _, _ = self._aggregate_pipeline(
+            Model=Model,
+            query=query,
+            raw_query=raw_query,
+            sort=sort,
+            raw_sort=raw_sort,
+            populate=populate,
+            pipeline=pipeline,
+            populate_db_fields=populate_db_fields,
+            fields=fields,
+            paginate=False,
+            current_page=1,
+            docs_per_page=1,
+            no_paginate_limit=no_paginate_limit,
+        )
+        cursor = self._aggregate_cursor(
+            Model=Model, pipeline=pipeline, tz_info=tz_info, batch_size=batch_size
         )
+        try:
+            if populate != "client":
+                async for doc in cursor:
+                    yield doc if as_dict else self._model_from_doc(
+                        Model=Model, doc=doc, fields=fields, trusted=trusted
+                    )
+                return
+            batch = []
+            async for doc in cursor:
+                batch.append(doc)
+                if len(batch) < (batch_size or CLIENT_POPULATE_BATCH_SIZE):
+                    continue
+                for item in await self._client_populated_result(
+                    Model=Model,
+                    docs=batch,
+                    populate_db_fields=populate_db_fields,
+                    as_dict=as_dict,
+                    tz_info=tz_info,
+                    fields=fields,
+                    trusted=trusted,
+                ):
+                    yield item
+                batch = []
+            for item in await self._client_populated_result(
+                Model=Model,
+                docs=batch,
+                populate_db_fields=populate_db_fields,
+                as_dict=as_dict,
+                tz_info=tz_info,
+                fields=fields,
+                trusted=trusted,
+            ):
+                yield item
+        finally:
+            await cursor.close()
 
     async def delete(
         self,
@@ -549,6 +1954,9 @@ class AsyncDbEngine(_Engine):
         )
         collection_name = Model._collection
         result: BulkWriteResult = await self._db[collection_name].bulk_write(operations)
+        _id = id_from_query(self._query(query=query, raw_query=raw_query))
+        self._invalidate_read_cache(Model=Model, ids=None if _id is None else [_id])
+        self._invalidate_query_cache(collection_name=collection_name)
         return self._db_response(result=result)
 
 
@@ -557,7 +1965,16 @@ class DbEngine(_Engine):
     Synchronous database engine class that extends the base engine to provide synchronous operations.
     """
 
-    def __init__(self, mongo_uri, db_name, tz_info: timezone = None):
+    def __init__(
+        self,
+        mongo_uri,
+        db_name,
+        tz_info: timezone = None,
+        populate_strategy: str = "unwind",
+        trusted: bool = False,
+        count_cache_ttl: float = 60,
+        cache_backend: CacheBackend | None = None,
+    ):
         """
         Initialize the synchronous database engine.
 
@@ -565,42 +1982,282 @@ class DbEngine(_Engine):
             mongo_uri (str): The MongoDB URI.
             db_name (str): The database name.
             tz_info (timezone, optional): The timezone information. Defaults to None.
+            populate_strategy (str, optional): How references are populated, "unwind"
+                or "array". Defaults to "unwind".
+            trusted (bool, optional): If True, documents read are built without
+                validation by default. Defaults to False.
+            count_cache_ttl (float, optional): How many seconds a count is reused by
+                paginated finds with `count="cached"`. Defaults to 60.
+            cache_backend (CacheBackend, optional): The store of the counts reused
+                by paginated finds with `count="cached"` and of the query results
+                of the models that declare a `_query_cache_ttl`. Defaults to None
+                (an in-process `MemoryCacheBackend`).
         """
         super().__init__(
             Client=MongoClient,
             mongo_uri=mongo_uri,
             db_name=db_name,
             tz_info=tz_info,
+            populate_strategy=populate_strategy,
+            trusted=trusted,
+            count_cache_ttl=count_cache_ttl,
+            cache_backend=cache_backend,
         )
 
+    def _aggregate_docs(
+        self, Model: Type[Model], pipeline: list, tz_info: timezone
+    ) -> list[dict]:
+        """
+        Read the documents of an aggregation, through the query cache of the model.
+
+        Args:
+            Model (DbModel): The database model class.
+            pipeline (list): The final aggregation pipeline.
+            tz_info (timezone): The timezone information.
+
+        Returns:
+            list[dict]: The documents read from the database or, if the model
+                declares a `_query_cache_ttl`, from the cache backend.
+        """
+        key = self._query_cache_key(Model=Model, pipeline=pipeline, tz_info=tz_info)
+        docs = self._query_cached(key=key, tz_info=tz_info) if key else None
+        if docs is not None:
+            return docs
+        cursor = self._aggregate_cursor(Model=Model, pipeline=pipeline, tz_info=tz_info)
+        docs = list(cursor)
+        self._store_query_cache(Model=Model, key=key, docs=docs)
+        return docs
+
+    def sync_indexes(self, models: list[Type[Model]]) -> dict[str, list[str]]:
+        """
+        Create the indexes declared by the given models, typically once at startup.
+
+        Indexes already synchronized by this engine are skipped, and the collections
+        synchronized here are not touched again by later saves.
+
+        Args:
+            models (list[DbModel]): The database model classes.
+
+        Returns:
+            dict[str, list[str]]: The names of the created indexes keyed by collection name.
+        """
+        created = {}
+        indexes = self._indexes_from_models(models=models)
+        for collection_name, index_list in self._pending_indexes(indexes).items():
+            created[collection_name] = self._db[collection_name].create_indexes(
+                index_list
+            )
+            self._register_synced_indexes(collection_name, index_list)
+        return created
+
+    def reconcile_indexes(
+        self,
+        models: list[Type[Model]],
+        dry_run: bool = False,
+        drop_unknown: bool = False,
+    ) -> dict[str, IndexPlan]:
+        """
+        Converge the indexes of the models collections with the declared indexes.
+
+        The existing indexes of each collection are read with `list_indexes()` and
+        diffed against the models `_indexes`/`_init_indexes`. Only missing indexes are
+        created, indexes whose keys or options changed are rebuilt and, optionally,
+        indexes no longer declared are dropped.
+
+        Args:
+            models (list[DbModel]): The database model classes.
+            dry_run (bool, optional): If True, only computes the plans. Defaults to False.
+            drop_unknown (bool, optional): If True, drops the existing indexes that are
+                not declared by any model of the collection, including indexes
+                created by hand or by other applications. Defaults to False.
+
+        Returns:
+            dict[str, IndexPlan]: The index plan of each collection.
+        """
+        plans = {}
+        indexes = self._indexes_from_models(models=models)
+        for collection_name, index_list in indexes.items():
+            collection = self._db[collection_name]
+            existing = list(collection.list_indexes())
+            plan = resolve_index_plan(
+                collection_name=collection_name,
+                declared=index_list,
+                existing=existing,
+                drop_unknown=drop_unknown,
+            )
+            plans[collection_name] = plan
+            if dry_run:
+                continue
+            for name in plan.drop + plan.rebuild:
+                collection.drop_index(name)
+            to_create = self._plan_indexes_to_create(plan=plan, index_list=index_list)
+            if to_create:
+                collection.create_indexes(to_create)
+            self._register_synced_indexes(collection_name, index_list)
+            plan.applied = True
+        return plans
+
     def save_all(
         self,
-        obj_list: list[Model],
+        obj_list: Iterable[Model],
         populate: bool = False,
+        insert_new: bool = False,
+        ordered: bool = True,
+        chunk_size: int | None = None,
+        max_in_flight: int = 2,
     ) -> dict[str, DbResponse]:
         """
         Save a list of objects to the database.
 
+        Args:
+            obj_list (Iterable[DbModel]): The database model objects. When `chunk_size`
+                is set, any iterable (e.g. a generator) is accepted.
+            populate (bool, optional): If True, referenced objects are saved embedded
+                instead of by id. Defaults to False.
+            insert_new (bool, optional): If True, objects without an id get an ObjectId
+                assigned client-side and are sent as pure inserts, skipping the upsert
+                lookup on the server. Inserted objects are counted in `inserted_count`
+                instead of `upserted_count`. Defaults to False.
+            ordered (bool, optional): If False, the server may apply the operations of
+                each collection in any order and keeps going after an error. With
+                `chunk_size`, True also writes the chunks one after another, so that
+                they are applied in order and no chunk is written after one fails.
+                Defaults to True.
+            chunk_size (int, optional): If set, the objects are serialized and written
+                in chunks of at most this many objects, keeping memory bounded for very
+                large imports. Defaults to None (a single batch).
+            max_in_flight (int, optional): The maximum number of chunks being written
+                at the same time, in worker threads, when `chunk_size` is set and
+                `ordered` is False. Defaults to 2.
+
+        Returns:
+            dict[str, DbResponse]: The response of each collection. With `chunk_size`,
+                the responses of all the chunks are summed.
+        """
+        if not chunk_size:
+            return self._save_chunk(
+                obj_list=obj_list,
+                populate=populate,
+                insert_new=insert_new,
+                ordered=ordered,
+            )
+
+        def _save_one_chunk(chunk: list[Model]):
+            response = self._save_chunk(
+                obj_list=chunk,
+                populate=populate,
+                insert_new=insert_new,
+                ordered=ordered,
+            )
+            return Counter(obj._collection for obj in chunk), response
+
+        if ordered:
+            max_in_flight = 1
+        futures = []
+        with ThreadPoolExecutor(max_workers=max_in_flight) as executor:
+            try:
+                for chunk in self._chunks(objs=obj_list, chunk_size=chunk_size):
+                    in_flight = [future for future in futures if not future.done()]
+                    if len(in_flight) >= max_in_flight:
+                        done, _ = wait_futures(in_flight, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            future.result()
+                    futures.append(executor.submit(_save_one_chunk, chunk))
+                responses = [future.result() for future in futures]
+            except BaseException:
+                for future in futures:
+                    future.cancel()
+                raise
+        return self._merge_db_responses(responses=responses)
+
+    def _save_chunk(
+        self,
+        obj_list: list[Model],
+        populate: bool,
+        insert_new: bool,
+        ordered: bool,
+    ) -> dict[str, DbResponse]:
+        """
+        Save a batch of objects with one bulk write per collection.
+
         Args:
             obj_list (list[DbModel]): The list of database model objects.
+            populate (bool): If True, referenced objects are saved embedded.
+            insert_new (bool): If True, new objects are sent as pure inserts.
+            ordered (bool): Whether the bulk writes are ordered.
+
+        Returns:
+            dict[str, DbResponse]: The response of each collection.
         """
         response = {}
-        indexes, operations, now = self._create_save_operations_list(
-            objs=obj_list, query=None, raw_query=None, upsert=True, populate=populate
+        indexes, operations, inserted_ids, now = self._create_save_operations_list(
+            objs=obj_list,
+            query=None,
+            raw_query=None,
+            upsert=True,
+            populate=populate,
+            insert_new=insert_new,
         )
-        for collection_name, index_list in indexes.items():
-            if index_list:
-                self._db[collection_name].create_indexes(index_list)
+        for collection_name, index_list in self._pending_indexes(indexes).items():
+            self._db[collection_name].create_indexes(index_list)
+            self._register_synced_indexes(collection_name, index_list)
         for collection_name, operation_list in operations.items():
             result: BulkWriteResult = self._db[collection_name].bulk_write(
-                operation_list
+                operation_list, ordered=ordered
             )
             self._after_save(
-                result=result, objs=obj_list, collection_name=collection_name, now=now
+                result=result,
+                objs=obj_list,
+                collection_name=collection_name,
+                now=now,
+                populate=populate,
+                inserted_ids=inserted_ids.get(collection_name),
             )
             response[collection_name] = self._db_response(result=result)
         return response
 
+    def buffered_writer(
+        self,
+        max_operations: int = 1000,
+        flush_interval_ms: int = 1000,
+        populate: bool = False,
+    ) -> BufferedWriter:
+        """
+        Create a write-behind buffer that batches saves per collection.
+
+        Args:
+            max_operations (int, optional): The number of pending objects of a
+                collection that triggers a flush of that collection. Defaults to 1000.
+            flush_interval_ms (int, optional): The maximum time, in milliseconds, an
+                object waits in the buffer before being written. Defaults to 1000.
+            populate (bool, optional): If True, referenced objects are saved embedded
+                instead of by id. Defaults to False.
+
+        Returns:
+            BufferedWriter: The buffered writer. Use it as a context manager so pending
+                objects are flushed on exit.
+        """
+        return BufferedWriter(
+            engine=self,
+            max_operations=max_operations,
+            flush_interval_ms=flush_interval_ms,
+            populate=populate,
+        )
+
+    def session(self, populate: bool = False) -> Session:
+        """
+        Create a session with an identity map and a unit of work.
+
+        Args:
+            populate (bool, optional): If True, referenced objects are saved embedded
+                instead of by id when the session is flushed. Defaults to False.
+
+        Returns:
+            Session: The session. Use it as a context manager (`with`) so the objects
+                added to it are saved, one bulk write per collection, on exit.
+        """
+        return Session(engine=self, populate=populate)
+
     def save(
         self,
         obj: Model,
@@ -620,7 +2277,7 @@ class DbEngine(_Engine):
         Returns:
             DbResponse: The database response object.
         """
-        indexes, operations, now = self._create_save_operations_list(
+        indexes, operations, _, now = self._create_save_operations_list(
             objs=[obj],
             query=query,
             raw_query=raw_query,
@@ -628,16 +2285,81 @@ class DbEngine(_Engine):
             populate=populate,
         )
         collection_name = obj._collection
-        index_list = indexes[collection_name]
-        if index_list:
+        for index_list in self._pending_indexes(indexes).values():
             self._db[collection_name].create_indexes(index_list)
+            self._register_synced_indexes(collection_name, index_list)
         operation_list = operations[collection_name]
         result: BulkWriteResult = self._db[collection_name].bulk_write(operation_list)
         self._after_save(
-            result=result, objs=[obj], collection_name=collection_name, now=now
+            result=result,
+            objs=[obj],
+            collection_name=collection_name,
+            now=now,
+            populate=populate,
         )
+        if query or raw_query:
+            self._invalidate_read_cache(Model=type(obj))
         return self._db_response(result=result)
 
+    def _populate_client(
+        self,
+        Model: Type[Model],
+        docs: list[dict],
+        populate_db_fields: list[DbField] | None,
+        tz_info: timezone,
+    ) -> list[dict]:
+        """
+        Populate the references of raw documents with one `$in` query per referenced
+        model. Referenced documents are populated recursively.
+
+        Args:
+            Model (DbModel): The database model class of the documents.
+            docs (list[dict]): The raw documents, modified in place.
+            populate_db_fields (list[DbField] | None): The DbFields to populate.
+            tz_info (timezone): The timezone information.
+
+        Returns:
+            list[dict]: The populated documents.
+        """
+        paths = reference_paths(cls=Model, populate_db_fields=populate_db_fields)
+        found = {}
+        for RefModel, ids in collect_reference_ids(docs=docs, paths=paths).items():
+            cursor = self._aggregate_cursor(
+                Model=RefModel,
+                pipeline=[{"$match": {"_id": {"$in": ids}}}],
+                tz_info=tz_info,
+            )
+            ref_docs = self._populate_client(
+                Model=RefModel,
+                docs=list(cursor),
+                populate_db_fields=populate_db_fields,
+                tz_info=tz_info,
+            )
+            found[RefModel] = {doc["_id"]: doc for doc in ref_docs}
+        return stitch_references(docs=docs, paths=paths, found=found)
+
+    def _client_populated_result(
+        self,
+        Model: Type[Model],
+        docs: list[dict],
+        populate_db_fields: list[DbField] | None,
+        as_dict: bool,
+        tz_info: timezone,
+        fields: list[DbField] | None = None,
+        trusted: bool | None = None,
+    ) -> list:
+        docs = self._populate_client(
+            Model=Model,
+            docs=docs,
+            populate_db_fields=populate_db_fields,
+            tz_info=tz_info,
+        )
+        if as_dict:
+            return docs
+        return self._models_from_docs(
+            Model=Model, docs=docs, fields=fields, trusted=trusted
+        )
+
     def find_one(
         self,
         Model: Type[Model],
@@ -645,17 +2367,21 @@ class DbEngine(_Engine):
         raw_query: dict = None,
         sort: SortOperator = None,
         raw_sort: dict = None,
-        populate: bool = False,
+        populate: bool | str = False,
         pipeline: list = None,
         populate_db_fields: list[DbField] | None = None,
         as_dict: bool = False,
         tz_info: timezone = None,
+        fields: list[DbField] | None = None,
+        trusted: bool | None = None,
     ) -> Model:
         """
         Synchronously finds a single document in the database that matches the query criteria.
 
         This method constructs and executes an aggregation pipeline to find one document.
         It supports complex queries, sorting, and populating referenced fields.
+        If the model declares a `_read_cache`, queries by id only, without populate,
+        projection or custom pipeline, are answered from it when possible.
 
         Args:
             Model: The DbModel class to perform the query on.
@@ -663,16 +2389,40 @@ class DbEngine(_Engine):
             raw_query: A raw dictionary for MongoDB query. Defaults to None.
             sort: A SortOperator for sorting the result. Defaults to None.
             raw_sort: A raw dictionary for MongoDB sorting. Defaults to None.
-            populate: If True, populates referenced documents. Defaults to False.
+            populate: If True, populates referenced documents. If "client", the
+                referenced documents are fetched with one `$in` query per referenced
+                model and stitched in by the engine. Defaults to False.
             pipeline: A custom aggregation pipeline to use. Defaults to None.
             populate_db_fields: A list of specific DbFields to populate. Defaults to None.
             as_dict: If True, returns the document as a dictionary. Defaults to False.
             tz_info: Timezone information for decoding datetime objects. Defaults to None.
+            fields: The DbFields to read, like [Model.id, Model.address.city]. Only
+                these fields are projected, also in populated references, and documents
+                are returned as partial models (see `partial_model`) or dictionaries.
+                Defaults to None (entire documents).
+            trusted: If True, documents are built without validation (see
+                `construct_model`). Defaults to None (the default of the engine).
 
         Returns:
             The matched document as a model instance or a dictionary, or None if no
             document is found.
         """
+        read_cache_key = self._read_cache_key(
+            Model=Model,
+            query=query,
+            raw_query=raw_query,
+            populate=populate,
+            pipeline=pipeline,
+            fields=fields,
+        )
+        if read_cache_key is not None:
+            doc = self._read_cached(Model=Model, key=read_cache_key, tz_info=tz_info)
+            if doc is not None:
+                return (
+                    doc
+                    if as_dict
+                    else self._model_from_doc(Model=Model, doc=doc, trusted=trusted)
+                )
         pipeline, _, _ = self._aggregate_pipeline(
             Model=Model,
             query=query,
@@ -682,16 +2432,35 @@ class DbEngine(_Engine):
             populate=populate,
             pipeline=pipeline,
             populate_db_fields=populate_db_fields,
+            fields=fields,
             paginate=False,
             current_page=1,
             docs_per_page=1,
             no_paginate_limit=1,
         )
-        cursor = self._aggregate_cursor(Model=Model, pipeline=pipeline, tz_info=tz_info)
-        if as_dict:
-            result = list(cursor)
+        docs = self._aggregate_docs(Model=Model, pipeline=pipeline, tz_info=tz_info)
+        if populate == "client":
+            result = self._client_populated_result(
+                Model=Model,
+                docs=docs,
+                populate_db_fields=populate_db_fields,
+                as_dict=as_dict,
+                tz_info=tz_info,
+                fields=fields,
+                trusted=trusted,
+            )
         else:
-            result = [Model(**doc) for doc in cursor]
+            self._store_read_cache(Model=Model, key=read_cache_key, docs=docs)
+            result = (
+                docs
+                if as_dict
+                else [
+                    self._model_from_doc(
+                        Model=Model, doc=doc, fields=fields, trusted=trusted
+                    )
+                    for doc in docs
+                ]
+            )
         try:
             return result[0]
         except IndexError:
@@ -704,16 +2473,21 @@ class DbEngine(_Engine):
         raw_query: dict = None,
         sort: SortOperator = None,
         raw_sort: dict = None,
-        populate: bool = False,
+        populate: bool | str = False,
         pipeline: list = None,
         populate_db_fields: list[DbField] | None = None,
         as_dict: bool = False,
         tz_info: timezone = None,
-        paginate: bool = False,
+        paginate: bool | str = False,
         current_page: int = 1,
         docs_per_page: int = 1000,
         no_paginate_limit: int | None = None,
-    ) -> Union[list[Model], ResponsePaginate]:
+        fields: list[DbField] | None = None,
+        trusted: bool | None = None,
+        after: str | None = None,
+        before: str | None = None,
+        count: str = "exact",
+    ) -> Union[list[Model], ResponsePaginate, ResponseKeysetPaginate]:
         """
         Synchronously finds multiple documents in the database that match the query criteria.
 
@@ -726,20 +2500,47 @@ class DbEngine(_Engine):
             raw_query: A raw dictionary for MongoDB query. Defaults to None.
             sort: A SortOperator for sorting the results. Defaults to None.
             raw_sort: A raw dictionary for MongoDB sorting. Defaults to None.
-            populate: If True, populates referenced documents. Defaults to False.
+            populate: If True, populates referenced documents. If "client", the
+                referenced documents are fetched with one `$in` query per referenced
+                model and stitched in by the engine. Defaults to False.
             pipeline: A custom aggregation pipeline to use. Defaults to None.
             populate_db_fields: A list of specific DbFields to populate. Defaults to None.
             as_dict: If True, returns documents as dictionaries. Defaults to False.
             tz_info: Timezone information for decoding datetime objects. Defaults to None.
-            paginate: If True, enables pagination. Defaults to False.
+            paginate: If True, enables pagination. If "keyset", the page is read after
+                or before a token instead of skipping the previous pages, and a
+                ResponseKeysetPaginate is returned. Defaults to False.
             current_page: The page number to retrieve. Defaults to 1.
-            docs_per_page: The number of documents per page. Defaults to 1000.
+            docs_per_page: The number of documents per page. Pagination with
+                `$skip` reads at most 1000. Defaults to 1000.
             no_paginate_limit: The maximum number of documents to return when pagination is disabled. Defaults to None.
+            fields: The DbFields to read, like [Model.id, Model.address.city]. Only
+                these fields are projected, also in populated references, and documents
+                are returned as partial models (see `partial_model`) or dictionaries.
+                Defaults to None (entire documents).
+            trusted: If True, documents are built without validation (see
+                `construct_model`). Defaults to None (the default of the engine).
+            after: With `paginate="keyset"`, a `next_token` from a previous response,
+                to read the page that follows it. Defaults to None (first page).
+            before: With `paginate="keyset"`, a `previous_token` from a previous
+                response, to read the page that precedes it. Defaults to None.
+            count: How `docs_quantity` is counted when paginating. "exact" runs a
+                `count_documents` with the query alongside the aggregation; "facet"
+                reads the page and the total in a single aggregation, counting the
+                output of the custom pipeline too, but returns the whole page,
+                populated references included, in one document, which fails when
+                it exceeds the 16MB BSON limit, so large populated pages should use
+                another strategy; "estimated" uses the collection metadata when
+                there is no query; "cached" reuses the count of the same query for
+                `count_cache_ttl` seconds; "none" does not count and only tells
+                whether there is a next page. The strategy that produced
+                the count is returned in `count_strategy`. Defaults to "exact".
 
         Returns:
-            A list of documents or a ResponsePaginate object with the paginated results.
+            A list of documents, a ResponsePaginate object with the paginated results
+            or, with `paginate="keyset"`, a ResponseKeysetPaginate object.
         """
-        pipeline, query, _ = self._aggregate_pipeline(
+        pipeline, query, sort = self._aggregate_pipeline(
             Model=Model,
             query=query,
             raw_query=raw_query,
@@ -748,44 +2549,202 @@ class DbEngine(_Engine):
             populate=populate,
             pipeline=pipeline,
             populate_db_fields=populate_db_fields,
+            fields=fields,
             paginate=paginate,
             current_page=current_page,
             docs_per_page=docs_per_page,
             no_paginate_limit=no_paginate_limit,
+            after=after,
+            before=before,
+            count=count,
         )
 
-        def _result():
-            cursor = self._aggregate_cursor(
-                Model=Model, pipeline=pipeline, tz_info=tz_info
-            )
-            if as_dict:
-                result = list(cursor)
+        def _docs():
+            return self._aggregate_docs(Model=Model, pipeline=pipeline, tz_info=tz_info)
+
+        def _result(docs: list[dict] | None = None):
+            docs = _docs() if docs is None else docs
+            if populate == "client":
+                result = self._client_populated_result(
+                    Model=Model,
+                    docs=docs,
+                    populate_db_fields=populate_db_fields,
+                    as_dict=as_dict,
+                    tz_info=tz_info,
+                    fields=fields,
+                    trusted=trusted,
+                )
+            elif as_dict:
+                result = docs
             else:
-                result = [Model(**doc) for doc in cursor]
+                result = self._models_from_docs(
+                    Model=Model, docs=docs, fields=fields, trusted=trusted
+                )
             return result
 
         if not paginate:
             return _result()
 
-        cursor = self._aggregate_cursor(Model=Model, pipeline=pipeline, tz_info=tz_info)
+        if paginate == "keyset":
+            docs, previous_token, next_token = keyset_page(
+                docs=_docs(),
+                sort=sort,
+                docs_per_page=docs_per_page,
+                after=bool(after),
+                before=bool(before),
+            )
+            return ResponseKeysetPaginate(
+                docs_per_page=docs_per_page,
+                previous_token=previous_token,
+                next_token=next_token,
+                docs=_result(docs=docs),
+            )
 
         def _count():
+            collection = self._db[Model._collection]
+            if count == "estimated" and not query:
+                return "estimated", collection.estimated_document_count()
+            key = self._count_cache_key(Model, query) if count == "cached" else None
+            cached = self._cached_count(key) if key else None
+            if cached is not None:
+                return "cached", cached
             kwargs = {"hint": "_id_"} if not query else {}
-            return self._db[Model._collection].count_documents(filter=query, **kwargs)
-
-        with ThreadPoolExecutor() as executor:
-            future_result = executor.submit(_result)
-            future_count = executor.submit(_count)
-            result = future_result.result()
-            count = future_count.result()
+            docs_quantity = collection.count_documents(filter=query, **kwargs)
+            if key:
+                self._cache_count(key, docs_quantity)
+            return "exact", docs_quantity
+
+        if count == "none":
+            page_size = min(docs_per_page, MAX_DOCS_PER_PAGE)
+            docs = _docs()
+            return ResponsePaginate(
+                current_page=current_page,
+                page_quantity=None,
+                docs_quantity=None,
+                docs=_result(docs=docs[:page_size]),
+                count_strategy="none",
+                has_next=len(docs) > page_size,
+            )
+        if count == "facet":
+            docs, docs_quantity = self._facet_result(docs=_docs())
+            result = _result(docs=docs)
+            count_strategy = "facet"
+        else:
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                future_count = executor.submit(_count)
+                result = _result()
+                count_strategy, docs_quantity = future_count.result()
 
-        page_quantity = ceil(count / docs_per_page)
+        page_quantity = ceil(docs_quantity / docs_per_page)
         return ResponsePaginate(
             current_page=current_page,
             page_quantity=page_quantity,
-            docs_quantity=count,
+            docs_quantity=docs_quantity,
             docs=result,
+            count_strategy=count_strategy,
+            has_next=current_page < page_quantity,
+        )
+
+    def find_iter(
+        self,
+        Model: Type[Model],
+        query: QueryOperator = None,
+        raw_query: dict = None,
+        sort: SortOperator = None,
+        raw_sort: dict = None,
+        populate: bool | str = False,
+        pipeline: list = None,
+        populate_db_fields: list[DbField] | None = None,
+        as_dict: bool = False,
+        tz_info: timezone = None,
+        no_paginate_limit: int | None = None,
+        batch_size: int | None = None,
+        fields: list[DbField] | None = None,
+        trusted: bool | None = None,
+    ) -> Iterator[Model]:
+        """
+        Synchronously iterates over the documents that match the query criteria.
+
+        Unlike `find_many`, documents are hydrated lazily as they are read from the
+        cursor, so memory usage does not grow with the size of the result set. The
+        server cursor is closed when the iteration finishes or when the generator is
+        closed, e.g. by breaking out of a `with contextlib.closing(...)` block.
+
+        Args:
+            Model: The DbModel class to perform the query on.
+            query: A QueryOperator for filtering documents. Defaults to None.
+            raw_query: A raw dictionary for MongoDB query. Defaults to None.
+            sort: A SortOperator for sorting the results. Defaults to None.
+            raw_sort: A raw dictionary for MongoDB sorting. Defaults to None.
+            populate: If True, populates referenced documents. If "client", the
+                referenced documents are fetched with one `$in` query per referenced
+                model and stitched in by the engine. Defaults to False.
+            pipeline: A custom aggregation pipeline to use. Defaults to None.
+            populate_db_fields: A list of specific DbFields to populate. Defaults to None.
+            as_dict: If True, yields documents as dictionaries. Defaults to False.
+            tz_info: Timezone information for decoding datetime objects. Defaults to None.
+            no_paginate_limit: The maximum number of documents to return. Defaults to None.
+            batch_size: The number of documents fetched from the server per cursor
+                batch. Defaults to None (server default).
+            fields: The DbFields to read, like [Model.id, Model.address.city]. Only
+                these fields are projected, also in populated references, and documents
+                are returned as partial models (see `partial_model`) or dictionaries.
+                Defaults to None (entire documents).
+            trusted: If True, documents are built without validation (see
+                `construct_model`). Defaults to None (the default of the engine).
+
+        Yields:
+            The matched documents as model instances or dictionaries.
+        """
+        pipeline, _, _ = self._aggregate_pipeline(
+            Model=Model,
+            query=query,
+            raw_query=raw_query,
+            sort=sort,
+            raw_sort=raw_sort,
+            populate=populate,
+            pipeline=pipeline,
+            populate_db_fields=populate_db_fields,
+            fields=fields,
+            paginate=False,
+            current_page=1,
+            docs_per_page=1,
+            no_paginate_limit=no_paginate_limit,
         )
+        cursor = self._aggregate_cursor(
+            Model=Model, pipeline=pipeline, tz_info=tz_info, batch_size=batch_size
+        )
+        with cursor:
+            if populate != "client":
+                for doc in cursor:
+                    yield doc if as_dict else self._model_from_doc(
+                        Model=Model, doc=doc, fields=fields, trusted=trusted
+                    )
+                return
+            batch = []
+            for doc in cursor:
+                batch.append(doc)
+                if len(batch) < (batch_size or CLIENT_POPULATE_BATCH_SIZE):
+                    continue
+                yield from self._client_populated_result(
+                    Model=Model,
+                    docs=batch,
+                    populate_db_fields=populate_db_fields,
+                    as_dict=as_dict,
+                    tz_info=tz_info,
+                    fields=fields,
+                    trusted=trusted,
+                )
+                batch = []
+            yield from self._client_populated_result(
+                Model=Model,
+                docs=batch,
+                populate_db_fields=populate_db_fields,
+                as_dict=as_dict,
+                tz_info=tz_info,
+                fields=fields,
+                trusted=trusted,
+            )
 
     def delete(
         self,
@@ -811,4 +2770,7 @@ class DbEngine(_Engine):
         )
         collection_name = Model._collection
         result: BulkWriteResult = self._db[collection_name].bulk_write(operations)
+        _id = id_from_query(self._query(query=query, raw_query=raw_query))
+        self._invalidate_read_cache(Model=Model, ids=None if _id is None else [_id])
+        self._invalidate_query_cache(collection_name=collection_name)
         return self._db_response(result=result)
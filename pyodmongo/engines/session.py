@@ -0,0 +1,272 @@
+from bson import ObjectId
+from pydantic import BaseModel
+from ..models.db_model import DbModel
+from ..models.responses import DbResponse
+from .utils import id_from_query
+
+
+class _SessionBase:
+    """
+    Common state of the sessions: the identity map and the pending saves.
+
+    Attributes:
+        _engine (AsyncDbEngine | DbEngine): The engine used to read and write.
+        _populate (bool): If True, referenced objects are saved embedded on flush.
+        _identity_map (dict[tuple[str, str], DbModel]): The objects loaded or saved
+                                 in the session, keyed by collection name and id.
+        _pending (dict[int, DbModel]): The objects to be saved on flush, keyed by
+                                 their Python id.
+    """
+
+    def __init__(self, engine, populate: bool = False):
+        self._engine = engine
+        self._populate = populate
+        self._identity_map = {}
+        self._pending = {}
+
+    @property
+    def pending(self) -> int:
+        return len(self._pending)
+
+    def add(self, obj: DbModel):
+        """
+        Register an object to be saved when the session is flushed.
+
+        Args:
+            obj (DbModel): The database model object. If it has an id, it also
+                           replaces the object of the same id in the identity map.
+        """
+        self._pending[id(obj)] = obj
+        if obj.id is not None:
+            self._identity_map[(obj._collection, obj.id)] = obj
+
+    def _identity(self, Model: type[DbModel], id) -> DbModel | None:
+        return self._identity_map.get((Model._collection, str(id)))
+
+    def _merge(self, value):
+        if isinstance(value, list):
+            if not any(isinstance(item, BaseModel) for item in value):
+                return value
+            return [self._merge(item) for item in value]
+        if not isinstance(value, BaseModel):
+            return value
+        if isinstance(value, DbModel) and value.id is not None:
+            key = (value._collection, value.id)
+            mapped = self._identity_map.get(key)
+            if mapped is not None:
+                return mapped
+            self._identity_map[key] = value
+        values = value.__dict__
+        for field, item in values.items():
+            if isinstance(item, (BaseModel, list)):
+                values[field] = self._merge(item)
+        return value
+
+    def _merge_result(self, result, kwargs: dict):
+        if result is None or kwargs.get("as_dict") or kwargs.get("fields"):
+            return result
+        if isinstance(result, list):
+            return self._merge(result)
+        if hasattr(result, "docs"):
+            result.docs = self._merge(result.docs)
+            return result
+        return self._merge(result)
+
+    def _mapped_find_one(self, Model: type[DbModel], kwargs: dict) -> DbModel | None:
+        if kwargs.get("populate") or kwargs.get("as_dict") or kwargs.get("fields"):
+            return None
+        if kwargs.get("pipeline"):
+            return None
+        query = self._engine._query(
+            query=kwargs.get("query"), raw_query=kwargs.get("raw_query")
+        )
+        _id = id_from_query(query)
+        return self._identity(Model, _id) if _id is not None else None
+
+    def _pop_pending(self) -> list[DbModel]:
+        objs = list(self._pending.values())
+        self._pending = {}
+        return objs
+
+    def _restore_pending(self, objs: list[DbModel]):
+        self._pending = {**{id(obj): obj for obj in objs}, **self._pending}
+
+    def _register_saved(self, objs: list[DbModel]):
+        for obj in objs:
+            self._identity_map[(obj._collection, obj.id)] = obj
+
+
+class AsyncSession(_SessionBase):
+    """
+    Identity map and unit of work for AsyncDbEngine, usually scoped to one request.
+
+    Objects read through the session are kept in an identity map keyed by collection
+    and id: reading the same document again, directly or as a populated reference,
+    returns the object already loaded, and lookups by id are answered from the map
+    without a round trip. Objects passed to `add` are saved together by `flush`, with
+    one bulk write per collection, which happens when the `async with` block exits
+    without an error.
+    """
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            await self.flush()
+
+    async def get(self, Model: type[DbModel], id: str | ObjectId) -> DbModel | None:
+        """
+        Get an object by id, from the identity map or from the database.
+
+        Args:
+            Model (DbModel): The database model class.
+            id (str | ObjectId): The id of the object.
+
+        Returns:
+            DbModel | None: The object, or None if it does not exist.
+        """
+        obj = self._identity(Model, id)
+        if obj is not None:
+            return obj
+        return await self.find_one(Model, raw_query={"_id": ObjectId(id)})
+
+    async def find_one(self, Model: type[DbModel], **kwargs) -> DbModel | None:
+        """
+        Find one object with `AsyncDbEngine.find_one`, through the identity map.
+
+        Args:
+            Model (DbModel): The database model class.
+            **kwargs: The arguments of `AsyncDbEngine.find_one`. A query by id only,
+                without populate, is answered from the identity map when possible.
+
+        Returns:
+            DbModel | None: The object, or None if no document matches.
+        """
+        obj = self._mapped_find_one(Model=Model, kwargs=kwargs)
+        if obj is not None:
+            return obj
+        result = await self._engine.find_one(Model=Model, **kwargs)
+        return self._merge_result(result=result, kwargs=kwargs)
+
+    async def find_many(self, Model: type[DbModel], **kwargs):
+        """
+        Find objects with `AsyncDbEngine.find_many`, through the identity map.
+
+        Args:
+            Model (DbModel): The database model class.
+            **kwargs: The arguments of `AsyncDbEngine.find_many`.
+
+        Returns:
+            The result of `AsyncDbEngine.find_many`, with the objects already in the
+            identity map in place of the ones read again.
+        """
+        result = await self._engine.find_many(Model=Model, **kwargs)
+        return self._merge_result(result=result, kwargs=kwargs)
+
+    async def flush(self) -> dict[str, DbResponse]:
+        """
+        Save the pending objects, with one bulk write per collection.
+
+        Returns:
+            dict[str, DbResponse]: The responses of the bulk writes keyed by
+                collection name, as returned by `save_all`.
+        """
+        objs = self._pop_pending()
+        if not objs:
+            return {}
+        try:
+            response = await self._engine.save_all(objs, populate=self._populate)
+        except Exception:
+            self._restore_pending(objs)
+            raise
+        self._register_saved(objs)
+        return response
+
+
+class Session(_SessionBase):
+    """
+    Identity map and unit of work for DbEngine, usually scoped to one request.
+
+    Objects read through the session are kept in an identity map keyed by collection
+    and id: reading the same document again, directly or as a populated reference,
+    returns the object already loaded, and lookups by id are answered from the map
+    without a round trip. Objects passed to `add` are saved together by `flush`, with
+    one bulk write per collection, which happens when the `with` block exits without
+    an error.
+    """
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.flush()
+
+    def get(self, Model: type[DbModel], id: str | ObjectId) -> DbModel | None:
+        """
+        Get an object by id, from the identity map or from the database.
+
+        Args:
+            Model (DbModel): The database model class.
+            id (str | ObjectId): The id of the object.
+
+        Returns:
+            DbModel | None: The object, or None if it does not exist.
+        """
+        obj = self._identity(Model, id)
+        if obj is not None:
+            return obj
+        return self.find_one(Model, raw_query={"_id": ObjectId(id)})
+
+    def find_one(self, Model: type[DbModel], **kwargs) -> DbModel | None:
+        """
+        Find one object with `DbEngine.find_one`, through the identity map.
+
+        Args:
+            Model (DbModel): The database model class.
+            **kwargs: The arguments of `DbEngine.find_one`. A query by id only,
+                without populate, is answered from the identity map when possible.
+
+        Returns:
+            DbModel | None: The object, or None if no document matches.
+        """
+        obj = self._mapped_find_one(Model=Model, kwargs=kwargs)
+        if obj is not None:
+            return obj
+        result = self._engine.find_one(Model=Model, **kwargs)
+        return self._merge_result(result=result, kwargs=kwargs)
+
+    def find_many(self, Model: type[DbModel], **kwargs):
+        """
+        Find objects with `DbEngine.find_many`, through the identity map.
+
+        Args:
+            Model (DbModel): The database model class.
+            **kwargs: The arguments of `DbEngine.find_many`.
+
+        Returns:
+            The result of `DbEngine.find_many`, with the objects already in the
+            identity map in place of the ones read again.
+        """
+        result = self._engine.find_many(Model=Model, **kwargs)
+        return self._merge_result(result=result, kwargs=kwargs)
+
+    def flush(self) -> dict[str, DbResponse]:
+        """
+        Save the pending objects, with one bulk write per collection.
+
+        Returns:
+            dict[str, DbResponse]: The responses of the bulk writes keyed by
+                collection name, as returned by `save_all`.
+        """
+        objs = self._pop_pending()
+        if not objs:
+            return {}
+        try:
+            response = self._engine.save_all(objs, populate=self._populate)
+        except Exception:
+            self._restore_pending(objs)
+            raise
+        self._register_saved(objs)
+        return response
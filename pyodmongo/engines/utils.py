@@ -4,17 +4,126 @@ from ..models.id_model import Id
 from ..models.db_model import MainBaseModel
 from ..models.db_field_info import DbField
 from ..models.db_decimal import DbDecimal
-from ..services.reference_pipeline import resolve_reference_pipeline
+from ..services.reference_pipeline import reference_pipeline_template
+from ..services.projection import (
+    field_paths,
+    projection_plan,
+    project_lookups,
+    _collapse_paths,
+    partial_model,
+)
+from ..services.hydration import construct_model, validate_models
 from ..services.verify_subclasses import is_subclass
 from decimal import Decimal
 from bson import Decimal128
 
 
+MAX_DOCS_PER_PAGE = 1000
+_MISSING = object()
+
+
+def _reference_encoder(value):
+    try:
+        return ObjectId(value.id)
+    except AttributeError:
+        return ObjectId(value)
+
+
+def _reference_list_encoder(value):
+    try:
+        return [ObjectId(o.id) for o in value]
+    except AttributeError:
+        return [ObjectId(o) for o in value]
+
+
+def _id_encoder(value):
+    return ObjectId(value) if ObjectId.is_valid(value) else value
+
+
+def _id_list_encoder(value):
+    return [ObjectId(o) for o in value if ObjectId.is_valid(o)]
+
+
+def _decimal_encoder(value):
+    return Decimal128(str(value))
+
+
+def _decimal_list_encoder(value):
+    return [Decimal128(str(o)) for o in value]
+
+
+def _field_encoder(db_field_info: DbField, populate: bool):
+    """
+    Selects the function that converts the values of a field to their MongoDB form.
+
+    Args:
+        db_field_info (DbField): The database metadata of the field.
+        populate (bool): If True, referenced models are embedded instead of saved by id.
+
+    Returns:
+        Callable | None: The encoder for non-None values, or None when values are
+                         stored as they are.
+    """
+    is_list = db_field_info.is_list
+    if db_field_info.has_model_fields:
+        if db_field_info.by_reference and not populate:
+            return _reference_list_encoder if is_list else _reference_encoder
+        if is_list:
+            return lambda value: [
+                consolidate_dict(obj=v, dct={}, populate=populate) for v in value
+            ]
+        return lambda value: consolidate_dict(obj=value, dct={}, populate=populate)
+    if db_field_info.field_type == Id:
+        return _id_list_encoder if is_list else _id_encoder
+    if db_field_info.field_type == Decimal or db_field_info.field_type == DbDecimal:
+        return _decimal_list_encoder if is_list else _decimal_encoder
+    return None
+
+
+def _serializer_plan(cls: type[MainBaseModel], populate: bool):
+    """
+    Returns the serialization plan of a model class, compiling it on first use.
+
+    Args:
+        cls (type[MainBaseModel]): The PyODMongo model class.
+        populate (bool): If True, referenced models are embedded instead of saved by id.
+
+    Returns:
+        list[tuple[str, str, Callable | None]]: For each model field, its name, its
+                                                database alias and its encoder.
+
+    Description:
+        The plan resolves once per class the `DbField` metadata lookup and the type
+        dispatch that would otherwise be repeated for every field of every saved
+        object. It is cached on the class itself, so subclasses compile their own.
+    """
+    plans = cls.__dict__.get("__pyodmongo_serializer_plans__")
+    if plans is None:
+        plans = {}
+        setattr(cls, "__pyodmongo_serializer_plans__", plans)
+    plan = plans.get(populate)
+    if plan is not None:
+        return plan
+    plan = []
+    for field in cls.model_fields:
+        try:
+            db_field_info: DbField = getattr(cls, field)
+        except AttributeError:
+            if is_subclass(class_to_verify=cls, subclass=BaseModel):
+                raise TypeError(
+                    f"The {cls.__name__} class inherits from Pydantic's BaseModel class. Try switching to PyODMongo's MainBaseModel class"
+                )
+        encoder = _field_encoder(db_field_info=db_field_info, populate=populate)
+        plan.append((field, db_field_info.field_alias, encoder))
+    plans[populate] = plan
+    return plan
+
+
 def consolidate_dict(obj: MainBaseModel, dct: dict, populate: bool):
     """
-    Recursively consolidates the attributes of a Pydantic model into a dictionary,
-    handling nested models, list fields, and references appropriately based on the model's
-    field specifications.
+    Consolidates the attributes of a Pydantic model into a dictionary, handling nested
+    models, list fields, and references appropriately based on the model's field
+    specifications.
 
     Args:
         obj (MainBaseModel): The PyODMongo model instance from which to extract data.
@@ -26,88 +135,208 @@ def consolidate_dict(obj: MainBaseModel, dct: dict, populate: bool):
               of MongoDB ObjectId conversions and nested structures.
 
     Description:
-        This function iterates over each field of the provided model instance, extracting the
-        value and associated metadata. Depending on whether the field contains model data,
-        is a list, or is a reference, the function appropriately processes the value to fit
-        MongoDB storage requirements, including converting to ObjectIds where necessary.
-        The function is recursive for nested models and lists of models.
-    """
-    for field, field_info in obj.__class__.model_fields.items():
-        value = getattr(obj, field)
-        try:
-            db_field_info: DbField = getattr(obj.__class__, field)
-        except AttributeError:
-            if is_subclass(class_to_verify=obj.__class__, subclass=BaseModel):
-                raise TypeError(
-                    f"The {obj.__class__.__name__} class inherits from Pydantic's BaseModel class. Try switching to PyODMongo's MainBaseModel class"
-                )
-        alias = db_field_info.field_alias
-        has_model_fields = db_field_info.has_model_fields
-        is_list = db_field_info.is_list
-        by_reference = db_field_info.by_reference and not populate
-        if has_model_fields:
-            if value is None:
-                dct[alias] = None
-                continue
-            if not is_list:
-                if by_reference:
-                    try:
-                        dct[alias] = ObjectId(value.id)
-                    except AttributeError:
-                        dct[alias] = ObjectId(value)
-                else:
-                    dct[alias] = {}
-                    consolidate_dict(obj=value, dct=dct[alias], populate=populate)
-            else:
-                if by_reference:
-                    try:
-                        dct[alias] = [ObjectId(o.id) for o in value]
-                    except AttributeError:
-                        dct[alias] = [ObjectId(o) for o in value]
-                else:
-                    dct[alias] = []
-                    for v in value:
-                        obj_lst_elem = {}
-                        consolidate_dict(obj=v, dct=obj_lst_elem, populate=populate)
-                        dct[alias].append(obj_lst_elem)
-        else:
-            if db_field_info.field_type == Id and value is not None:
-                if is_list:
-                    dct[alias] = [ObjectId(o) for o in value if ObjectId.is_valid(o)]
-                else:
-                    dct[alias] = ObjectId(value) if ObjectId.is_valid(value) else value
-            elif (
-                db_field_info.field_type == Decimal
-                or db_field_info.field_type == DbDecimal
-            ) and value is not None:
-                if is_list:
-                    dct[alias] = [Decimal128(str(o)) for o in value]
-                else:
-                    dct[alias] = Decimal128(str(value))
-            else:
-                dct[alias] = value
+        This function applies the serialization plan of the model class (see
+        `_serializer_plan`), a flat list of per-field encoders compiled once per class.
+        Depending on whether the field contains model data, is a list, or is a
+        reference, the encoder processes the value to fit MongoDB storage requirements,
+        including converting to ObjectIds where necessary. Nested models and lists of
+        models are consolidated with the plan of their own class. Required fields
+        left unset, as by `construct_model` for documents that lack them, are skipped.
+    """
+    values = obj.__dict__
+    for field, alias, encoder in _serializer_plan(cls=obj.__class__, populate=populate):
+        value = values.get(field, _MISSING)
+        if value is _MISSING:
+            continue
+        dct[alias] = value if value is None or encoder is None else encoder(value)
     return dct
 
 
-def _skip_and_limit_stages(current_page: int, docs_per_page: int):
+def _diff_dict(old: dict, new: dict, prefix: str, to_set: dict, to_unset: dict):
+    for key, value in new.items():
+        path = prefix + key
+        if key not in old:
+            to_set[path] = value
+            continue
+        old_value = old[key]
+        if (
+            isinstance(value, dict)
+            and isinstance(old_value, dict)
+            and value
+            and old_value
+        ):
+            _diff_dict(
+                old=old_value,
+                new=value,
+                prefix=path + ".",
+                to_set=to_set,
+                to_unset=to_unset,
+            )
+        elif type(old_value) is not type(value) or old_value != value:
+            to_set[path] = value
+    for key in old:
+        if key not in new:
+            to_unset[prefix + key] = ""
+
+
+def changed_fields(old: dict, new: dict):
+    """
+    Computes the minimal update between two consolidated documents.
+
+    Args:
+        old (dict): The document as it was stored, as returned by `consolidate_dict`.
+        new (dict): The current document, as returned by `consolidate_dict`.
+
+    Returns:
+        tuple[dict, dict]: The dotted paths to be set with their new values and the
+                           dotted paths to be unset.
+
+    Description:
+        Embedded documents are compared key by key, so a change deep inside a nested
+        model produces a single dotted path. Lists and other values are compared as
+        a whole and replaced entirely when they differ.
+    """
+    to_set = {}
+    to_unset = {}
+    _diff_dict(old=old, new=new, prefix="", to_set=to_set, to_unset=to_unset)
+    return to_set, to_unset
+
+
+def without_none(dct: dict) -> dict:
+    """
+    Removes the None values of a consolidated document, also in embedded documents.
+
+    Args:
+        dct (dict): The document, as returned by `consolidate_dict`.
+
+    Returns:
+        dict: A new document without the keys whose values are None.
+    """
+    return {
+        key: without_none(value) if isinstance(value, dict) else value
+        for key, value in dct.items()
+        if value is not None
+    }
+
+
+def hydrate_models(
+    Model: type[MainBaseModel], docs: list[dict], partial: bool, trusted: bool
+) -> list[MainBaseModel]:
+    """
+    Builds the model instances of a batch of documents read from the database.
+
+    Args:
+        Model (type[MainBaseModel]): The database model class.
+        docs (list[dict]): The documents read from the database.
+        partial (bool): If True, the documents were read with a projection and the
+                        instances are built with the partial model of `Model`.
+        trusted (bool): If True, the instances are built without validation by
+                        `construct_model`; otherwise the batch is validated in a
+                        single call by `validate_models`.
+
+    Returns:
+        list[MainBaseModel]: The model instances, with a snapshot of their stored state
+                             if the model tracks changes.
+
+    Description:
+        This is a module-level function of picklable arguments so that engines can run
+        it in a process pool as well as in a thread pool.
+    """
+    if partial:
+        Model = partial_model(Model)
+    if trusted:
+        objs = [construct_model(cls=Model, doc=doc) for doc in docs]
+    else:
+        objs = validate_models(cls=Model, docs=docs)
+    if Model._track_changes:
+        for obj in objs:
+            obj._snapshot = consolidate_dict(obj=obj, dct={}, populate=False)
+    return objs
+
+
+def id_from_query(query: dict) -> ObjectId | None:
+    """
+    Extracts the id of a query that selects a single document by `_id` equality only.
+
+    Args:
+        query (dict): The query dictionary, like `(Model.id == id).to_dict()`.
+
+    Returns:
+        ObjectId | None: The id, or None if the query has any other condition.
+    """
+    if len(query) != 1 or "_id" not in query:
+        return None
+    value = query["_id"]
+    if isinstance(value, dict) and len(value) == 1 and "$eq" in value:
+        value = value["$eq"]
+    return value if isinstance(value, ObjectId) else None
+
+
+def _skip_and_limit_stages(
+    current_page: int, docs_per_page: int, read_ahead: bool = False
+):
     """
     Add pagination stages to the aggregation pipeline.
 
     Args:
         current_page (int): The current page number.
         docs_per_page (int): The number of documents per page.
+        read_ahead (bool): If True, the limit reads one more document than the page,
+                           to tell whether there is a next page.
     """
-    max_docs_per_page = 1000
     current_page = 1 if current_page <= 0 else current_page
-    docs_per_page = (
-        max_docs_per_page if docs_per_page > max_docs_per_page else docs_per_page
-    )
+    docs_per_page = min(docs_per_page, MAX_DOCS_PER_PAGE)
     skip = (docs_per_page * current_page) - docs_per_page
     skip_stage = [{"$skip": skip}]
-    limit_stage = [{"$limit": docs_per_page}]
+    limit_stage = [{"$limit": docs_per_page + 1 if read_ahead else docs_per_page}]
     return skip_stage, limit_stage
 
 
+def _sort_depends_on_paths(sort: dict, paths: list[str]) -> bool:
+    """
+    Checks whether any sort key reads, or contains, one of the given paths.
+
+    Args:
+        sort (dict): The sort dictionary.
+        paths (list[str]): The dotted document paths.
+
+    Returns:
+        bool: True if sorting before or after changing those paths may differ.
+    """
+    for key in sort:
+        for path in paths:
+            if key == path or key.startswith(path + ".") or path.startswith(key + "."):
+                return True
+    return False
+
+
+def _projection_stages(
+    Model, paths: list[str] | None, populate_db_fields: list[DbField] | None, stages
+):
+    """
+    Projects the documents and the populate stages on the selected paths.
+
+    Args:
+        Model: The PyODMongo model class for the query.
+        paths (list[str] | None): The dotted paths of the selected fields, or None to
+                                  read entire documents.
+        populate_db_fields: A list of specific `DbField`s to populate, or None for all.
+        stages (list[dict]): The populate stages.
+
+    Returns:
+        tuple[list[dict], list[dict]]: The `$project` stage of the documents (empty
+                                       without paths) and the populate stages with the
+                                       projections of the referenced documents.
+    """
+    if not paths:
+        return [], stages
+    projection, sub_plans = projection_plan(
+        cls=Model, paths=paths, populate_db_fields=populate_db_fields
+    )
+    stages = project_lookups(stages=stages, sub_plans=sub_plans)
+    return [{"$project": projection}], stages
+
+
 def mount_base_pipeline(
     Model,
     query: dict,
@@ -119,6 +348,11 @@ def mount_base_pipeline(
     current_page: int,
     docs_per_page: int,
     no_paginate_limit: int | None,
+    populate_strategy: str = "unwind",
+    fields: list[DbField] | None = None,
+    keyset: bool = False,
+    facet: bool = False,
+    read_ahead: bool = False,
 ):
     """
     Mounts a base MongoDB aggregation pipeline for find operations.
@@ -128,6 +362,10 @@ def mount_base_pipeline(
     based on the provided parameters. It serves as the core pipeline
     builder for find queries.
 
+    When populating, the `$sort`, `$skip` and `$limit` stages are placed before
+    the populate `$lookup` stages unless a sort key depends on a populated
+    field, so only the documents of the requested page are joined.
+
     Args:
         Model: The PyODMongo model class for the query.
         query: The MongoDB query dictionary for the `$match` stage.
@@ -143,27 +381,120 @@ def mount_base_pipeline(
         docs_per_page: The number of documents per page for pagination.
         no_paginate_limit: The maximum number of documents to return when
                            pagination is disabled.
+        populate_strategy: How references are populated, "unwind" or "array"
+                           (see `POPULATE_STRATEGIES`).
+        fields: The `DbField`s to read. If given, `$project` stages select them in
+                the documents and in the populated references.
+        keyset: If True, the page is read by keyset: the sort keys are also
+                projected, so that the pagination tokens can be built from them,
+                and sorting by a populated field raises a ValueError.
+        facet: If True, the stages after the `$match` (and the custom pipeline)
+               are wrapped in a `$facet` with a `docs` branch and a `total`
+               branch that counts the matching documents, so that a page and the
+               total are read in a single aggregation. The page is returned as one
+               document, limited to 16MB.
+        read_ahead: If True, the page reads one more document than `docs_per_page`,
+                    so that whether there is a next page is known without counting.
         is_find_one: If True, adds a `$limit: 1` stage to the pipeline,
                      optimizing the query for a single document.
 
     Returns:
         A list representing the complete MongoDB aggregation pipeline.
     """
+    if facet:
+        stages = mount_base_pipeline(
+            Model=Model,
+            query=query,
+            sort=sort,
+            populate=populate,
+            pipeline=pipeline,
+            populate_db_fields=populate_db_fields,
+            paginate=paginate,
+            current_page=current_page,
+            docs_per_page=docs_per_page,
+            no_paginate_limit=no_paginate_limit,
+            populate_strategy=populate_strategy,
+            fields=fields,
+            keyset=keyset,
+            read_ahead=read_ahead,
+        )
+        count_from = 1 + len(pipeline or Model._pipeline)
+        return stages[:count_from] + [
+            {
+                "$facet": {
+                    "docs": stages[count_from:],
+                    "total": [{"$count": "count"}],
+                }
+            }
+        ]
     match_stage = [{"$match": query}]
     sort_stage = [{"$sort": sort}] if sort != {} else []
     skip_stage = []
     limit_stage = [{"$limit": no_paginate_limit}] if no_paginate_limit else []
     pipeline = pipeline or Model._pipeline
+    paths = field_paths(fields=fields) if fields else None
+    if paths and keyset:
+        paths = paths + list(sort)
     if paginate:
         skip_stage, limit_stage = _skip_and_limit_stages(
-            current_page=current_page, docs_per_page=docs_per_page
+            current_page=current_page,
+            docs_per_page=docs_per_page,
+            read_ahead=read_ahead,
         )
     if pipeline:
-        return match_stage + pipeline + sort_stage + skip_stage + limit_stage
-    if populate:
-        reference_stage = resolve_reference_pipeline(
-            cls=Model, pipeline=[], populate_db_fields=populate_db_fields
+        project_stage = [{"$project": _collapse_paths(paths)}] if paths else []
+        return (
+            match_stage
+            + pipeline
+            + sort_stage
+            + skip_stage
+            + limit_stage
+            + project_stage
         )
-        return match_stage + reference_stage + sort_stage + skip_stage + limit_stage
-    else:
-        return match_stage + sort_stage + skip_stage + limit_stage
+    if not populate:
+        project_stage, _ = _projection_stages(
+            Model=Model, paths=paths, populate_db_fields=populate_db_fields, stages=[]
+        )
+        return match_stage + sort_stage + skip_stage + limit_stage + project_stage
+    reference_stage, populated_paths = reference_pipeline_template(
+        cls=Model,
+        populate_db_fields=populate_db_fields,
+        populate_strategy=populate_strategy,
+    )
+    sort_after_populate = _sort_depends_on_paths(sort=sort, paths=populated_paths)
+    if keyset and sort_after_populate:
+        raise ValueError("Keyset pagination cannot sort by a populated field")
+    # The populate stages never drop documents, so the page can be cut before
+    # joining. Only "$group" (used to rebuild unwound arrays) loses the order.
+    regroup_sort_stage = (
+        sort_stage
+        if not sort_after_populate
+        and any("$group" in stage for stage in reference_stage)
+        else []
+    )
+    if paths and (sort_after_populate or regroup_sort_stage):
+        paths = paths + list(sort)
+    project_stage, reference_stage = _projection_stages(
+        Model=Model,
+        paths=paths,
+        populate_db_fields=populate_db_fields,
+        stages=reference_stage,
+    )
+    if sort_after_populate:
+        return (
+            match_stage
+            + project_stage
+            + reference_stage
+            + sort_stage
+            + skip_stage
+            + limit_stage
+        )
+    return (
+        match_stage
+        + sort_stage
+        + skip_stage
+        + limit_stage
+        + project_stage
+        + reference_stage
+        + regroup_sort_stage
+    )
@@ -1,4 +1,4 @@
-from pydantic import ConfigDict
+from pydantic import ConfigDict, model_validator
 from .id_model import Id
 from datetime import datetime
 from typing import ClassVar
@@ -41,14 +41,28 @@ class DbModel(BaseModel, metaclass=DbMeta):
                                    serialization and deserialization behaviors.
         _pipeline (ClassVar): Class variable to store pipeline operations for
                               reference resolution.
+        _track_changes (ClassVar): If True, instances loaded by the engines keep a
+                                   snapshot of their stored state so that saves only
+                                   send the fields that changed.
+        _read_cache (ClassVar): An optional `ReadCache` of the documents read by
+                                `find_one` by id, invalidated by the writes of the
+                                engines.
+        _query_cache_ttl (ClassVar): If set, the results of `find_one` and
+                                     `find_many` are cached by the engines for
+                                     this many seconds, keyed by their pipeline,
+                                     and invalidated by the writes of the engines
+                                     to any collection they read.
+        _snapshot (dict | None): The stored state of the instance when it was
+                                 loaded or last saved, if changes are tracked.
 
     Methods:
-        __init__(**attrs): Initializes a new instance of DbModel, applying
-                           transformations to nested dictionary fields to clean
-                           up empty values.
-        __remove_empty_dict(dct): Recursively removes empty dictionaries from
-                                  nested dictionary fields, aiding in the
-                                  cleanup process during initialization.
+        _normalize_document(data): Model-level pre-validator that moves '_id' to
+                                   'id' and cleans up empty nested dictionaries,
+                                   so that stored documents validate the same way
+                                   through `__init__` and through a `TypeAdapter`.
+        __replace_empty_dicts(data): Recursively removes empty dictionaries from
+                                     nested dictionary fields, aiding in the
+                                     cleanup process during validation.
     """
 
     id: Id | None = None
@@ -57,8 +71,13 @@ class DbModel(BaseModel, metaclass=DbMeta):
     model_config = ConfigDict(populate_by_name=True)
     _pipeline: ClassVar = []
     _default_language: ClassVar = None
+    _track_changes: ClassVar = False
+    _read_cache: ClassVar = None
+    _query_cache_ttl: ClassVar = None
+    _snapshot: dict | None = None
 
-    def __replace_empty_dicts(self, data):
+    @classmethod
+    def __replace_empty_dicts(cls, data):
         """
         Recursively traverses a dictionary (or a list of dictionaries) and:
         - Replaces empty dictionaries with None.
@@ -68,30 +87,46 @@ class DbModel(BaseModel, metaclass=DbMeta):
             data (dict | list): The dictionary or list to process.
 
         Returns:
-            dict | list: The processed dictionary or list with modifications.
+            dict | list: A processed copy of the dictionary, or the data unchanged if
+                         it is not a dictionary. The input is never modified.
         """
 
         if isinstance(data, dict):
+            data = dict(data)
             if "_id" in data:
                 data["id"] = data.pop("_id")
             for key, value in data.items():
-                if isinstance(value, dict):
-                    if not value:
-                        data[key] = None
-                    else:
-                        self.__replace_empty_dicts(value)
-                elif isinstance(value, list):
-                    data[key] = [
-                        (
-                            self.__replace_empty_dicts(item)
-                            if isinstance(item, dict)
-                            else item
-                        )
-                        for item in value
-                        if not (isinstance(item, dict) and not item)
-                    ]
+                if not isinstance(value, (dict, list)):
+                    continue
+                if isinstance(value, list):
+                    if any(isinstance(item, dict) for item in value):
+                        data[key] = [
+                            (
+                                cls.__replace_empty_dicts(item)
+                                if isinstance(item, dict)
+                                else item
+                            )
+                            for item in value
+                            if not (isinstance(item, dict) and not item)
+                        ]
+                elif not value:
+                    data[key] = None
+                else:
+                    data[key] = cls.__replace_empty_dicts(value)
         return data
 
-    def __init__(self, **attrs):
-        self.__replace_empty_dicts(attrs)
-        super().__init__(**attrs)
+    @model_validator(mode="before")
+    @classmethod
+    def _normalize_document(cls, data):
+        """
+        Normalizes the input of the model before validation.
+
+        Args:
+            data (Any): The input of the model, usually a dictionary of attributes
+                        or a document read from the database.
+
+        Returns:
+            Any: A copy of the input with '_id' moved to 'id' and empty dictionaries
+                 replaced by None, or the input unchanged if it is not a dictionary.
+        """
+        return cls.__replace_empty_dicts(data)
@@ -0,0 +1,27 @@
+from pydantic import BaseModel
+
+
+class IndexPlan(BaseModel):
+    """
+    A class representing the changes needed to converge the indexes of a collection
+    with the indexes declared by its models.
+
+    Attributes:
+        collection (str): The name of the collection.
+        create (list[str]): The names of the declared indexes missing in the collection.
+        drop (list[str]): The names of the existing indexes that are no longer declared.
+        rebuild (list[str]): The names of the indexes whose keys or options changed
+                             and must be dropped and created again.
+        applied (bool): Whether the plan was applied to the database or only computed
+                        (dry run).
+    """
+
+    collection: str
+    create: list[str] = []
+    drop: list[str] = []
+    rebuild: list[str] = []
+    applied: bool = False
+
+    @property
+    def is_empty(self) -> bool:
+        return not (self.create or self.drop or self.rebuild)
@@ -17,6 +17,11 @@ class ResponsePaginate(BaseModel):
         docs (list): A list containing the documents of the current page. The specific
                      type and structure of these documents will depend on the application's
                      data model.
+        count_strategy (str): How `docs_quantity` was obtained: "exact", "facet",
+                              "estimated" (collection metadata), "cached" (a recent
+                              count of the same query) or "none" (not counted, in
+                              which case `page_quantity` and `docs_quantity` are None).
+        has_next (bool | None): Whether there is a page after the current one.
 
     This model can be used to standardize the response format for paginated data across
     different parts of an application, ensuring consistency and ease of integration
@@ -24,6 +29,30 @@ class ResponsePaginate(BaseModel):
     """
 
     current_page: int
-    page_quantity: int
-    docs_quantity: int
+    page_quantity: int | None
+    docs_quantity: int | None
+    docs: list
+    count_strategy: str = "exact"
+    has_next: bool | None = None
+
+
+class ResponseKeysetPaginate(BaseModel):
+    """
+    A model for representing pages read by keyset, with `find_many(paginate="keyset")`.
+    Instead of a page number, each page carries opaque tokens built from the sort
+    values and the `_id` of its first and last documents, so that reading the next or
+    the previous page costs the same however deep it is.
+
+    Attributes:
+        docs_per_page (int): The maximum number of documents in a page.
+        previous_token (str | None): The token to pass as `before` to read the
+                                     previous page, or None on the first page.
+        next_token (str | None): The token to pass as `after` to read the next page,
+                                 or None on the last page.
+        docs (list): A list containing the documents of the current page.
+    """
+
+    docs_per_page: int
+    previous_token: str | None = None
+    next_token: str | None = None
     docs: list
@@ -0,0 +1,261 @@
+from bson import decode, encode
+from bson.codec_options import CodecOptions
+from collections import OrderedDict
+from threading import Lock
+from time import time
+from typing import Protocol, runtime_checkable
+import os
+import sqlite3
+
+
+@runtime_checkable
+class CacheBackend(Protocol):
+    """
+    Interface of the stores used by the caches of the engines.
+
+    Values are BSON documents: backends serialize them on `set` and return a new
+    decoded copy on every `get`, so cached documents are never shared between
+    readers. Keys are strings, namespaced by the caches with a prefix such as the
+    collection name, so one backend can be shared by several caches and, for
+    backends like `SqliteCacheBackend`, by several processes.
+    """
+
+    def get(self, key: str, codec_options: CodecOptions | None = None) -> dict | None:
+        """
+        Returns the document of a key, or None if it is missing or expired.
+        """
+
+    def get_many(
+        self, keys: list[str], codec_options: CodecOptions | None = None
+    ) -> dict[str, dict]:
+        """
+        Returns the documents of the keys that are cached, keyed by key.
+        """
+
+    def set(self, key: str, document: dict, ttl: float | None = None):
+        """
+        Stores a document, expiring after `ttl` seconds if given.
+        """
+
+    def set_many(self, documents: dict[str, dict], ttl: float | None = None):
+        """
+        Stores several documents, expiring after `ttl` seconds if given.
+        """
+
+    def delete(self, keys: list[str]):
+        """
+        Removes the documents of the keys.
+        """
+
+    def clear(self, prefix: str = ""):
+        """
+        Removes the documents whose keys start with `prefix`, or all of them.
+        """
+
+    def __len__(self) -> int:
+        """
+        Returns the number of stored documents, including expired ones not yet purged.
+        """
+
+
+def _expires_at(ttl: float | None) -> float | None:
+    return None if ttl is None else time() + ttl
+
+
+class MemoryCacheBackend:
+    """
+    In-process LRU cache backend.
+
+    Attributes:
+        max_size (int): The maximum number of documents. The least recently used
+                        document is evicted when a new one is stored.
+        evictions (int): The number of documents evicted to respect `max_size`.
+    """
+
+    def __init__(self, max_size: int = 1024):
+        if max_size < 1:
+            raise ValueError("max_size must be greater than zero")
+        self.max_size = max_size
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str, codec_options: CodecOptions | None = None) -> dict | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at is not None and expires_at <= time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+        return decode(value, codec_options=codec_options or CodecOptions())
+
+    def get_many(
+        self, keys: list[str], codec_options: CodecOptions | None = None
+    ) -> dict[str, dict]:
+        documents = {}
+        for key in keys:
+            document = self.get(key, codec_options=codec_options)
+            if document is not None:
+                documents[key] = document
+        return documents
+
+    def set(self, key: str, document: dict, ttl: float | None = None):
+        self.set_many(documents={key: document}, ttl=ttl)
+
+    def set_many(self, documents: dict[str, dict], ttl: float | None = None):
+        expires_at = _expires_at(ttl)
+        values = {key: encode(document) for key, document in documents.items()}
+        with self._lock:
+            for key, value in values.items():
+                self._entries[key] = (expires_at, value)
+                self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def delete(self, keys: list[str]):
+        with self._lock:
+            for key in keys:
+                self._entries.pop(key, None)
+
+    def clear(self, prefix: str = ""):
+        with self._lock:
+            if not prefix:
+                self._entries.clear()
+                return
+            for key in [key for key in self._entries if key.startswith(prefix)]:
+                del self._entries[key]
+
+
+class SqliteCacheBackend:
+    """
+    Cache backend stored in a SQLite database, shared by the processes of a host.
+
+    The database runs in WAL mode, so readers in other processes are not blocked by
+    writes. Expiration times are wall-clock timestamps, and expired documents are
+    purged every `purge_every` writes.
+
+    The connection is opened on first use and again in every process that uses the
+    backend, so a backend created at import time, like one declared in a model
+    class, can be used by the workers forked from the process that created it.
+
+    Attributes:
+        path (str): The path of the database file.
+        purge_every (int): The number of writes between purges of expired documents.
+    """
+
+    def __init__(self, path: str, purge_every: int = 1000):
+        self.path = path
+        self.purge_every = purge_every
+        self._writes = 0
+        self._lock = Lock()
+        self._pid = os.getpid()
+        self._connection = None
+        self._inherited_connections = []
+
+    def _connect(self) -> sqlite3.Connection:
+        """
+        Returns the connection of the current process, opening it if needed.
+
+        Returns:
+            sqlite3.Connection: The connection, to be used while holding `_lock`.
+        """
+        if self._pid != os.getpid():
+            # SQLite connections must not be used across fork(): a connection
+            # inherited from the parent process is kept open but never used.
+            if self._connection is not None:
+                self._inherited_connections.append(self._connection)
+            self._lock = Lock()
+            self._connection = None
+            self._pid = os.getpid()
+        if self._connection is None:
+            with self._lock:
+                if self._connection is None:
+                    connection = sqlite3.connect(
+                        self.path, check_same_thread=False, isolation_level=None
+                    )
+                    connection.execute("PRAGMA journal_mode=WAL")
+                    connection.execute(
+                        "CREATE TABLE IF NOT EXISTS pyodmongo_cache "
+                        "(key TEXT PRIMARY KEY, value BLOB NOT NULL, expires_at REAL)"
+                    )
+                    self._connection = connection
+        return self._connection
+
+    def __len__(self) -> int:
+        connection = self._connect()
+        with self._lock:
+            return connection.execute(
+                "SELECT COUNT(*) FROM pyodmongo_cache"
+            ).fetchone()[0]
+
+    def get(self, key: str, codec_options: CodecOptions | None = None) -> dict | None:
+        return self.get_many(keys=[key], codec_options=codec_options).get(key)
+
+    def get_many(
+        self, keys: list[str], codec_options: CodecOptions | None = None
+    ) -> dict[str, dict]:
+        if not keys:
+            return {}
+        placeholders = ", ".join("?" * len(keys))
+        connection = self._connect()
+        with self._lock:
+            rows = connection.execute(
+                "SELECT key, value FROM pyodmongo_cache WHERE key IN "
+                f"({placeholders}) AND (expires_at IS NULL OR expires_at > ?)",
+                [*keys, time()],
+            ).fetchall()
+        codec_options = codec_options or CodecOptions()
+        return {key: decode(value, codec_options=codec_options) for key, value in rows}
+
+    def set(self, key: str, document: dict, ttl: float | None = None):
+        self.set_many(documents={key: document}, ttl=ttl)
+
+    def set_many(self, documents: dict[str, dict], ttl: float | None = None):
+        expires_at = _expires_at(ttl)
+        rows = [
+            (key, encode(document), expires_at) for key, document in documents.items()
+        ]
+        connection = self._connect()
+        with self._lock:
+            connection.executemany(
+                "INSERT OR REPLACE INTO pyodmongo_cache (key, value, expires_at) "
+                "VALUES (?, ?, ?)",
+                rows,
+            )
+            self._writes += len(rows)
+            if self._writes >= self.purge_every:
+                self._writes = 0
+                connection.execute(
+                    "DELETE FROM pyodmongo_cache WHERE expires_at <= ?", (time(),)
+                )
+
+    def delete(self, keys: list[str]):
+        connection = self._connect()
+        with self._lock:
+            connection.executemany(
+                "DELETE FROM pyodmongo_cache WHERE key = ?", [(key,) for key in keys]
+            )
+
+    def clear(self, prefix: str = ""):
+        connection = self._connect()
+        with self._lock:
+            connection.execute(
+                "DELETE FROM pyodmongo_cache WHERE substr(key, 1, ?) = ?",
+                (len(prefix), prefix),
+            )
+
+    def close(self):
+        """
+        Closes the connection of the current process to the database, if it is open.
+        """
+        with self._lock:
+            if self._connection is not None and self._pid == os.getpid():
+                self._connection.close()
+                self._connection = None
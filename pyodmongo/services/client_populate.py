@@ -0,0 +1,109 @@
+from pydantic import BaseModel
+from ..models.db_field_info import DbField
+from .reference_pipeline import _paths_to_ref_ids
+
+
+def reference_paths(
+    cls: BaseModel, populate_db_fields: list[DbField] | None
+) -> list[list[DbField]]:
+    """
+    Lists the reference paths of a model class to be populated on the client.
+
+    Args:
+        cls (BaseModel): The model class of the documents.
+        populate_db_fields (list[DbField] | None): The reference fields to populate, or
+                                                   None to populate all of them.
+
+    Returns:
+        list[list[DbField]]: For each reference field, the `DbField`s from the root of
+                             the document down to the reference field.
+    """
+    return _paths_to_ref_ids(
+        cls=cls, paths=[], db_field_path=[], populate_db_fields=populate_db_fields
+    )
+
+
+def _reference_containers(docs: list[dict], db_field_path: list[DbField]):
+    containers = docs
+    for db_field in db_field_path[:-1]:
+        next_containers = []
+        for container in containers:
+            value = container.get(db_field.field_alias)
+            if db_field.is_list and isinstance(value, list):
+                next_containers += [v for v in value if isinstance(v, dict)]
+            elif isinstance(value, dict):
+                next_containers.append(value)
+        containers = next_containers
+    return containers
+
+
+def _is_reference_id(value) -> bool:
+    return value is not None and not isinstance(value, (dict, list))
+
+
+def collect_reference_ids(
+    docs: list[dict], paths: list[list[DbField]]
+) -> dict[type, list]:
+    """
+    Collects the ids referenced by a list of raw documents.
+
+    Args:
+        docs (list[dict]): The documents as returned by the database.
+        paths (list[list[DbField]]): The reference paths, as returned by `reference_paths`.
+
+    Returns:
+        dict[type, list]: The unique referenced ids keyed by the referenced model class.
+    """
+    ids_by_model = {}
+    for db_field_path in paths:
+        db_field = db_field_path[-1]
+        ids = ids_by_model.setdefault(db_field.field_type, {})
+        for container in _reference_containers(docs, db_field_path):
+            value = container.get(db_field.field_alias)
+            values = value if db_field.is_list and isinstance(value, list) else [value]
+            for ref_id in values:
+                if _is_reference_id(ref_id):
+                    ids[ref_id] = None
+    return {Model: list(ids) for Model, ids in ids_by_model.items() if ids}
+
+
+def stitch_references(
+    docs: list[dict],
+    paths: list[list[DbField]],
+    found: dict[type, dict],
+) -> list[dict]:
+    """
+    Replaces, in place, the referenced ids of raw documents with the referenced documents.
+
+    Args:
+        docs (list[dict]): The documents as returned by the database.
+        paths (list[list[DbField]]): The reference paths, as returned by `reference_paths`.
+        found (dict[type, dict]): The fetched documents keyed by their `_id`, keyed by
+                                  the referenced model class.
+
+    Returns:
+        list[dict]: The same documents, with the references populated.
+
+    Description:
+        Lists of references keep the order and duplicates of the stored ids. References
+        that were not found are dropped from lists and set to None otherwise, as with the
+        "array" populate strategy. Values that are not ids, such as documents embedded
+        by a save with `populate=True`, are left untouched.
+    """
+    for db_field_path in paths:
+        db_field = db_field_path[-1]
+        alias = db_field.field_alias
+        found_docs = found.get(db_field.field_type, {})
+        for container in _reference_containers(docs, db_field_path):
+            if alias not in container:
+                continue
+            value = container[alias]
+            if db_field.is_list and isinstance(value, list):
+                container[alias] = [
+                    found_docs[ref_id] if _is_reference_id(ref_id) else ref_id
+                    for ref_id in value
+                    if not _is_reference_id(ref_id) or ref_id in found_docs
+                ]
+            elif _is_reference_id(value):
+                container[alias] = found_docs.get(value)
+    return docs
@@ -0,0 +1,238 @@
+from pydantic import BaseModel, TypeAdapter
+from typing import Any, Callable, Union, get_args, get_origin
+from types import NoneType, UnionType
+from datetime import datetime
+from decimal import Decimal
+from bson import ObjectId, Decimal128
+from ..models.id_model import Id
+from ..models.db_decimal import DbDecimal
+from ..models.db_field_info import DbField
+
+
+_object_setattr = object.__setattr__
+_MISSING = object()
+_IMMUTABLE_TYPES = (NoneType, str, int, float, bool, tuple, frozenset)
+_PLAIN_TYPES = (str, int, float, bool, datetime, dict, list, Any, NoneType)
+
+
+def _is_plain(annotation: Any) -> bool:
+    if annotation in _PLAIN_TYPES:
+        return True
+    origin = get_origin(annotation)
+    if origin in (list, dict, Union, UnionType):
+        return all(_is_plain(arg) for arg in get_args(annotation))
+    return False
+
+
+def _may_contain_dicts(annotation: Any) -> bool:
+    if annotation in (dict, list, Any):
+        return True
+    return any(_may_contain_dicts(arg) for arg in get_args(annotation))
+
+
+def _empty_dicts_converter(value):
+    if isinstance(value, list):
+        return [
+            _empty_dicts_converter(item) if isinstance(item, dict) else item
+            for item in value
+            if not (isinstance(item, dict) and not item)
+        ]
+    if not isinstance(value, dict):
+        return value
+    if not value:
+        return None
+    if "_id" in value:
+        value["id"] = value.pop("_id")
+    for key, item in value.items():
+        if isinstance(item, (dict, list)):
+            value[key] = _empty_dicts_converter(item)
+    return value
+
+
+def _id_converter(value):
+    return str(value) if isinstance(value, ObjectId) else value
+
+
+def _db_decimal_converter(value):
+    return DbDecimal(value) if isinstance(value, Decimal128) else value
+
+
+def _decimal_converter(value):
+    return value.to_decimal() if isinstance(value, Decimal128) else value
+
+
+def _model_converter(Model: type[BaseModel]):
+    def convert(value):
+        if isinstance(value, dict):
+            return construct_model(Model, value) if value else None
+        return _id_converter(value)
+
+    return convert
+
+
+def _list_converter(convert):
+    def convert_list(value):
+        if not isinstance(value, list):
+            return convert(value)
+        return [
+            convert(item) if item is not None else item
+            for item in value
+            if not (isinstance(item, dict) and not item)
+        ]
+
+    return convert_list
+
+
+def _field_converter(db_field: DbField, annotation: Any):
+    """
+    Selects the function that converts the stored values of a field to Python values.
+
+    Args:
+        db_field (DbField): The database metadata of the field.
+        annotation (Any): The type annotation of the field.
+
+    Returns:
+        Callable | None: The converter for non-None values, or None when stored values
+                         are used as they are.
+    """
+    if db_field.has_model_fields:
+        convert = _model_converter(Model=db_field.field_type)
+    elif db_field.field_type == Id:
+        convert = _id_converter
+    elif db_field.field_type == DbDecimal:
+        convert = _db_decimal_converter
+    elif db_field.field_type == Decimal:
+        convert = _decimal_converter
+    elif _is_plain(annotation):
+        return _empty_dicts_converter if _may_contain_dicts(annotation) else None
+    else:
+        return TypeAdapter(annotation).validate_python
+    return _list_converter(convert) if db_field.is_list else convert
+
+
+def _private_defaults(cls: type[BaseModel]):
+    private_attributes = cls.__private_attributes__
+    if not private_attributes:
+        return lambda: None
+    defaults = {name: attr.get_default() for name, attr in private_attributes.items()}
+    if all(isinstance(value, _IMMUTABLE_TYPES) for value in defaults.values()):
+        return defaults.copy
+    return lambda: {
+        name: attr.get_default() for name, attr in private_attributes.items()
+    }
+
+
+def construction_plan(cls: type[BaseModel]) -> tuple[list, Callable]:
+    """
+    Returns the construction plan of a model class, compiling it on first use.
+
+    Args:
+        cls (type[BaseModel]): The PyODMongo model class.
+
+    Returns:
+        tuple[list, Callable]: For each model field, its name, its database alias, its
+                               converter and its `FieldInfo`, and the function that
+                               returns the private attributes of a new instance.
+
+    Description:
+        The plan is cached on the class itself, like the serialization plan of
+        `consolidate_dict`. Fields of plain types (str, int, float, bool, datetime,
+        and lists, dicts and unions of them) have no converter, or only replace empty
+        documents as the `DbModel` pre-validator does when they may contain them; fields of other
+        types that are not handled here, like enums, are validated alone with a
+        `TypeAdapter`.
+    """
+    plan = cls.__dict__.get("__pyodmongo_construction_plan__")
+    if plan is not None:
+        return plan
+    fields = []
+    for field, field_info in cls.model_fields.items():
+        db_field: DbField = getattr(cls, field)
+        convert = _field_converter(db_field=db_field, annotation=field_info.annotation)
+        fields.append((field, db_field.field_alias, convert, field_info))
+    plan = (fields, _private_defaults(cls=cls))
+    setattr(cls, "__pyodmongo_construction_plan__", plan)
+    return plan
+
+
+def construct_model(cls: type[BaseModel], doc: dict) -> BaseModel:
+    """
+    Builds a model instance from a stored document without validating it.
+
+    Args:
+        cls (type[BaseModel]): The PyODMongo model class.
+        doc (dict): The document as returned by the database.
+
+    Returns:
+        BaseModel: The model instance.
+
+    Description:
+        Stored values are converted with the construction plan of the class: `_id`
+        becomes `id`, ObjectIds become `Id` strings, Decimal128 values become `DbDecimal`
+        or `Decimal`, nested and populated documents are constructed recursively and
+        empty documents are replaced by None, as the `DbModel` pre-validator does. Missing fields
+        get their default values, and missing required fields are left unset, as
+        `model_construct` does. The document is trusted to match the model, so
+        constraints and validators are not run.
+    """
+    fields, private_defaults = construction_plan(cls)
+    values = {}
+    missing = None
+    for field, alias, convert, field_info in fields:
+        value = doc.get(alias, _MISSING)
+        if value is None:
+            values[field] = None
+        elif value is _MISSING:
+            missing = (missing or []) + [field]
+            if not field_info.is_required():
+                values[field] = field_info.get_default(call_default_factory=True)
+        elif value.__class__ is dict and not value:
+            values[field] = None
+        else:
+            values[field] = value if convert is None else convert(value)
+    obj = cls.__new__(cls)
+    _object_setattr(obj, "__dict__", values)
+    _object_setattr(
+        obj,
+        "__pydantic_fields_set__",
+        set(values).difference(missing) if missing else set(values),
+    )
+    _object_setattr(obj, "__pydantic_extra__", None)
+    _object_setattr(obj, "__pydantic_private__", private_defaults())
+    return obj
+
+
+def batch_adapter(cls: type[BaseModel]) -> TypeAdapter:
+    """
+    Returns the `TypeAdapter` that validates lists of instances of a model class.
+
+    Args:
+        cls (type[BaseModel]): The PyODMongo model class.
+
+    Returns:
+        TypeAdapter: The `TypeAdapter(list[cls])`, created once and cached on `cls`.
+    """
+    adapter = cls.__dict__.get("__pyodmongo_batch_adapter__")
+    if adapter is None:
+        adapter = TypeAdapter(list[cls])
+        setattr(cls, "__pyodmongo_batch_adapter__", adapter)
+    return adapter
+
+
+def validate_models(cls: type[BaseModel], docs: list[dict]) -> list[BaseModel]:
+    """
+    Validates a batch of stored documents into model instances in a single call.
+
+    Args:
+        cls (type[BaseModel]): The PyODMongo model class.
+        docs (list[dict]): The documents as returned by the database.
+
+    Returns:
+        list[BaseModel]: The model instances, in the order of the documents.
+
+    Description:
+        The whole list is validated by pydantic-core at once, so documents do not go
+        through `__init__` one by one. `_id` and empty documents are normalized by the
+        `DbModel` pre-validator, as they are when the model is instantiated directly.
+    """
+    return batch_adapter(cls).validate_python(docs)
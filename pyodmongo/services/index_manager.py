@@ -0,0 +1,106 @@
+from pymongo import IndexModel, TEXT
+from ..models.index_plan import IndexPlan
+
+
+_TEXT_INTERNAL_KEYS = ("_fts", "_ftsx")
+_COMPARED_OPTIONS = (
+    "unique",
+    "sparse",
+    "expireAfterSeconds",
+    "partialFilterExpression",
+    "default_language",
+    "language_override",
+)
+_OPTION_DEFAULTS = {"unique": False, "sparse": False}
+
+
+def _normalize_number(value):
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    return value
+
+
+def _index_spec(document: dict) -> dict:
+    """
+    Normalizes an index document into a comparable specification.
+
+    Args:
+        document (dict): Either the document of a declared `IndexModel` or an index
+                         document returned by `list_indexes()`.
+
+    Returns:
+        dict: The index keys and the options relevant to decide whether two indexes
+              are equivalent.
+
+    Description:
+        Text indexes are stored by the server with the internal `_fts`/`_ftsx` keys and
+        the text fields moved to `weights`, so both forms are reduced to the same
+        key/weights representation before comparison.
+    """
+    keys = []
+    weights = {}
+    is_text = False
+    for field, direction in document["key"].items():
+        if field in _TEXT_INTERNAL_KEYS:
+            is_text = True
+            continue
+        if direction == TEXT:
+            is_text = True
+            weights[field] = 1
+            continue
+        keys.append((field, _normalize_number(direction)))
+    spec = {"key": keys}
+    if is_text:
+        weights.update(document.get("weights") or {})
+        spec["weights"] = {
+            field: _normalize_number(weight) for field, weight in weights.items()
+        }
+        spec["default_language"] = document.get("default_language") or "english"
+        spec["language_override"] = document.get("language_override") or "language"
+    for option in _COMPARED_OPTIONS:
+        if option in spec:
+            continue
+        value = document.get(option, _OPTION_DEFAULTS.get(option))
+        if value is not None:
+            spec[option] = _normalize_number(value)
+    return spec
+
+
+def resolve_index_plan(
+    collection_name: str,
+    declared: list[IndexModel],
+    existing: list[dict],
+    drop_unknown: bool = False,
+) -> IndexPlan:
+    """
+    Diffs the declared indexes of a collection against the indexes that exist in it.
+
+    Args:
+        collection_name (str): The name of the collection.
+        declared (list[IndexModel]): The indexes declared by the models of the collection.
+        existing (list[dict]): The index documents returned by `list_indexes()`.
+        drop_unknown (bool): If True, existing indexes that are not declared are planned
+                             to be dropped. Defaults to False, so indexes created by
+                             hand or by other applications are kept. The `_id_` index
+                             is never dropped.
+
+    Returns:
+        IndexPlan: The indexes to create, drop and rebuild.
+    """
+    declared_specs = {
+        index.document["name"]: _index_spec(index.document) for index in declared
+    }
+    existing_specs = {
+        index["name"]: _index_spec(index)
+        for index in existing
+        if index["name"] != "_id_"
+    }
+    plan = IndexPlan(collection=collection_name)
+    for name, spec in declared_specs.items():
+        if name not in existing_specs:
+            plan.create.append(name)
+        elif existing_specs[name] != spec:
+            plan.rebuild.append(name)
+    if drop_unknown:
+        plan.drop = [name for name in existing_specs if name not in declared_specs]
+    return plan
@@ -0,0 +1,156 @@
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from binascii import Error as BinasciiError
+from bson import decode, encode
+from bson.errors import BSONError
+
+
+def encode_token(values: list) -> str:
+    """
+    Encodes the sort values of a document into an opaque pagination token.
+
+    Args:
+        values (list): The values of the sort keys of the document, ending with its `_id`.
+
+    Returns:
+        str: The URL-safe base64 encoding of the BSON document `{"v": values}`.
+    """
+    return urlsafe_b64encode(encode({"v": values})).decode()
+
+
+def decode_token(token: str) -> list:
+    """
+    Decodes a pagination token created by `encode_token`.
+
+    Args:
+        token (str): The opaque pagination token.
+
+    Returns:
+        list: The sort values encoded in the token.
+
+    Raises:
+        ValueError: If the token is not a valid pagination token.
+    """
+    try:
+        values = decode(urlsafe_b64decode(token.encode()))["v"]
+    except (BinasciiError, BSONError, KeyError, TypeError, ValueError):
+        raise ValueError("Invalid pagination token")
+    if not isinstance(values, list):
+        raise ValueError("Invalid pagination token")
+    return values
+
+
+def keyset_sort(sort: dict, reverse: bool) -> dict:
+    """
+    Completes a sort with `_id` as the last key, so that it defines a total order.
+
+    Args:
+        sort (dict): The sort dictionary of the query.
+        reverse (bool): If True, every direction is inverted, to read the page that
+                        comes before a token.
+
+    Returns:
+        dict: The sort dictionary used to read the page.
+    """
+    sort = dict(sort)
+    if "_id" not in sort:
+        sort["_id"] = list(sort.values())[-1] if sort else 1
+    if reverse:
+        sort = {key: -direction for key, direction in sort.items()}
+    return sort
+
+
+def _after_value(key: str, direction: int, value) -> dict | None:
+    if key == "_id":
+        return {key: {"$gt" if direction == 1 else "$lt": value}}
+    if direction == 1:
+        return {key: {"$ne": None}} if value is None else {key: {"$gt": value}}
+    if value is None:
+        return None
+    return {"$or": [{key: {"$lt": value}}, {key: None}]}
+
+
+def keyset_match(sort: dict, values: list) -> dict:
+    """
+    Builds the query that selects the documents after the given sort values.
+
+    Args:
+        sort (dict): The sort dictionary used to read the page, as returned by
+                     `keyset_sort`.
+        values (list): The sort values of the last document read, in the order of
+                       the sort keys.
+
+    Returns:
+        dict: An `$or` of range conditions, one per sort key, with equality on the
+              previous keys, which the server can answer with an index on the sort keys.
+
+    Raises:
+        ValueError: If the number of values does not match the sort keys.
+
+    Description:
+        MongoDB sorts null and missing values before any other value, but range
+        operators only compare values of the same type. So after a null value in
+        ascending order come the non-null values, nothing comes after it in
+        descending order, and the null values come after any other value in
+        descending order.
+    """
+    if len(values) != len(sort):
+        raise ValueError("The pagination token does not match the sort of the query")
+    clauses = []
+    for i, (key, direction) in enumerate(sort.items()):
+        after_value = _after_value(key=key, direction=direction, value=values[i])
+        if after_value is None:
+            continue
+        clause = {
+            previous_key: values[j] for j, previous_key in enumerate(sort) if j < i
+        }
+        clause.update(after_value)
+        clauses.append(clause)
+    return clauses[0] if len(clauses) == 1 else {"$or": clauses}
+
+
+def _value_at(doc: dict, path: str):
+    value = doc
+    for key in path.split("."):
+        if not isinstance(value, dict):
+            return None
+        value = value.get(key)
+    return value
+
+
+def keyset_page(
+    docs: list[dict], sort: dict, docs_per_page: int, after: bool, before: bool
+) -> tuple[list[dict], str | None, str | None]:
+    """
+    Cuts a page read with one extra document and computes its tokens.
+
+    Args:
+        docs (list[dict]): The documents read with a limit of `docs_per_page + 1`, in
+                           the order of the sort used to read them.
+        sort (dict): The sort dictionary used to read the page, as returned by
+                     `keyset_sort`.
+        docs_per_page (int): The number of documents per page.
+        after (bool): If True, the page was read after a token.
+        before (bool): If True, the page was read before a token, in reverse order.
+
+    Returns:
+        tuple[list[dict], str | None, str | None]: The documents of the page in the
+            order of the query, the token of the previous page and the token of the
+            next page, or None where there is no such page.
+    """
+    has_more = len(docs) > docs_per_page
+    docs = docs[:docs_per_page]
+    if before:
+        docs.reverse()
+    has_previous = has_more if before else after
+    has_next = before or has_more
+    if not docs:
+        return docs, None, None
+    previous_token = (
+        encode_token([_value_at(docs[0], key) for key in sort])
+        if has_previous
+        else None
+    )
+    next_token = (
+        encode_token([_value_at(docs[-1], key) for key in sort]) if has_next else None
+    )
+    return docs, previous_token, next_token
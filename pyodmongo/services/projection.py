@@ -0,0 +1,204 @@
+from pydantic import BaseModel, Field, create_model
+from typing import Any, Union, get_args, get_origin
+from types import UnionType
+from ..models.db_field_info import DbField
+from ..models.db_model import DbModel
+from .reference_pipeline import _paths_to_ref_ids
+
+
+def field_paths(fields: list[DbField]) -> list[str]:
+    """
+    Converts the `DbField`s selected for a projection into dotted document paths.
+
+    Args:
+        fields (list[DbField]): Fields accessed from the model class, like
+                                `Model.name` or `Model.address.city`.
+
+    Returns:
+        list[str]: The dotted paths of the fields in the stored documents.
+    """
+    paths = []
+    for db_field in fields:
+        if not isinstance(db_field, DbField):
+            raise TypeError(
+                "fields must be a list of DbField, like [Model.id, Model.name]"
+            )
+        paths.append(db_field.path_str)
+    return paths
+
+
+def _collapse_paths(paths: list[str]) -> dict:
+    project = {}
+    for path in sorted(set(paths), key=lambda path: path.count(".")):
+        parts = path.split(".")
+        if any(".".join(parts[:i]) in project for i in range(1, len(parts))):
+            continue
+        project[path] = 1
+    return project
+
+
+def projection_plan(
+    cls: BaseModel, paths: list[str], populate_db_fields: list[DbField] | None
+) -> tuple[dict, dict]:
+    """
+    Plans the `$project` stages needed to read only some fields of a model.
+
+    Args:
+        cls (BaseModel): The model class of the documents.
+        paths (list[str]): The dotted paths of the selected fields.
+        populate_db_fields (list[DbField] | None): The reference fields to populate, or
+                                                   None to populate all of them.
+
+    Returns:
+        tuple[dict, dict]: The projection of the documents and, keyed by the path of
+                           each populated reference, the plan of the referenced
+                           documents, or None when they are read entirely.
+
+    Description:
+        A selected path that goes through a populated reference, like
+        `Model.address.city` when `address` is a reference, keeps the reference id in
+        the projection of the documents and selects `city` in the plan of the
+        referenced documents, so the populate stages can still join them.
+    """
+    ref_models = {
+        ".".join(db_field.field_alias for db_field in path): path[-1].field_type
+        for path in _paths_to_ref_ids(
+            cls=cls, paths=[], db_field_path=[], populate_db_fields=populate_db_fields
+        )
+    }
+    kept = []
+    ref_paths = {}
+    for path in paths:
+        for ref_path in ref_models:
+            if path != ref_path and not path.startswith(ref_path + "."):
+                continue
+            kept.append(ref_path)
+            rest = path[len(ref_path) + 1 :]
+            if not rest:
+                ref_paths[ref_path] = None
+            elif ref_paths.get(ref_path, []) is not None:
+                ref_paths[ref_path] = ref_paths.get(ref_path, []) + [rest]
+            break
+        else:
+            kept.append(path)
+    for ref_path in ref_paths:
+        if any(ref_path.startswith(path + ".") for path in paths):
+            ref_paths[ref_path] = None
+    sub_plans = {
+        ref_path: (
+            None
+            if rest_paths is None
+            else projection_plan(
+                cls=ref_models[ref_path],
+                paths=rest_paths,
+                populate_db_fields=populate_db_fields,
+            )
+        )
+        for ref_path, rest_paths in ref_paths.items()
+    }
+    return _collapse_paths(kept), sub_plans
+
+
+def project_lookups(stages: list[dict], sub_plans: dict) -> list[dict]:
+    """
+    Adds the projections of the referenced documents to the populate `$lookup` stages.
+
+    Args:
+        stages (list[dict]): The populate stages. They are not modified, the changed
+                             `$lookup` stages are copied.
+        sub_plans (dict): The plans of the referenced documents, as returned by
+                          `projection_plan`.
+
+    Returns:
+        list[dict]: The populate stages with a leading `$project` in the pipeline of
+                    the `$lookup` of each projected reference.
+    """
+    projected = []
+    for stage in stages:
+        lookup = stage.get("$lookup")
+        plan = sub_plans.get(lookup["localField"]) if lookup else None
+        if plan is None:
+            projected.append(stage)
+            continue
+        project, nested_plans = plan
+        pipeline = project_lookups(stages=lookup["pipeline"], sub_plans=nested_plans)
+        projected.append(
+            {"$lookup": {**lookup, "pipeline": [{"$project": project}] + pipeline}}
+        )
+    return projected
+
+
+_building_partial_models = set()
+
+
+def _partial_annotation(annotation: Any):
+    if hasattr(annotation, "model_fields"):
+        return partial_model(annotation)
+    args = get_args(annotation)
+    if not args:
+        return annotation
+    origin = get_origin(annotation)
+    if origin is UnionType or origin is Union:
+        return Union[tuple(_partial_annotation(arg) for arg in args)]
+    if origin is list:
+        return list[_partial_annotation(args[0])]
+    return annotation
+
+
+def partial_model(cls: type[BaseModel]) -> type[BaseModel]:
+    """
+    Returns a subclass of a model class in which every field is optional.
+
+    Args:
+        cls (type[BaseModel]): The PyODMongo model class.
+
+    Returns:
+        type[BaseModel]: The partial model class, created once and cached on `cls`.
+
+    Description:
+        Nested models are replaced by their own partial models, so documents read with
+        a projection validate whatever subset of fields they contain. Fields missing
+        from the documents are None. Partial database models track changes, so saving
+        an instance loaded by the engines only sends the fields that were modified
+        instead of overwriting the missing ones.
+    """
+    partial = cls.__dict__.get("__pyodmongo_partial_model__")
+    if partial is not None:
+        return partial
+    if cls in _building_partial_models:
+        return cls
+    _building_partial_models.add(cls)
+    try:
+        fields = {
+            name: (
+                Union[_partial_annotation(field_info.annotation), None],
+                Field(default=None, alias=field_info.alias),
+            )
+            for name, field_info in cls.model_fields.items()
+        }
+        partial = create_model(
+            f"Partial{cls.__name__}",
+            __base__=cls,
+            __module__=cls.__module__,
+            **fields,
+        )
+    finally:
+        _building_partial_models.discard(cls)
+    if issubclass(cls, DbModel):
+        partial._track_changes = True
+    setattr(partial, "__pyodmongo_partial_of__", cls)
+    setattr(cls, "__pyodmongo_partial_model__", partial)
+    return partial
+
+
+def is_partial_model(cls: type[BaseModel]) -> bool:
+    """
+    Tells whether a model class is a partial model created by `partial_model`.
+
+    Args:
+        cls (type[BaseModel]): The model class.
+
+    Returns:
+        bool: True if the class is the partial model of another class.
+    """
+    return cls.__dict__.get("__pyodmongo_partial_of__") is not None
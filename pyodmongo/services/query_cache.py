@@ -0,0 +1,87 @@
+from bson import encode
+from bson.codec_options import CodecOptions
+from hashlib import sha1
+
+
+_FOREIGN_COLLECTION_KEYS = {"$lookup": "from", "$graphLookup": "from"}
+
+
+def pipeline_collections(collection: str, pipeline: list) -> list[str]:
+    """
+    Lists the collections read by an aggregation pipeline.
+
+    Args:
+        collection (str): The name of the collection the pipeline runs on.
+        pipeline (list): The aggregation pipeline.
+
+    Returns:
+        list[str]: The name of the collection followed by the collections read by
+                   its `$lookup`, `$graphLookup` and `$unionWith` stages, including
+                   nested pipelines, sorted and without repetitions.
+    """
+    collections = {collection}
+    values = [pipeline]
+    while values:
+        value = values.pop()
+        if isinstance(value, list):
+            values.extend(value)
+            continue
+        if not isinstance(value, dict):
+            continue
+        for key, item in value.items():
+            foreign_key = _FOREIGN_COLLECTION_KEYS.get(key)
+            if foreign_key and isinstance(item, dict):
+                collections.add(item.get(foreign_key))
+            elif key == "$unionWith":
+                collections.add(item.get("coll") if isinstance(item, dict) else item)
+            values.append(item)
+    collections.discard(None)
+    return [collection] + sorted(collections - {collection})
+
+
+def version_key(collection: str) -> str:
+    """
+    Returns the cache key of the version of a collection, which changes on every write.
+
+    Args:
+        collection (str): The name of the collection.
+
+    Returns:
+        str: The key of the version in the cache backend.
+    """
+    return f"query_version/{collection}"
+
+
+def query_cache_key(
+    collection: str,
+    pipeline: list,
+    codec_options: CodecOptions,
+    versions: list,
+) -> str:
+    """
+    Builds the cache key of the result of an aggregation pipeline.
+
+    Args:
+        collection (str): The name of the collection the pipeline runs on.
+        pipeline (list): The final aggregation pipeline.
+        codec_options (CodecOptions): The options used to decode the documents.
+        versions (list): The versions of the collections read by the pipeline, in
+                         the order of `pipeline_collections`.
+
+    Returns:
+        str: The collection name and a SHA-1 of the BSON encoding of the pipeline,
+             the timezone settings of the codec options and the versions.
+
+    Description:
+        The pipeline is encoded as it is sent to the server, so the key keeps the
+        order of the keys of every stage, which is significant for stages like
+        `$sort`. A write to any of the collections changes its version, so the
+        results cached before it are not found anymore and expire with their TTL.
+    """
+    key_document = {
+        "pipeline": pipeline,
+        "tz_aware": codec_options.tz_aware,
+        "tzinfo": str(codec_options.tzinfo),
+        "versions": versions,
+    }
+    return f"query/{collection}/{sha1(encode(key_document)).hexdigest()}"
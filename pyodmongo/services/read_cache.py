@@ -0,0 +1,131 @@
+from bson import ObjectId
+from bson.codec_options import CodecOptions
+from .cache_backends import CacheBackend, MemoryCacheBackend
+
+
+class ReadCache:
+    """
+    Cache, with a TTL, of the documents read by `find_one` by id.
+
+    A model enables it by declaring `_read_cache: ClassVar = ReadCache(...)`. The
+    engines then answer `find_one` queries by `_id` equality only, without populate,
+    projection or custom pipeline, from the cached documents, and invalidate the
+    entries of the objects they save or delete. Documents are kept in a
+    `CacheBackend`: an in-process LRU by default, or a backend shared by the
+    processes of a host, like `SqliteCacheBackend`, so that a write in one process
+    invalidates the cache of all of them.
+
+    Each key has a random version, stored in the backend, and documents are stored
+    under their versioned key (see `versioned_key`). Invalidating a key removes its
+    version, so a document read before a concurrent write and stored after it is
+    stored under a version that is no longer current, and is never served.
+
+    Attributes:
+        ttl (float | None): How many seconds a document stays cached, or None to
+                            keep it until it is evicted or invalidated.
+        backend (CacheBackend): The store of the cached documents.
+        hits (int): The number of lookups answered from the cache.
+        misses (int): The number of lookups not found in the cache or expired.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 1024,
+        ttl: float | None = 60,
+        backend: CacheBackend | None = None,
+    ):
+        self.ttl = ttl
+        self.backend = (
+            MemoryCacheBackend(max_size=max_size) if backend is None else backend
+        )
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self.backend)
+
+    @property
+    def evictions(self) -> int:
+        return getattr(self.backend, "evictions", 0)
+
+    def versioned_key(self, key: str) -> str:
+        """
+        Returns the key under which the document of a key is currently stored.
+
+        Args:
+            key (str): The key of the document, like `<collection>/<id>`.
+
+        Returns:
+            str: The key followed by its current version, created if it has none.
+        """
+        version = self.backend.get(key)
+        if version is None:
+            version = {"v": ObjectId()}
+            self.backend.set(key, version, ttl=self.ttl)
+        return f"{key}/{version['v']}"
+
+    def get(self, key: str, codec_options: CodecOptions | None = None) -> dict | None:
+        """
+        Read a cached document.
+
+        Args:
+            key (str): The key of the document, usually a versioned key.
+            codec_options (CodecOptions | None): The options used to decode it.
+
+        Returns:
+            dict | None: A new copy of the document, or None if it is not cached or
+                expired.
+        """
+        document = self.backend.get(key, codec_options=codec_options)
+        if document is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return document
+
+    def set(self, key: str, document: dict):
+        """
+        Store a document for `ttl` seconds.
+
+        Args:
+            key (str): The key of the document, usually the versioned key read
+                       before the document was read from the database.
+            document (dict): The document as read from the database.
+        """
+        self.backend.set(key, document, ttl=self.ttl)
+
+    def delete(self, keys: list[str]):
+        """
+        Invalidate cached documents, removing their versions.
+
+        Args:
+            keys (list[str]): The keys of the documents, without versions.
+        """
+        versions = self.backend.get_many(keys)
+        self.backend.delete(
+            [*keys, *[f"{key}/{version['v']}" for key, version in versions.items()]]
+        )
+
+    def clear(self, prefix: str = ""):
+        """
+        Invalidate the cached documents whose keys start with `prefix`, or all of them.
+
+        Args:
+            prefix (str): The prefix of the keys, like the collection name of a model.
+        """
+        self.backend.clear(prefix=prefix)
+
+    def stats(self) -> dict[str, int]:
+        """
+        Returns the counters of the cache.
+
+        Returns:
+            dict[str, int]: The hits, misses, evictions and current size, which
+                counts the documents and their versions.
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "size": len(self.backend),
+        }
@@ -1,4 +1,6 @@
+from bson import decode, encode
 from pydantic import BaseModel
+from dataclasses import fields
 from ..models.db_field_info import DbField
 from .verify_subclasses import is_subclass
 from .aggregate_stages import (
@@ -8,7 +10,6 @@ from .aggregate_stages import (
     lookup,
     set_,
 )
-import copy
 
 
 def _paths_to_ref_ids(
@@ -29,9 +30,9 @@ def _paths_to_ref_ids(
         if db_field.by_reference:
             try:
                 if db_field in populate_db_fields:
-                    paths.append(copy.deepcopy(db_field_path))
+                    paths.append(list(db_field_path))
             except TypeError:
-                paths.append(copy.deepcopy(db_field_path))
+                paths.append(list(db_field_path))
         elif db_field.has_model_fields:
             _paths_to_ref_ids(
                 cls=db_field.field_type,
@@ -117,3 +118,220 @@ def resolve_reference_pipeline(
             pipeline += unset(fields=index_to_unset)
 
     return pipeline
+
+
+def _populated_reference(id_expr: str):
+    return {
+        "$let": {
+            "vars": {"index": {"$indexOfArray": ["$$populated_ids", id_expr]}},
+            "in": {
+                "$cond": {
+                    "if": {"$gte": ["$$index", 0]},
+                    "then": {"$arrayElemAt": ["$$populated", "$$index"]},
+                    "else": None,
+                }
+            },
+        }
+    }
+
+
+def _stitch_expression(expr: str, db_field_path: list[DbField], depth: int):
+    """
+    Builds the expression that rebuilds a value of a reference path with the
+    populated documents bound to `$$populated` and their ids to `$$populated_ids`.
+
+    Args:
+        expr (str): The expression of the value described by `db_field_path[0]`.
+        db_field_path (list[DbField]): The remaining fields of the reference path.
+        depth (int): The nesting depth, used to name the `$map` variables.
+
+    Returns:
+        dict: The aggregation expression of the rebuilt value.
+    """
+    db_field = db_field_path[0]
+    if db_field.by_reference:
+        if not db_field.is_list:
+            return _populated_reference(id_expr=expr)
+        return {
+            "$filter": {
+                "input": {
+                    "$map": {
+                        "input": {"$ifNull": [expr, []]},
+                        "as": f"ref_{depth}",
+                        "in": _populated_reference(id_expr=f"$$ref_{depth}"),
+                    }
+                },
+                "cond": {"$ne": ["$$this", None]},
+            }
+        }
+    if db_field.is_list:
+        return {
+            "$map": {
+                "input": {"$ifNull": [expr, []]},
+                "as": f"item_{depth}",
+                "in": _stitch_embedded(
+                    expr=f"$$item_{depth}",
+                    db_field_path=db_field_path[1:],
+                    depth=depth + 1,
+                ),
+            }
+        }
+    return _stitch_embedded(expr=expr, db_field_path=db_field_path[1:], depth=depth)
+
+
+def _stitch_embedded(expr: str, db_field_path: list[DbField], depth: int):
+    alias = db_field_path[0].field_alias
+    return {
+        "$cond": {
+            "if": {"$eq": [{"$type": expr}, "object"]},
+            "then": {
+                "$mergeObjects": [
+                    expr,
+                    {
+                        alias: _stitch_expression(
+                            expr=f"{expr}.{alias}",
+                            db_field_path=db_field_path,
+                            depth=depth,
+                        )
+                    },
+                ]
+            },
+            "else": expr,
+        }
+    }
+
+
+def resolve_array_reference_pipeline(
+    cls: BaseModel, pipeline: list, populate_db_fields: list[DbField] | None
+):
+    """
+    Constructs a MongoDB aggregation pipeline that populates references keeping the
+    arrays of the documents intact.
+
+    Args:
+        cls (BaseModel): The model class for which to build the reference resolution pipeline.
+        pipeline (list): Initial pipeline stages to which reference resolution stages will be added.
+        populate_db_fields (list[DbField] | None): The reference fields to populate, or
+                                                   None to populate all of them.
+
+    Returns:
+        list: The modified MongoDB aggregation pipeline including reference resolution stages.
+
+    Description:
+        Unlike `resolve_reference_pipeline`, references inside lists of embedded models
+        are not resolved with `$unwind` and `$group`. Each reference path gets a single
+        `$lookup` over all its ids into a temporary field, and the populated documents
+        are stitched back in place with `$map` and `$indexOfArray`. The number of
+        documents flowing through the pipeline never grows, and lists of references
+        keep the order and duplicates of the stored ids. References that are not found
+        are dropped from lists and set to None otherwise.
+    """
+    paths = _paths_to_ref_ids(
+        cls=cls, paths=[], db_field_path=[], populate_db_fields=populate_db_fields
+    )
+    for index, db_field_path in enumerate(paths):
+        db_field: DbField = db_field_path[-1]
+        path_str = ".".join(field.field_alias for field in db_field_path)
+        root = db_field_path[0].field_alias
+        temp_field = f"__populate_{index}"
+        pipeline += lookup(
+            from_=db_field.field_type._collection,
+            local_field=path_str,
+            foreign_field="_id",
+            as_=temp_field,
+            pipeline=resolve_array_reference_pipeline(
+                cls=db_field.field_type,
+                pipeline=[],
+                populate_db_fields=populate_db_fields,
+            ),
+        )
+        pipeline += [
+            {
+                "$set": {
+                    root: {
+                        "$let": {
+                            "vars": {
+                                "populated": f"${temp_field}",
+                                "populated_ids": f"${temp_field}._id",
+                            },
+                            "in": _stitch_expression(
+                                expr=f"${root}", db_field_path=db_field_path, depth=0
+                            ),
+                        }
+                    }
+                }
+            }
+        ]
+        pipeline += unset(fields=[temp_field])
+    return pipeline
+
+
+POPULATE_STRATEGIES = {
+    "unwind": resolve_reference_pipeline,
+    "array": resolve_array_reference_pipeline,
+}
+
+
+_UNHASHABLE_SELECTION = object()
+
+
+def _db_field_key(db_field: DbField) -> tuple:
+    return tuple(getattr(db_field, field.name) for field in fields(db_field))
+
+
+def reference_pipeline_template(
+    cls: BaseModel,
+    populate_db_fields: list[DbField] | None,
+    populate_strategy: str = "unwind",
+) -> tuple[list[dict], tuple[str, ...]]:
+    """
+    Returns the memoized reference resolution pipeline of a model class.
+
+    Args:
+        cls (BaseModel): The model class for which to build the reference resolution pipeline.
+        populate_db_fields (list[DbField] | None): The reference fields to populate, or
+                                                   None to populate all of them.
+        populate_strategy (str): The key in `POPULATE_STRATEGIES` of the function that
+                                 builds the stages, "unwind" or "array".
+
+    Returns:
+        tuple: A new list with the stages built by the populate strategy, and the
+               dotted paths of the populated reference fields as a tuple.
+
+    Description:
+        The template is built once per class, strategy and selection of fields, and
+        cached on the class itself as BSON. Every call decodes new stage dictionaries
+        from it, so callers may mutate the stages without changing the template.
+    """
+    resolve_pipeline = POPULATE_STRATEGIES[populate_strategy]
+    templates = cls.__dict__.get("__pyodmongo_reference_pipelines__")
+    if templates is None:
+        templates = {}
+        setattr(cls, "__pyodmongo_reference_pipelines__", templates)
+    try:
+        key = (
+            populate_strategy,
+            (
+                None
+                if populate_db_fields is None
+                else frozenset(_db_field_key(f) for f in populate_db_fields)
+            ),
+        )
+    except TypeError:
+        key = _UNHASHABLE_SELECTION
+    template = templates.get(key)
+    if template is not None:
+        encoded_stages, populated_paths = template
+        return decode(encoded_stages)["stages"], populated_paths
+    paths = _paths_to_ref_ids(
+        cls=cls, paths=[], db_field_path=[], populate_db_fields=populate_db_fields
+    )
+    stages = resolve_pipeline(
+        cls=cls, pipeline=[], populate_db_fields=populate_db_fields
+    )
+    populated_paths = tuple(
+        ".".join(db_field.field_alias for db_field in path) for path in paths
+    )
+    if key is not _UNHASHABLE_SELECTION:
+        templates[key] = (encode({"stages": stages}), populated_paths)
+    return stages, populated_paths
@@ -0,0 +1,89 @@
+"""
+Compares the validating and the trusted hydration of a large `find_many` result.
+
+The documents are built as the driver returns them (ObjectId, Decimal128,
+datetime, populated references), so no MongoDB server is needed. Run it with:
+
+    python -m tests.benchmark_hydration [docs]
+"""
+
+from typing import ClassVar
+from statistics import median
+from time import perf_counter
+from datetime import datetime
+from bson import ObjectId, Decimal128
+import copy
+import sys
+from pyodmongo import DbModel, MainBaseModel, Id, DbDecimal
+from pyodmongo.engines.utils import hydrate_models
+
+
+ROUNDS = 5
+
+
+class Ref(DbModel):
+    name: str
+    _collection: ClassVar = "benchmark_ref"
+
+
+class Address(MainBaseModel):
+    street: str
+    number: int
+    tags: list[str]
+
+
+class Doc(DbModel):
+    name: str
+    price: DbDecimal
+    active: bool
+    address: Address
+    ref: Ref | Id
+    refs: list[Ref | Id]
+    _collection: ClassVar = "benchmark_doc"
+
+
+def _doc(i: int, now: datetime) -> dict:
+    ref = {"_id": ObjectId(), "name": f"ref {i}", "created_at": now}
+    return {
+        "_id": ObjectId(),
+        "created_at": now,
+        "updated_at": now,
+        "name": f"doc {i}",
+        "price": Decimal128(f"{i}.50"),
+        "active": i % 2 == 0,
+        "address": {"street": "street", "number": i, "tags": ["a", "b"]},
+        "ref": ref,
+        "refs": [ObjectId() for _ in range(5)],
+    }
+
+
+def _time(docs: list[dict], trusted: bool) -> float:
+    timings = []
+    for _ in range(ROUNDS):
+        batch = copy.deepcopy(docs)
+        start = perf_counter()
+        hydrate_models(Model=Doc, docs=batch, partial=False, trusted=trusted)
+        timings.append(perf_counter() - start)
+    return median(timings)
+
+
+def main(docs: int = 20000):
+    now = datetime.now()
+    batch = [_doc(i, now) for i in range(docs)]
+    validated = hydrate_models(
+        Model=Doc, docs=copy.deepcopy(batch), partial=False, trusted=False
+    )
+    trusted = hydrate_models(
+        Model=Doc, docs=copy.deepcopy(batch), partial=False, trusted=True
+    )
+    assert validated == trusted, "The hydration paths disagree"
+    validating_time = _time(batch, trusted=False)
+    trusted_time = _time(batch, trusted=True)
+    print(f"{docs} documents, median of {ROUNDS} rounds")
+    print(f"validating: {validating_time * 1000:9.1f} ms")
+    print(f"   trusted: {trusted_time * 1000:9.1f} ms")
+    print(f"   speedup: {validating_time / trusted_time:9.1f}x")
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
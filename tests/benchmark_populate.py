@@ -0,0 +1,96 @@
+"""
+Compares the "unwind" and "array" populate strategies on lists of references
+nested in embedded lists.
+
+Run it against a MongoDB server with:
+
+    python -m tests.benchmark_populate [docs] [items_per_doc] [refs_per_item]
+"""
+
+from typing import ClassVar
+from statistics import median
+from time import perf_counter
+import sys
+from pyodmongo import DbEngine, DbModel, MainBaseModel, Id
+from .conftest import mongo_uri
+
+
+DB_NAME = "pyodmongo_benchmark"
+ROUNDS = 5
+
+
+class Ref(DbModel):
+    name: str
+    _collection: ClassVar = "benchmark_ref"
+
+
+class Item(MainBaseModel):
+    ref: Ref | Id
+    refs: list[Ref | Id]
+
+
+class Doc(DbModel):
+    index: int
+    items: list[Item]
+    _collection: ClassVar = "benchmark_doc"
+
+
+def _seed(engine: DbEngine, docs: int, items_per_doc: int, refs_per_item: int):
+    refs = [Ref(name=f"ref {i}") for i in range(200)]
+    engine.save_all(refs)
+    engine.save_all(
+        (
+            Doc(
+                index=i,
+                items=[
+                    Item(
+                        ref=refs[(i + j) % len(refs)],
+                        refs=[
+                            refs[(i + j + k) % len(refs)] for k in range(refs_per_item)
+                        ],
+                    )
+                    for j in range(items_per_doc)
+                ],
+            )
+            for i in range(docs)
+        ),
+        chunk_size=1000,
+    )
+
+
+def _time(engine: DbEngine) -> tuple[float, list[dict]]:
+    timings = []
+    for _ in range(ROUNDS):
+        start = perf_counter()
+        result = engine.find_many(
+            Model=Doc, populate=True, raw_sort={"index": 1}, as_dict=True
+        )
+        timings.append(perf_counter() - start)
+    return median(timings), result
+
+
+def main(docs: int = 2000, items_per_doc: int = 10, refs_per_item: int = 10):
+    engines = {
+        strategy: DbEngine(
+            mongo_uri=mongo_uri, db_name=DB_NAME, populate_strategy=strategy
+        )
+        for strategy in ("unwind", "array")
+    }
+    engines["unwind"]._client.drop_database(DB_NAME)
+    try:
+        _seed(engines["unwind"], docs, items_per_doc, refs_per_item)
+        results = {}
+        print(
+            f"{docs} documents, {items_per_doc} items per document, "
+            f"{refs_per_item} references per item, median of {ROUNDS} rounds"
+        )
+        for strategy, engine in engines.items():
+            elapsed, results[strategy] = _time(engine)
+            print(f"{strategy:>8}: {elapsed * 1000:9.1f} ms")
+        assert results["unwind"] == results["array"], "The strategies disagree"
+    finally:
+        engines["unwind"]._client.drop_database(DB_NAME)
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
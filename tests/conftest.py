@@ -1,4 +1,5 @@
 import pytest
+import pytest_asyncio
 from pyodmongo import AsyncDbEngine, DbEngine
 from datetime import timezone, timedelta
 
@@ -16,3 +17,12 @@ def async_engine():
 @pytest.fixture
 def engine():
     return DbEngine(mongo_uri=mongo_uri, db_name=db_name, tz_info=tz_info)
+
+
+@pytest_asyncio.fixture
+async def drop_db(async_engine: AsyncDbEngine, engine: DbEngine):
+    await async_engine._client.drop_database(db_name)
+    engine._client.drop_database(db_name)
+    yield
+    await async_engine._client.drop_database(db_name)
+    engine._client.drop_database(db_name)
@@ -0,0 +1,97 @@
+from pyodmongo import CacheBackend, MemoryCacheBackend, SqliteCacheBackend
+from bson import ObjectId
+from bson.codec_options import CodecOptions
+from datetime import datetime, timezone
+from decimal import Decimal
+from bson import Decimal128
+import multiprocessing
+import os
+import pytest
+import time
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def backend(request, tmp_path):
+    if request.param == "memory":
+        yield MemoryCacheBackend(max_size=100)
+        return
+    backend = SqliteCacheBackend(path=str(tmp_path / "cache.sqlite"), purge_every=2)
+    yield backend
+    backend.close()
+
+
+def test_cache_backend_protocol(backend):
+    assert isinstance(backend, CacheBackend)
+    document = {
+        "_id": ObjectId(),
+        "created_at": datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc),
+        "price": Decimal128(Decimal("1.5")),
+        "nested": {"list": [1, "two", None]},
+    }
+    backend.set("a/1", document)
+    cached = backend.get("a/1")
+    assert cached == {**document, "created_at": datetime(2024, 1, 2, 3, 4, 5)}
+    cached["nested"]["list"].append(3)
+    assert backend.get("a/1")["nested"]["list"] == [1, "two", None]
+    tz_cached = backend.get("a/1", codec_options=CodecOptions(tz_aware=True))
+    assert tz_cached["created_at"] == document["created_at"]
+
+    backend.set_many({"a/2": {"v": 2}, "b/1": {"v": 3}})
+    assert backend.get_many(["a/1", "a/2", "b/1", "missing"]).keys() == {
+        "a/1",
+        "a/2",
+        "b/1",
+    }
+    assert len(backend) == 3
+
+    backend.delete(["a/2", "missing"])
+    assert backend.get("a/2") is None
+    backend.clear(prefix="a/")
+    assert backend.get("a/1") is None
+    assert backend.get("b/1") == {"v": 3}
+    backend.clear()
+    assert len(backend) == 0
+
+    backend.set("expiring", {"v": 1}, ttl=0.01)
+    assert backend.get("expiring") == {"v": 1}
+    time.sleep(0.02)
+    assert backend.get("expiring") is None
+
+
+def test_memory_cache_backend_evicts_least_recently_used():
+    backend = MemoryCacheBackend(max_size=2)
+    backend.set("a", {"v": 1})
+    backend.set("b", {"v": 2})
+    backend.get("a")
+    backend.set("c", {"v": 3})
+    assert backend.get_many(["a", "b", "c"]).keys() == {"a", "c"}
+    assert backend.evictions == 1
+
+
+def _set_in_child(backend: SqliteCacheBackend):
+    inherited_connection = backend._connection
+    backend.set("child", {"pid": os.getpid()})
+    assert backend._connection is not inherited_connection
+    assert backend._inherited_connections == [inherited_connection]
+
+
+def test_sqlite_cache_backend_connects_lazily_in_each_process(tmp_path):
+    path = str(tmp_path / "cache.sqlite")
+    backend = SqliteCacheBackend(path=path)
+    assert not os.path.exists(path)
+    backend.set("parent", {"pid": os.getpid()})
+    parent_connection = backend._connection
+
+    process = multiprocessing.get_context("fork").Process(
+        target=_set_in_child, args=(backend,)
+    )
+    process.start()
+    process.join()
+    assert process.exitcode == 0
+    assert backend.get("child")["pid"] == process.pid
+    assert backend.get("parent")["pid"] == os.getpid()
+    assert backend._connection is parent_connection
+    backend.close()
+    assert backend._connection is None
+    assert len(backend) == 2
+    backend.close()
@@ -1,4 +1,12 @@
-from pyodmongo import DbModel, Field, DbEngine, AsyncDbEngine, MainBaseModel
+from pyodmongo import (
+    DbModel,
+    Field,
+    DbEngine,
+    AsyncDbEngine,
+    MainBaseModel,
+    IndexPlan,
+)
+from pyodmongo.services.index_manager import resolve_index_plan
 from pymongo import IndexModel, ASCENDING, DESCENDING
 from typing import ClassVar
 import pytest
@@ -291,3 +299,105 @@ async def test_index_creation_with_persisted_nested(
     assert not indexes_in_db["attr_3"].get("unique")
     assert indexes_in_db["attr_persisted.attr_p2"].get("unique")
     assert not indexes_in_db["attr_persisted.attr_lv2.attr_lv2_2"].get("unique")
+
+
+@pytest.mark.asyncio
+async def test_indexes_synced_once_per_collection(
+    async_engine: AsyncDbEngine, engine: DbEngine
+):
+    await async_engine._db[MyClass2._collection].drop()
+    created = await async_engine.sync_indexes([MyClass2])
+    assert created == {MyClass2._collection: ["attr_6"]}
+    assert await async_engine.sync_indexes([MyClass2]) == {}
+    await async_engine._db[MyClass2._collection].drop_index("attr_6")
+    await async_engine.save(MyClass2(attr_5="attr_5", attr_6="attr_6"))
+    indexes_in_db = await async_engine._db[MyClass2._collection].index_information()
+    assert "attr_6" not in indexes_in_db
+
+    engine.save(MyClass2(attr_5="attr_5", attr_6="attr_6"))
+    assert engine._synced_indexes == {MyClass2._collection: {"attr_6"}}
+    assert "attr_6" in engine._db[MyClass2._collection].index_information()
+    engine.save(MyClass2(attr_5="attr_5", attr_6="attr_6"))
+    assert engine.sync_indexes([MyClass2]) == {}
+    engine._db[MyClass2._collection].drop()
+
+
+def test_resolve_index_plan():
+    existing = [
+        {"v": 2, "key": {"_id": 1}, "name": "_id_"},
+        {"v": 2, "key": {"attr_1": 1}, "name": "attr_1", "unique": True},
+        {"v": 2, "key": {"attr_4": 1}, "name": "attr_4"},
+        {"v": 2, "key": {"old_attr": 1}, "name": "old_attr"},
+        {
+            "v": 2,
+            "key": {"_fts": "text", "_ftsx": 1},
+            "name": "texts",
+            "weights": {"attr_3": 1, "attr_4": 1},
+            "default_language": "portuguese",
+            "language_override": "language",
+            "textIndexVersion": 3,
+        },
+    ]
+    plan = resolve_index_plan(
+        collection_name=MyClass._collection,
+        declared=MyClass._init_indexes,
+        existing=existing,
+        drop_unknown=True,
+    )
+    assert isinstance(plan, IndexPlan)
+    assert plan.create == []
+    assert plan.rebuild == ["attr_1"]
+    assert plan.drop == ["old_attr"]
+
+    plan = resolve_index_plan(
+        collection_name=MyClass._collection,
+        declared=MyClass._init_indexes,
+        existing=existing[:1],
+    )
+    assert plan.create == ["attr_1", "attr_4", "texts"]
+    assert plan.rebuild == []
+    assert plan.drop == []
+
+    plan = resolve_index_plan(
+        collection_name=MyClass._collection,
+        declared=MyClass._init_indexes,
+        existing=existing,
+    )
+    assert plan.rebuild == ["attr_1"]
+    assert plan.drop == []
+
+
+@pytest.mark.asyncio
+async def test_reconcile_indexes(async_engine: AsyncDbEngine, engine: DbEngine):
+    engine._db[MyClass._collection].drop()
+    engine._db[MyClass._collection].create_index("old_attr", name="old_attr")
+    engine._db[MyClass._collection].create_index("attr_1", name="attr_1", unique=True)
+
+    plans = await async_engine.reconcile_indexes(
+        [MyClass], dry_run=True, drop_unknown=True
+    )
+    plan = plans[MyClass._collection]
+    assert not plan.applied
+    assert plan.create == ["attr_4", "texts"]
+    assert plan.rebuild == ["attr_1"]
+    assert plan.drop == ["old_attr"]
+    assert "old_attr" in engine._db[MyClass._collection].index_information()
+
+    plans = engine.reconcile_indexes([MyClass])
+    assert plans[MyClass._collection].applied
+    assert plans[MyClass._collection].drop == []
+    indexes_in_db = engine._db[MyClass._collection].index_information()
+    assert "old_attr" in indexes_in_db
+    assert not indexes_in_db["attr_1"].get("unique", False)
+
+    plans = engine.reconcile_indexes([MyClass], drop_unknown=True)
+    assert plans[MyClass._collection].drop == ["old_attr"]
+    indexes_in_db = engine._db[MyClass._collection].index_information()
+    assert "old_attr" not in indexes_in_db
+    assert not indexes_in_db["attr_1"].get("unique", False)
+    assert "attr_4" in indexes_in_db
+    assert "texts" in indexes_in_db
+
+    plans = await async_engine.reconcile_indexes([MyClass])
+    assert plans[MyClass._collection].is_empty
+    engine._db[MyClass._collection].drop()
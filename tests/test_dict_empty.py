@@ -1,4 +1,9 @@
 from pyodmongo import DbModel, Id
+from pyodmongo.services.hydration import construct_model, validate_models
+from pyodmongo.engines.utils import consolidate_dict
+from bson import ObjectId, encode, decode
+import warnings
+import copy
 
 
 def test_empty_dict():
@@ -68,3 +73,96 @@ def test_empty_dict():
         "created_at": None,
         "updated_at": None,
     }
+
+
+def test_construct_model_replaces_empty_dicts():
+    class MyModel1(DbModel):
+        attr1: str | None
+        _collection = "my_model_1"
+
+    class MyModel2(DbModel):
+        attr2: str | None = None
+        attr2_list: list = []
+        attr2_dict: dict = {}
+        my_model_1: MyModel1 | Id | None
+        _collection = "my_model_2"
+
+    class MyModel3(DbModel):
+        attr3: str | None
+        my_model_2: MyModel2 | Id | None
+        my_model_2_list: list[MyModel2 | Id]
+        my_model_2_2: MyModel2 | Id | None
+        my_model_2_3: MyModel2 | Id | None
+        _collection = "my_model_3"
+
+    dct = {
+        "_id": ObjectId(),
+        "attr3": "attr3",
+        "my_model_2": {
+            "attr2": "Escrito",
+            "attr2_list": [{}, {"a": {}}],
+            "attr2_dict": {"a": {}, "_id": 1},
+            "my_model_1": {"_id": ObjectId(), "attr1": {}},
+        },
+        "my_model_2_list": [{}, ObjectId(), {"attr2_list": [], "my_model_1": {}}],
+        "my_model_2_2": ObjectId(),
+        "my_model_2_3": {},
+    }
+    obj = construct_model(cls=MyModel3, doc=copy.deepcopy(dct))
+    assert obj == MyModel3(**copy.deepcopy(dct))
+    assert obj.model_fields_set == MyModel3(**copy.deepcopy(dct)).model_fields_set
+    assert obj.my_model_2.my_model_1.attr1 is None
+
+
+def test_validate_models_matches_init():
+    class MyModel1(DbModel):
+        attr1: str | None
+        _collection = "my_model_1"
+
+    class MyModel2(DbModel):
+        attr2: str | None = None
+        attr2_list: list = []
+        my_model_1: MyModel1 | Id | None
+        _collection = "my_model_2"
+
+    docs = [
+        {
+            "_id": ObjectId(),
+            "attr2": "Escrito",
+            "attr2_list": [{}, {"a": {}}],
+            "my_model_1": {"_id": ObjectId(), "attr1": {}},
+        },
+        {"_id": ObjectId(), "my_model_1": {}},
+        {"_id": ObjectId(), "my_model_1": ObjectId()},
+    ]
+    objs = validate_models(cls=MyModel2, docs=copy.deepcopy(docs))
+    assert objs == [MyModel2(**doc) for doc in copy.deepcopy(docs)]
+    assert objs[0].id == str(docs[0]["_id"])
+    assert objs[0].my_model_1.attr1 is None
+    assert objs[1].my_model_1 is None
+    assert MyModel2.model_validate(copy.deepcopy(docs[0])) == objs[0]
+
+    original_docs = copy.deepcopy(docs)
+    assert validate_models(cls=MyModel2, docs=docs) == objs
+    assert MyModel2.model_validate(docs[0]) == objs[0]
+    assert docs == original_docs
+
+
+def test_construct_model_leaves_missing_required_fields_unset():
+    class MyModel(DbModel):
+        attr: str
+        added_attr: str
+        added_default: list = []
+        _collection = "my_model"
+
+    doc = {"_id": ObjectId(), "attr": "attr"}
+    obj = construct_model(cls=MyModel, doc=doc)
+    assert "added_attr" not in obj.__dict__
+    assert obj.added_default == []
+    assert obj.model_fields_set == {"id", "attr"}
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        assert "added_attr" not in obj.model_dump()
+    dct = consolidate_dict(obj=obj, dct={}, populate=False)
+    assert "added_attr" not in dct
+    assert decode(encode(dct))["attr"] == "attr"
@@ -1,6 +1,5 @@
 from typing import ClassVar
 import pytest
-import pytest_asyncio
 from pyodmongo import (
     AsyncDbEngine,
     DbEngine,
@@ -8,32 +7,32 @@ from pyodmongo import (
     MainBaseModel,
     DbResponse,
     ResponsePaginate,
+    ResponseKeysetPaginate,
     Id,
     DbDecimal,
     Field,
+    ReadCache,
 )
-from pyodmongo.queries import in_
+from pyodmongo.queries import in_, sort
 from pydantic import BaseModel
 from bson import ObjectId
 from faker import Faker
 from decimal import Decimal
 from bson import Decimal128
+from contextlib import closing
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
+from collections import Counter
+from threading import Event
+from pyodmongo.engines.buffered_writer import BufferedWriter
 import copy
 import json
+import time
 
 
 fake = Faker()
 
 
-@pytest_asyncio.fixture
-async def drop_db(async_engine: AsyncDbEngine, engine: DbEngine):
-    await async_engine._client.drop_database("pyodmongo_pytest")
-    engine._client.drop_database("pyodmongo_pytest")
-    yield
-    await async_engine._client.drop_database("pyodmongo_pytest")
-    engine._client.drop_database("pyodmongo_pytest")
-
-
 @pytest.mark.asyncio
 async def test_save_all(async_engine: AsyncDbEngine, engine: DbEngine):
     class MyClass0(DbModel):
@@ -153,6 +152,34 @@ async def test_find(async_engine: AsyncDbEngine, engine: DbEngine, drop_db):
     assert result_1.docs_quantity == 10
     assert len(result_1.docs) == 2
 
+    facet_result_0: ResponsePaginate = await async_engine.find_many(
+        Model=MyClass0,
+        query=query_0,
+        paginate=True,
+        current_page=2,
+        docs_per_page=2,
+        count="facet",
+    )
+    facet_result_1: ResponsePaginate = engine.find_many(
+        Model=MyClass0,
+        query=query_1,
+        paginate=True,
+        current_page=2,
+        docs_per_page=2,
+        count="facet",
+    )
+    assert facet_result_0.page_quantity == 5
+    assert facet_result_0.docs_quantity == 10
+    assert facet_result_1.docs_quantity == 10
+    assert len(facet_result_1.docs) == 2
+    empty_result: ResponsePaginate = engine.find_many(
+        Model=MyClass0, query=MyClass0.attr_1 > 1000, paginate=True, count="facet"
+    )
+    assert empty_result.docs_quantity == 0
+    assert empty_result.docs == []
+    with pytest.raises(ValueError):
+        engine.find_many(Model=MyClass0, paginate=True, count="approximate")
+
 
 @pytest.mark.asyncio
 async def test_delete(async_engine: AsyncDbEngine, engine: DbEngine, drop_db):
@@ -634,3 +661,906 @@ async def test_find_one_returns_one_document(
     result_sync = engine.find_one(Model=MyModel)
     assert isinstance(result_sync, MyModel)
     assert result_sync in objs
+
+
+@pytest.mark.asyncio
+async def test_async_find_iter(async_engine: AsyncDbEngine, drop_db):
+    class MyModel(DbModel):
+        attr: int
+        _collection: ClassVar = "my_model_find_iter_test"
+
+    objs = [MyModel(attr=i) for i in range(50)]
+    await async_engine.save_all(objs)
+
+    found = [
+        obj
+        async for obj in async_engine.find_iter(
+            Model=MyModel, raw_sort={"attr": 1}, batch_size=7
+        )
+    ]
+    assert len(found) == 50
+    assert [obj.attr for obj in found] == list(range(50))
+    assert all(isinstance(obj, MyModel) for obj in found)
+
+    found_dicts = [
+        doc
+        async for doc in async_engine.find_iter(
+            Model=MyModel, query=MyModel.attr >= 40, as_dict=True
+        )
+    ]
+    assert len(found_dicts) == 10
+    assert all(isinstance(doc, dict) for doc in found_dicts)
+
+    iterator = async_engine.find_iter(Model=MyModel, batch_size=5)
+    async for obj in iterator:
+        break
+    await iterator.aclose()
+
+
+def test_sync_find_iter(engine: DbEngine):
+    class MyModel(DbModel):
+        attr: int
+        _collection: ClassVar = "my_model_sync_find_iter_test"
+
+    engine._db[MyModel._collection].drop()
+    objs = [MyModel(attr=i) for i in range(50)]
+    engine.save_all(objs)
+
+    found = list(engine.find_iter(Model=MyModel, raw_sort={"attr": 1}, batch_size=7))
+    assert len(found) == 50
+    assert [obj.attr for obj in found] == list(range(50))
+    assert all(isinstance(obj, MyModel) for obj in found)
+
+    found_dicts = list(
+        engine.find_iter(Model=MyModel, query=MyModel.attr >= 40, as_dict=True)
+    )
+    assert len(found_dicts) == 10
+    assert all(isinstance(doc, dict) for doc in found_dicts)
+
+    with closing(engine.find_iter(Model=MyModel, batch_size=5)) as iterator:
+        first = next(iterator)
+    assert isinstance(first, MyModel)
+    engine._db[MyModel._collection].drop()
+
+
+@pytest.mark.asyncio
+async def test_save_all_insert_new(
+    async_engine: AsyncDbEngine, engine: DbEngine, drop_db
+):
+    class MyModel(DbModel):
+        attr: int
+        _collection: ClassVar = "my_model_insert_new_test"
+
+    existing = MyModel(attr=0)
+    await async_engine.save(existing)
+    existing.attr = 100
+    objs = [existing] + [MyModel(attr=i) for i in range(1, 5)]
+
+    response = await async_engine.save_all(objs, insert_new=True)
+    assert response["my_model_insert_new_test"].inserted_count == 4
+    assert response["my_model_insert_new_test"].upserted_count == 0
+    assert response["my_model_insert_new_test"].modified_count == 1
+    assert all(ObjectId.is_valid(obj.id) for obj in objs)
+    assert all(obj.created_at == obj.updated_at for obj in objs[1:])
+
+    new_objs = [MyModel(attr=i) for i in range(5, 10)]
+    response = engine.save_all(new_objs, insert_new=True)
+    assert response["my_model_insert_new_test"].inserted_count == 5
+    assert all(ObjectId.is_valid(obj.id) for obj in new_objs)
+
+    found = await async_engine.find_many(Model=MyModel, raw_sort={"attr": 1})
+    assert [obj.attr for obj in found] == list(range(1, 10)) + [100]
+    assert found[0] == objs[1]
+
+
+@pytest.mark.asyncio
+async def test_save_only_changed_fields(
+    async_engine: AsyncDbEngine, engine: DbEngine, drop_db
+):
+    class Address(MainBaseModel):
+        street: str
+        city: str
+
+    class MyModel(DbModel):
+        name: str
+        counter: int
+        address: Address
+        _collection: ClassVar = "my_model_track_changes_test"
+        _track_changes: ClassVar = True
+
+    obj = MyModel(name="name", counter=0, address=Address(street="st", city="city"))
+    await async_engine.save(obj)
+    assert obj._snapshot["counter"] == 0
+
+    obj_found = await async_engine.find_one(Model=MyModel, query=MyModel.id == obj.id)
+    assert obj_found._snapshot is not None
+    obj_found.counter += 1
+    obj_found.address.city = "new city"
+    operation = async_engine._update_many_operation(
+        obj=obj_found, query_dict={}, now=obj.created_at, upsert=True, populate=False
+    )
+    assert set(operation._doc["$set"].keys()) == {
+        "counter",
+        "address.city",
+        "updated_at",
+    }
+    await async_engine.save(obj_found)
+    assert obj_found._snapshot["counter"] == 1
+
+    obj_found_sync = engine.find_one(Model=MyModel, query=MyModel.id == obj.id)
+    assert obj_found_sync.counter == 1
+    assert obj_found_sync.address.city == "new city"
+    assert obj_found_sync.name == "name"
+    obj_found_sync.name = "new name"
+    engine.save(obj_found_sync)
+    obj_found = await async_engine.find_one(Model=MyModel, query=MyModel.id == obj.id)
+    assert obj_found.name == "new name"
+    assert obj_found.counter == 1
+
+
+@pytest.mark.asyncio
+async def test_save_all_concurrent_collections(
+    async_engine: AsyncDbEngine, engine: DbEngine, drop_db
+):
+    class MyModel0(DbModel):
+        attr: int = Field(index=True)
+        _collection: ClassVar = "my_model_concurrent_0"
+
+    class MyModel1(DbModel):
+        attr: int
+        _collection: ClassVar = "my_model_concurrent_1"
+
+    class MyModel2(DbModel):
+        attr: int
+        _collection: ClassVar = "my_model_concurrent_2"
+
+    objs = []
+    for i in range(10):
+        objs += [MyModel0(attr=i), MyModel1(attr=i), MyModel2(attr=i)]
+
+    response = await async_engine.save_all(objs, ordered=False, max_concurrency=2)
+    assert list(response.keys()) == [
+        "my_model_concurrent_0",
+        "my_model_concurrent_1",
+        "my_model_concurrent_2",
+    ]
+    assert all(r.upserted_count == 10 for r in response.values())
+    assert all(ObjectId.is_valid(obj.id) for obj in objs)
+    assert "attr" in await async_engine._db["my_model_concurrent_0"].index_information()
+
+    response = engine.save_all(objs, ordered=False)
+    assert all(r.matched_count == 10 for r in response.values())
+
+
+@pytest.mark.asyncio
+async def test_save_all_in_chunks(
+    async_engine: AsyncDbEngine, engine: DbEngine, drop_db
+):
+    class MyModel0(DbModel):
+        attr: int
+        _collection: ClassVar = "my_model_chunks_0"
+
+    class MyModel1(DbModel):
+        attr: int
+        _collection: ClassVar = "my_model_chunks_1"
+
+    objs = [MyModel0(attr=i) if i % 3 else MyModel1(attr=i) for i in range(100)]
+    response = await async_engine.save_all(
+        (obj for obj in objs), chunk_size=7, max_in_flight=3, ordered=False
+    )
+    assert response["my_model_chunks_0"].upserted_count == 66
+    assert response["my_model_chunks_1"].upserted_count == 34
+    objs_0 = [obj for obj in objs if isinstance(obj, MyModel0)]
+    assert [response["my_model_chunks_0"].upserted_ids[i] for i in range(66)] == [
+        obj.id for obj in objs_0
+    ]
+
+    response = engine.save_all(iter(objs), chunk_size=10, max_in_flight=2)
+    assert response["my_model_chunks_0"].matched_count == 66
+    assert response["my_model_chunks_1"].matched_count == 34
+    assert await async_engine._db["my_model_chunks_0"].count_documents({}) == 66
+
+
+def test_merge_chunked_db_responses(engine: DbEngine):
+    def db_response(upserted_ids):
+        return DbResponse(
+            acknowledged=True,
+            deleted_count=0,
+            inserted_count=0,
+            matched_count=1,
+            modified_count=1,
+            upserted_count=len(upserted_ids),
+            upserted_ids=upserted_ids,
+        )
+
+    id_0, id_1, id_2 = [str(ObjectId()) for _ in range(3)]
+    merged = engine._merge_db_responses(
+        responses=[
+            (Counter({"a": 2, "b": 1}), {"a": db_response({1: id_0})}),
+            (Counter({"a": 2}), {"a": db_response({0: id_1, 1: id_2})}),
+        ]
+    )
+    assert merged["a"].upserted_count == 3
+    assert merged["a"].matched_count == 2
+    assert merged["a"].upserted_ids == {1: id_0, 2: id_1, 3: id_2}
+
+
+@pytest.mark.asyncio
+async def test_buffered_writer(async_engine: AsyncDbEngine, engine: DbEngine, drop_db):
+    class MyModel(DbModel):
+        attr: int
+        _collection: ClassVar = "my_model_buffered_writer_test"
+
+    async with async_engine.buffered_writer(
+        max_operations=10, flush_interval_ms=50
+    ) as writer:
+        futures = [writer.add(MyModel(attr=i)) for i in range(25)]
+        responses = await asyncio.gather(*futures[:20])
+        assert all(response.upserted_count == 10 for response in responses)
+        objs = [MyModel(attr=i) for i in range(25, 30)]
+        futures += [writer.add(obj) for obj in objs]
+    assert all(future.done() for future in futures)
+    assert all(ObjectId.is_valid(obj.id) for obj in objs)
+    assert all(obj.created_at is not None for obj in objs)
+
+    with engine.buffered_writer(max_operations=1000, flush_interval_ms=20) as writer:
+        future = writer.add(MyModel(attr=30))
+        assert future.result(timeout=5).upserted_count == 1
+        futures = [writer.add(MyModel(attr=i)) for i in range(31, 40)]
+    assert all(future.done() for future in futures)
+    assert engine._db[MyModel._collection].count_documents({}) == 40
+
+
+def test_buffered_writer_flush_waits_for_timer_write():
+    class MyModel(DbModel):
+        attr: int
+        _collection: ClassVar = "my_model_buffered_writer_wait_test"
+
+    class SlowEngine:
+        def __init__(self):
+            self.writing = Event()
+            self.active = 0
+            self.max_active = 0
+
+        def _save_chunk(self, obj_list, populate, insert_new, ordered):
+            self.writing.set()
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+            time.sleep(0.2)
+            for obj in obj_list:
+                obj.id = Id(ObjectId())
+            self.active -= 1
+            return {MyModel._collection: None}
+
+    slow_engine = SlowEngine()
+    with BufferedWriter(
+        engine=slow_engine, max_operations=2, flush_interval_ms=1
+    ) as writer:
+        obj = MyModel(attr=0)
+        writer.add(obj)
+        assert slow_engine.writing.wait(timeout=5)
+        writer.flush()
+        assert obj.id is not None
+        objs = [MyModel(attr=i) for i in range(1, 3)]
+        futures = [writer.add(obj) for obj in objs]
+    assert all(future.done() for future in futures)
+    assert all(obj.id is not None for obj in objs)
+    assert slow_engine.max_active == 1
+
+
+@pytest.mark.asyncio
+async def test_array_populate_strategy(
+    async_engine: AsyncDbEngine, engine: DbEngine, drop_db
+):
+    class A(DbModel):
+        a1: str
+        _collection: ClassVar = "a"
+
+    class Item(MainBaseModel):
+        a: A | Id
+        a_list: list[A | Id] = []
+
+    class B(DbModel):
+        items: list[Item]
+        a_list: list[A | Id]
+        _collection: ClassVar = "b"
+
+    a_objs = [A(a1=f"a{i}") for i in range(3)]
+    await async_engine.save_all(a_objs)
+    obj_b = B(
+        items=[
+            Item(a=a_objs[0], a_list=[a_objs[2], a_objs[1]]),
+            Item(a=a_objs[1]),
+            Item(a=a_objs[0], a_list=[a_objs[0]]),
+        ],
+        a_list=[a_objs[1], a_objs[2]],
+    )
+    await async_engine.save(obj_b)
+
+    array_async_engine = AsyncDbEngine(
+        mongo_uri="mongodb://localhost:27017",
+        db_name="pyodmongo_pytest",
+        tz_info=async_engine._tz_info,
+        populate_strategy="array",
+    )
+    array_engine = DbEngine(
+        mongo_uri="mongodb://localhost:27017",
+        db_name="pyodmongo_pytest",
+        tz_info=engine._tz_info,
+        populate_strategy="array",
+    )
+    obj_found = await array_async_engine.find_one(Model=B, populate=True)
+    assert obj_found == obj_b
+    assert obj_found.items[0].a_list == [a_objs[2], a_objs[1]]
+    assert array_engine.find_one(Model=B, populate=True) == obj_b
+
+    obj_found = await async_engine.find_one(Model=B, populate=True)
+    assert [item.a for item in obj_found.items] == [item.a for item in obj_b.items]
+    assert obj_found.a_list == obj_b.a_list
+
+    with pytest.raises(ValueError):
+        DbEngine(
+            mongo_uri="mongodb://localhost:27017",
+            db_name="pyodmongo_pytest",
+            populate_strategy="graph",
+        )
+
+
+@pytest.mark.asyncio
+async def test_client_populate(async_engine: AsyncDbEngine, engine: DbEngine, drop_db):
+    class S(DbModel):
+        s1: str = "s1"
+        _collection: ClassVar = "s"
+
+    class A(DbModel):
+        a1: str
+        s: S | Id
+        _collection: ClassVar = "a"
+
+    class Item(MainBaseModel):
+        a: A | Id
+
+    class B(DbModel):
+        b1: A | Id
+        items: list[Item]
+        a_list: list[A | Id]
+        _collection: ClassVar = "b"
+
+    obj_s = S()
+    await async_engine.save(obj_s)
+    a_objs = [A(a1=f"a{i}", s=obj_s) for i in range(3)]
+    await async_engine.save_all(a_objs)
+    b_objs = [
+        B(
+            b1=a_objs[i],
+            items=[Item(a=a_objs[2 - i]), Item(a=a_objs[0])],
+            a_list=[a_objs[2], a_objs[i]],
+        )
+        for i in range(3)
+    ]
+    await async_engine.save_all(b_objs)
+
+    assert await async_engine.find_many(Model=B, populate="client") == b_objs
+    assert engine.find_many(Model=B, populate="client") == b_objs
+    assert await async_engine.find_one(Model=B, populate="client") == b_objs[0]
+    assert engine.find_one(Model=B, populate="client") == b_objs[0]
+    assert [
+        obj
+        async for obj in async_engine.find_iter(
+            Model=B, populate="client", batch_size=2
+        )
+    ] == b_objs
+    assert list(engine.find_iter(Model=B, populate="client", batch_size=2)) == b_objs
+
+    obj_found = engine.find_one(
+        Model=B, populate="client", populate_db_fields=[B.b1], as_dict=True
+    )
+    assert obj_found["b1"]["_id"] == ObjectId(a_objs[0].id)
+    assert obj_found["b1"]["s"] == ObjectId(obj_s.id)
+    assert obj_found["items"][0]["a"] == ObjectId(a_objs[2].id)
+
+    with pytest.raises(ValueError):
+        engine.find_many(Model=B, populate="server")
+    with pytest.raises(ValueError):
+        engine.find_many(Model=B, populate="client", sort=sort((B.b1.a1, 1)))
+    with pytest.raises(ValueError):
+        await async_engine.find_many(
+            Model=B, populate="client", raw_sort={"items.a.a1": 1}
+        )
+    assert engine.find_many(Model=B, populate="client", sort=sort((B.id, -1))) == list(
+        reversed(b_objs)
+    )
+
+
+def test_client_populate_sort_by_populated_field(engine: DbEngine):
+    class A(DbModel):
+        a1: str
+        _collection: ClassVar = "a"
+
+    class B(DbModel):
+        b1: A | Id
+        b2: str
+        _collection: ClassVar = "b"
+
+    arguments = dict(
+        Model=B,
+        query=None,
+        raw_query=None,
+        pipeline=None,
+        paginate=False,
+        current_page=1,
+        docs_per_page=10,
+        no_paginate_limit=None,
+    )
+    for sort_by in ({"b1.a1": 1}, {"b1": 1}):
+        with pytest.raises(ValueError):
+            engine._aggregate_pipeline(
+                sort=None,
+                raw_sort=sort_by,
+                populate="client",
+                populate_db_fields=None,
+                **arguments,
+            )
+    pipeline, _, sort_dict = engine._aggregate_pipeline(
+        sort=None,
+        raw_sort={"b1.a1": 1},
+        populate="client",
+        populate_db_fields=[],
+        **arguments,
+    )
+    assert sort_dict == {"b1.a1": 1}
+    for populate in (True, "client"):
+        pipeline, _, _ = engine._aggregate_pipeline(
+            sort=None,
+            raw_sort={"b2": 1},
+            populate=populate,
+            populate_db_fields=None,
+            **arguments,
+        )
+        assert {"$sort": {"b2": 1}} in pipeline
+
+
+@pytest.mark.asyncio
+async def test_trusted_hydration(
+    async_engine: AsyncDbEngine, engine: DbEngine, drop_db
+):
+    class A(DbModel):
+        a1: str
+        _collection: ClassVar = "a"
+
+    class Item(MainBaseModel):
+        a: A | Id
+        price: DbDecimal
+        tags: list[str] = []
+
+    class B(DbModel):
+        b1: A | Id
+        items: list[Item]
+        prices: list[DbDecimal]
+        nested: Item | None = None
+        _collection: ClassVar = "b"
+
+    obj_a = A(a1="a1")
+    await async_engine.save(obj_a)
+    obj_b = B(
+        b1=obj_a,
+        items=[Item(a=obj_a, price=DbDecimal("1.5"), tags=["x"])],
+        prices=[DbDecimal("2.25"), DbDecimal(3)],
+    )
+    await async_engine.save(obj_b)
+
+    trusted_async_engine = AsyncDbEngine(
+        mongo_uri="mongodb://localhost:27017",
+        db_name="pyodmongo_pytest",
+        tz_info=async_engine._tz_info,
+        trusted=True,
+    )
+    for populate in (False, True):
+        validated = await async_engine.find_many(Model=B, populate=populate)
+        assert await trusted_async_engine.find_many(Model=B, populate=populate) == (
+            validated
+        )
+        assert engine.find_many(Model=B, populate=populate, trusted=True) == validated
+        obj_found = engine.find_one(Model=B, populate=populate, trusted=True)
+        assert obj_found == validated[0]
+        assert type(obj_found.prices[0]) is DbDecimal
+    assert obj_found == obj_b
+
+
+@pytest.mark.asyncio
+async def test_hydration_executor_and_chunks(async_engine: AsyncDbEngine, drop_db):
+    class MyClass(DbModel):
+        attr_0: str
+        attr_1: int
+        _collection: ClassVar = "my_class"
+
+    await async_engine.save_all(
+        [MyClass(attr_0=fake.name(), attr_1=i) for i in range(250)]
+    )
+    expected = await async_engine.find_many(Model=MyClass, raw_sort={"attr_1": 1})
+
+    ticks = 0
+
+    async def _ticker():
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0)
+
+    chunked_engine = AsyncDbEngine(
+        mongo_uri="mongodb://localhost:27017",
+        db_name="pyodmongo_pytest",
+        tz_info=async_engine._tz_info,
+        hydration_chunk_size=10,
+    )
+    ticker = asyncio.create_task(_ticker())
+    await asyncio.sleep(0)
+    docs = await chunked_engine._aggregate_cursor(
+        Model=MyClass,
+        pipeline=[{"$sort": {"attr_1": 1}}],
+        tz_info=async_engine._tz_info,
+    ).to_list(length=None)
+    ticks = 0
+    assert await chunked_engine._hydrate(Model=MyClass, docs=docs) == expected
+    assert ticks >= 24
+    ticker.cancel()
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        executor_engine = AsyncDbEngine(
+            mongo_uri="mongodb://localhost:27017",
+            db_name="pyodmongo_pytest",
+            tz_info=async_engine._tz_info,
+            hydration_executor=executor,
+            hydration_chunk_size=100,
+        )
+        assert (
+            await executor_engine.find_many(Model=MyClass, raw_sort={"attr_1": 1})
+            == expected
+        )
+        obj_found = await executor_engine.find_one(
+            Model=MyClass, raw_query={"attr_1": 3}
+        )
+        assert obj_found == expected[3]
+
+    with pytest.raises(ValueError):
+        AsyncDbEngine(
+            mongo_uri="mongodb://localhost:27017",
+            db_name="pyodmongo_pytest",
+            hydration_chunk_size=0,
+        )
+
+
+@pytest.mark.asyncio
+async def test_keyset_pagination(
+    async_engine: AsyncDbEngine, engine: DbEngine, drop_db
+):
+    class MyClass(DbModel):
+        attr_0: str
+        attr_1: int
+        _collection: ClassVar = "my_class"
+
+    await async_engine.save_all(
+        [MyClass(attr_0=fake.name(), attr_1=i % 7) for i in range(53)]
+    )
+    query = MyClass.attr_1 != 3
+    keyset_sort = sort((MyClass.attr_1, -1), (MyClass.attr_0, 1))
+    expected = await async_engine.find_many(
+        Model=MyClass,
+        query=query,
+        sort=sort((MyClass.attr_1, -1), (MyClass.attr_0, 1), (MyClass.id, 1)),
+    )
+
+    for find_many in (async_engine.find_many, engine.find_many):
+
+        async def _page(**kwargs):
+            response = find_many(
+                Model=MyClass,
+                query=query,
+                sort=keyset_sort,
+                paginate="keyset",
+                docs_per_page=10,
+                **kwargs,
+            )
+            return await response if asyncio.iscoroutine(response) else response
+
+        pages = [await _page()]
+        assert pages[0].previous_token is None
+        while pages[-1].next_token:
+            pages.append(await _page(after=pages[-1].next_token))
+        assert [obj for page in pages for obj in page.docs] == expected
+        assert [len(page.docs) for page in pages] == [10, 10, 10, 10, 6]
+        assert isinstance(pages[-1], ResponseKeysetPaginate)
+
+        previous_page = await _page(before=pages[-1].previous_token)
+        assert previous_page.docs == pages[-2].docs
+        assert previous_page.next_token == pages[-2].next_token
+        first_page = await _page(before=pages[1].previous_token)
+        assert first_page.docs == pages[0].docs
+        assert first_page.previous_token is None
+
+    with pytest.raises(ValueError):
+        await async_engine.find_many(
+            Model=MyClass, paginate="keyset", after="token", before="token"
+        )
+    with pytest.raises(ValueError):
+        engine.find_many(Model=MyClass, paginate="keyset", after="invalid token")
+
+
+@pytest.mark.asyncio
+async def test_keyset_pagination_optional_sort_field(
+    async_engine: AsyncDbEngine, engine: DbEngine, drop_db
+):
+    class MyClass(DbModel):
+        attr_0: int | None = None
+        _collection: ClassVar = "my_class"
+
+    engine.save_all([MyClass(attr_0=None if i % 3 else i % 4) for i in range(25)])
+    engine._db["my_class"].update_many({"attr_0": None}, {"$unset": {"attr_0": ""}})
+    for direction in (1, -1):
+        expected = engine.find_many(
+            Model=MyClass, raw_sort={"attr_0": direction, "_id": direction}
+        )
+        pages = [
+            await async_engine.find_many(
+                Model=MyClass,
+                raw_sort={"attr_0": direction},
+                paginate="keyset",
+                docs_per_page=4,
+            )
+        ]
+        while pages[-1].next_token:
+            pages.append(
+                engine.find_many(
+                    Model=MyClass,
+                    raw_sort={"attr_0": direction},
+                    paginate="keyset",
+                    docs_per_page=4,
+                    after=pages[-1].next_token,
+                )
+            )
+        assert [obj for page in pages for obj in page.docs] == expected
+        previous_pages = [pages[-1]]
+        while previous_pages[-1].previous_token:
+            previous_pages.append(
+                engine.find_many(
+                    Model=MyClass,
+                    raw_sort={"attr_0": direction},
+                    paginate="keyset",
+                    docs_per_page=4,
+                    before=previous_pages[-1].previous_token,
+                )
+            )
+        assert [page.docs for page in reversed(previous_pages)] == [
+            page.docs for page in pages
+        ]
+
+
+@pytest.mark.asyncio
+async def test_count_strategies(async_engine: AsyncDbEngine, engine: DbEngine, drop_db):
+    class MyClass(DbModel):
+        attr_0: int
+        _collection: ClassVar = "my_class"
+
+    await async_engine.save_all([MyClass(attr_0=i) for i in range(25)])
+    query = MyClass.attr_0 < 20
+
+    for find_many in (async_engine.find_many, engine.find_many):
+
+        async def _find(**kwargs):
+            response = find_many(
+                Model=MyClass, paginate=True, docs_per_page=10, **kwargs
+            )
+            return await response if asyncio.iscoroutine(response) else response
+
+        result = await _find(count="estimated")
+        assert result.count_strategy == "estimated"
+        assert result.docs_quantity == 25
+        assert result.has_next is True
+        result = await _find(query=query, count="estimated")
+        assert result.count_strategy == "exact"
+        assert result.docs_quantity == 20
+
+        result = await _find(query=query, current_page=2, count="none")
+        assert result.count_strategy == "none"
+        assert result.docs_quantity is None
+        assert result.page_quantity is None
+        assert len(result.docs) == 10
+        assert result.has_next is False
+        result = await _find(query=query, current_page=1, count="none")
+        assert len(result.docs) == 10
+        assert result.has_next is True
+
+        result = await _find(query=query, count="cached")
+        assert (result.count_strategy, result.docs_quantity) == ("exact", 20)
+        await async_engine.save(MyClass(attr_0=-1))
+        result = await _find(query=query, current_page=3, count="cached")
+        assert (result.count_strategy, result.docs_quantity) == ("cached", 20)
+        assert len(result.docs) == 1
+        await async_engine.delete(Model=MyClass, query=MyClass.attr_0 == -1)
+
+    short_ttl_engine = DbEngine(
+        mongo_uri="mongodb://localhost:27017",
+        db_name="pyodmongo_pytest",
+        count_cache_ttl=0,
+    )
+    result = short_ttl_engine.find_many(Model=MyClass, paginate=True, count="cached")
+    result = short_ttl_engine.find_many(Model=MyClass, paginate=True, count="cached")
+    assert (result.count_strategy, result.docs_quantity) == ("exact", 25)
+
+
+@pytest.mark.asyncio
+async def test_session_identity_map_and_flush(
+    async_engine: AsyncDbEngine, engine: DbEngine, drop_db
+):
+    class A(DbModel):
+        a1: str
+        _collection: ClassVar = "a"
+
+    class B(DbModel):
+        b1: A | Id
+        b2: int = 0
+        _collection: ClassVar = "b"
+
+    obj_a = A(a1="a1")
+    await async_engine.save(obj_a)
+    await async_engine.save_all([B(b1=obj_a), B(b1=obj_a)])
+
+    async with async_engine.session() as session:
+        a_found = await session.get(A, obj_a.id)
+        b_list = await session.find_many(Model=B, populate=True)
+        assert all(b.b1 is a_found for b in b_list)
+        assert await session.find_one(Model=A, query=A.id == obj_a.id) is a_found
+        assert await session.find_one(Model=B, query=B.id == b_list[0].id) is (
+            b_list[0]
+        )
+        for b in b_list:
+            b.b2 = 1
+            session.add(b)
+        new_a = A(a1="new")
+        session.add(new_a)
+        assert session.pending == 3
+    assert new_a.id is not None
+    assert await session.get(A, new_a.id) is new_a
+    assert [b.b2 for b in await async_engine.find_many(Model=B)] == [1, 1]
+
+    with engine.session() as session:
+        a_found = session.get(A, obj_a.id)
+        assert session.get(A, str(obj_a.id)) is a_found
+        b_page = session.find_many(Model=B, populate=True, paginate=True)
+        assert all(b.b1 is a_found for b in b_page.docs)
+        a_found.a1 = "changed"
+        session.add(a_found)
+        assert session.get(A, ObjectId(obj_a.id)) is a_found
+    assert engine.find_one(Model=A, query=A.id == obj_a.id).a1 == "changed"
+
+    with pytest.raises(RuntimeError):
+        with engine.session() as session:
+            session.add(A(a1="discarded"))
+            raise RuntimeError
+    assert engine.find_one(Model=A, query=A.a1 == "discarded") is None
+
+
+@pytest.mark.asyncio
+async def test_find_one_read_cache(
+    async_engine: AsyncDbEngine, engine: DbEngine, drop_db
+):
+    class MyClass(DbModel):
+        attr_0: str
+        _collection: ClassVar = "my_class"
+        _read_cache: ClassVar = ReadCache(max_size=10, ttl=60)
+
+    obj = MyClass(attr_0="zero")
+    await async_engine.save(obj)
+
+    obj_found = await async_engine.find_one(Model=MyClass, query=MyClass.id == obj.id)
+    assert MyClass._read_cache.stats()["size"] == 2
+    await async_engine._db["my_class"].update_one(
+        {"_id": ObjectId(obj.id)}, {"$set": {"attr_0": "changed outside"}}
+    )
+    cached_obj = engine.find_one(Model=MyClass, raw_query={"_id": ObjectId(obj.id)})
+    assert cached_obj == obj_found
+    assert cached_obj is not obj_found
+    cached_dict = engine.find_one(
+        Model=MyClass, query=MyClass.id == obj.id, as_dict=True
+    )
+    assert cached_dict["attr_0"] == "zero"
+    assert MyClass._read_cache.hits == 2
+    not_cached = engine.find_one(Model=MyClass, query=MyClass.attr_0 != "x")
+    assert not_cached.attr_0 == "changed outside"
+
+    obj.attr_0 = "saved"
+    engine.save(obj)
+    assert MyClass._read_cache.stats()["size"] == 0
+    obj_found = await async_engine.find_one(Model=MyClass, query=MyClass.id == obj.id)
+    assert obj_found.attr_0 == "saved"
+
+    await async_engine.save_all([obj])
+    assert MyClass._read_cache.stats()["size"] == 0
+    engine.find_one(Model=MyClass, query=MyClass.id == obj.id)
+    await async_engine.delete(Model=MyClass, query=MyClass.attr_0 == "saved")
+    assert MyClass._read_cache.stats()["size"] == 0
+    assert engine.find_one(Model=MyClass, query=MyClass.id == obj.id) is None
+
+
+@pytest.mark.asyncio
+async def test_find_query_cache(async_engine: AsyncDbEngine, engine: DbEngine, drop_db):
+    class Ref(DbModel):
+        attr_ref: str
+        _collection: ClassVar = "ref"
+
+    class MyClass(DbModel):
+        attr_0: str
+        ref: Ref | Id
+        _collection: ClassVar = "my_class"
+        _query_cache_ttl: ClassVar = 60
+
+    ref = Ref(attr_ref="ref")
+    engine.save(ref)
+    engine.save_all([MyClass(attr_0=f"{i}", ref=ref) for i in range(3)])
+    engine.find_many(Model=MyClass, populate=True)
+    engine.find_many(Model=MyClass)
+    engine.find_one(Model=MyClass, query=MyClass.attr_0 == "0")
+    paginated = engine.find_many(Model=MyClass, paginate=True, count="facet")
+    await async_engine.find_many(Model=MyClass, populate=True)
+    engine._db["my_class"].update_many({}, {"$set": {"attr_0": "changed outside"}})
+    engine._db["ref"].update_many({}, {"$set": {"attr_ref": "changed outside"}})
+
+    cached = engine.find_many(Model=MyClass, populate=True)
+    assert [obj.attr_0 for obj in cached] == ["0", "1", "2"]
+    assert cached[0].ref.attr_ref == "ref"
+    assert cached[0] is not engine.find_many(Model=MyClass, populate=True)[0]
+    async_cached = await async_engine.find_many(Model=MyClass, populate=True)
+    assert async_cached == cached
+    assert engine.find_one(Model=MyClass, query=MyClass.attr_0 == "0").attr_0 == "0"
+    assert (
+        engine.find_many(Model=MyClass, paginate=True, count="facet").docs
+        == paginated.docs
+    )
+    not_cached = engine.find_many(Model=MyClass, query=MyClass.attr_0 != "0")
+    assert not_cached[0].attr_0 == "changed outside"
+
+    engine.save(Ref(attr_ref="other"))
+    populated = engine.find_many(Model=MyClass, populate=True)
+    assert populated[0].attr_0 == "changed outside"
+    assert populated[0].ref.attr_ref == "changed outside"
+    assert engine.find_many(Model=MyClass)[0].attr_0 == "0"
+
+    engine.delete(Model=MyClass, query=MyClass.attr_0 == "missing")
+    assert engine.find_many(Model=MyClass)[0].attr_0 == "changed outside"
+    assert (await async_engine.find_many(Model=MyClass, populate=True))[0] == cached[0]
+    populated[0].attr_0 = "saved"
+    await async_engine.save_all(populated)
+    saved = await async_engine.find_many(Model=MyClass, populate=True)
+    assert saved[0].attr_0 == "saved"
+
+
+@pytest.mark.asyncio
+async def test_save_tracked_populated_then_unpopulated(
+    async_engine: AsyncDbEngine, drop_db
+):
+    class B(DbModel):
+        b1: str
+        _collection: ClassVar = "b_track_changes_populate_test"
+
+    class A(DbModel):
+        a1: str
+        b: B | Id
+        _collection: ClassVar = "a_track_changes_populate_test"
+        _track_changes: ClassVar = True
+
+    obj_b = B(b1="b1")
+    await async_engine.save(obj_b)
+    obj = A(a1="a1", b=obj_b)
+    await async_engine.save(obj, populate=True)
+    assert obj._snapshot["b"]["b1"] == "b1"
+    doc = await async_engine._db[A._collection].find_one({"_id": ObjectId(obj.id)})
+    assert doc["b"]["b1"] == "b1"
+
+    operation = async_engine._update_many_operation(
+        obj=obj, query_dict={}, now=obj.updated_at, upsert=True, populate=False
+    )
+    assert operation._doc["$set"]["b"] == ObjectId(obj_b.id)
+    await async_engine.save(obj, populate=False)
+    doc = await async_engine._db[A._collection].find_one({"_id": ObjectId(obj.id)})
+    assert doc["b"] == ObjectId(obj_b.id)
+    assert obj._snapshot["b"] == ObjectId(obj_b.id)
@@ -0,0 +1,98 @@
+from pyodmongo import DbModel
+from pyodmongo.queries import sort
+from pyodmongo.services.keyset import (
+    encode_token,
+    decode_token,
+    keyset_sort,
+    keyset_match,
+    keyset_page,
+)
+from pyodmongo.engines.utils import mount_base_pipeline
+from bson import ObjectId
+from datetime import datetime
+from typing import ClassVar
+import pytest
+
+
+def test_keyset_sort_and_match():
+    class MyClass(DbModel):
+        attr_0: str
+        attr_1: int
+        _collection: ClassVar = "my_class"
+
+    sort_dict = sort((MyClass.attr_1, -1), (MyClass.attr_0, 1)).to_dict()
+    assert keyset_sort(sort=sort_dict, reverse=False) == {
+        "attr_1": -1,
+        "attr_0": 1,
+        "_id": 1,
+    }
+    assert keyset_sort(sort=sort_dict, reverse=True) == {
+        "attr_1": 1,
+        "attr_0": -1,
+        "_id": -1,
+    }
+    assert keyset_sort(sort={}, reverse=False) == {"_id": 1}
+
+    _id = ObjectId()
+    values = [3, "abc", _id]
+    assert keyset_match(sort=keyset_sort(sort_dict, reverse=False), values=values) == {
+        "$or": [
+            {"$or": [{"attr_1": {"$lt": 3}}, {"attr_1": None}]},
+            {"attr_1": 3, "attr_0": {"$gt": "abc"}},
+            {"attr_1": 3, "attr_0": "abc", "_id": {"$gt": _id}},
+        ]
+    }
+    assert keyset_match(sort={"_id": -1}, values=[_id]) == {"_id": {"$lt": _id}}
+    assert keyset_match(sort={"attr_1": 1, "_id": 1}, values=[None, _id]) == {
+        "$or": [
+            {"attr_1": {"$ne": None}},
+            {"attr_1": None, "_id": {"$gt": _id}},
+        ]
+    }
+    assert keyset_match(sort={"attr_1": -1, "_id": -1}, values=[None, _id]) == {
+        "attr_1": None,
+        "_id": {"$lt": _id},
+    }
+    with pytest.raises(ValueError):
+        keyset_match(sort={"_id": 1}, values=[1, _id])
+
+    pipeline = mount_base_pipeline(
+        Model=MyClass,
+        query={},
+        sort=keyset_sort(sort_dict, reverse=False),
+        populate=False,
+        pipeline=None,
+        populate_db_fields=None,
+        paginate=False,
+        current_page=1,
+        docs_per_page=1,
+        no_paginate_limit=11,
+        fields=[MyClass.attr_0],
+        keyset=True,
+    )
+    assert pipeline[-1] == {"$project": {"attr_0": 1, "attr_1": 1, "_id": 1}}
+
+
+def test_keyset_tokens():
+    _id = ObjectId()
+    values = [datetime(2024, 1, 2, 3, 4, 5), {"a": 1}, None, _id]
+    assert decode_token(encode_token(values)) == values
+    for token in ("not a token", encode_token([])[:-3], "e30="):
+        with pytest.raises(ValueError):
+            decode_token(token)
+
+    docs = [{"_id": i, "attr_0": {"attr_1": i * 10}} for i in range(4)]
+    page_sort = {"attr_0.attr_1": 1, "_id": 1}
+    page, previous_token, next_token = keyset_page(
+        docs=list(docs), sort=page_sort, docs_per_page=3, after=False, before=False
+    )
+    assert page == docs[:3]
+    assert previous_token is None
+    assert decode_token(next_token) == [20, 2]
+
+    page, previous_token, next_token = keyset_page(
+        docs=docs[::-1], sort=page_sort, docs_per_page=3, after=False, before=True
+    )
+    assert page == docs[1:]
+    assert decode_token(previous_token) == [10, 1]
+    assert decode_token(next_token) == [30, 3]
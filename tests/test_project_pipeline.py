@@ -1,7 +1,10 @@
-from pyodmongo import DbModel, Field, AsyncDbEngine
+from pyodmongo import DbModel, MainBaseModel, Field, AsyncDbEngine, DbEngine, Id
+from pyodmongo.engines.utils import mount_base_pipeline, hydrate_models
+from pyodmongo.services.projection import field_paths, partial_model
+from bson import ObjectId
+from datetime import datetime
 from pydantic import ConfigDict
 from typing import ClassVar
-import pytest_asyncio
 import pytest
 
 
@@ -10,11 +13,6 @@ def to_lower_camel(string: str) -> str:
     return "".join(words[:1] + [word.capitalize() for word in words[1:]])
 
 
-mongo_uri = "mongodb://localhost:27017"
-db_name = "pyodmongo_pytest"
-engine = AsyncDbEngine(mongo_uri=mongo_uri, db_name=db_name)
-
-
 class MyModel(DbModel):
     name: str
     age: int
@@ -30,19 +28,163 @@ class MyModelRead(DbModel):
     _collection: ClassVar = "my_model"
 
 
-@pytest_asyncio.fixture()
-async def drop_collections():
-    await engine._db[MyModel._collection].drop()
-    yield
-    await engine._db[MyModel._collection].drop()
-
-
 @pytest.mark.asyncio
-async def test_project_pipilene(drop_collections):
+async def test_project_pipilene(async_engine: AsyncDbEngine, drop_db):
     obj_my_model = MyModel(
         name="A name", age=10, one_name="One Name", other_name="Other Name"
     )
-    await engine.save(obj_my_model)
-    obj_my_model_read = await engine.find_one(Model=MyModelRead)
+    await async_engine.save(obj_my_model)
+    obj_my_model_read = await async_engine.find_one(Model=MyModelRead)
     assert obj_my_model_read.name == "A name"
     assert obj_my_model_read.other_name == "Other Name"
+
+
+class City(DbModel):
+    name: str
+    state: str
+    _collection: ClassVar = "city"
+
+
+class Address(MainBaseModel):
+    street: str
+    city: City | Id
+
+
+class Person(DbModel):
+    name: str
+    age: int
+    address: Address
+    _collection: ClassVar = "person"
+
+
+def test_fields_projection_stages():
+    pipeline = mount_base_pipeline(
+        Model=Person,
+        query={},
+        sort={"age": 1},
+        populate=True,
+        pipeline=None,
+        populate_db_fields=None,
+        paginate=False,
+        current_page=1,
+        docs_per_page=1,
+        no_paginate_limit=None,
+        fields=[Person.name, Person.address.city.name],
+    )
+    assert pipeline[:3] == [
+        {"$match": {}},
+        {"$sort": {"age": 1}},
+        {"$project": {"name": 1, "address.city": 1}},
+    ]
+    lookup = pipeline[3]["$lookup"]
+    assert lookup["localField"] == "address.city"
+    assert lookup["pipeline"] == [{"$project": {"name": 1}}]
+
+    pipeline = mount_base_pipeline(
+        Model=Person,
+        query={},
+        sort={},
+        populate=False,
+        pipeline=None,
+        populate_db_fields=None,
+        paginate=False,
+        current_page=1,
+        docs_per_page=1,
+        no_paginate_limit=None,
+        fields=[Person.address, Person.address.street],
+    )
+    assert pipeline == [{"$match": {}}, {"$project": {"address": 1}}]
+
+    with pytest.raises(TypeError):
+        field_paths(fields=["name"])
+
+
+def test_partial_model():
+    PartialPerson = partial_model(Person)
+    assert partial_model(Person) is PartialPerson
+    assert issubclass(PartialPerson, Person)
+    assert PartialPerson._track_changes
+    obj = PartialPerson(name="Joe", address={"city": {"name": "Rio"}})
+    assert obj.age is None
+    assert obj.address.street is None
+    assert obj.address.city.name == "Rio"
+    assert obj.address.city.state is None
+
+
+def test_save_partial_model_sends_only_changes(engine: DbEngine):
+    now = datetime.now()
+    obj = hydrate_models(
+        Model=Person, docs=[{"_id": ObjectId(), "age": 4}], partial=True, trusted=False
+    )[0]
+    obj.age = 5
+    for populate in (False, True):
+        for query_dict in ({}, {"age": 4}):
+            update = engine._update_many_operation(
+                obj=obj, query_dict=query_dict, now=now, upsert=True, populate=populate
+            )._doc
+            assert update["$set"] == {"age": 5, "updated_at": now}
+            assert "$unset" not in update
+            assert update["$setOnInsert"] == {"created_at": now}
+
+    city_id = ObjectId()
+    obj = hydrate_models(
+        Model=Person,
+        docs=[{"_id": ObjectId(), "address": {"city": city_id}}],
+        partial=True,
+        trusted=False,
+    )[0]
+    obj.name = "Joe"
+    update = engine._update_many_operation(
+        obj=obj, query_dict={}, now=now, upsert=True, populate=False
+    )._doc
+    assert update["$set"] == {"name": "Joe", "updated_at": now}
+    assert update["$setOnInsert"] == {"address": {"city": city_id}, "created_at": now}
+
+    with pytest.raises(ValueError):
+        engine._update_many_operation(
+            obj=partial_model(Person)(id=obj.id, age=5),
+            query_dict={},
+            now=now,
+            upsert=True,
+            populate=False,
+        )
+
+
+@pytest.mark.asyncio
+async def test_find_with_fields(async_engine: AsyncDbEngine, drop_db):
+    obj_city = City(name="Rio", state="RJ")
+    await async_engine.save(obj_city)
+    obj_person = Person(
+        name="Joe", age=30, address=Address(street="Main", city=obj_city)
+    )
+    await async_engine.save(obj_person)
+
+    obj_found = await async_engine.find_one(
+        Model=Person, populate=True, fields=[Person.name, Person.address.city.name]
+    )
+    assert isinstance(obj_found, Person)
+    assert obj_found.id == obj_person.id
+    assert obj_found.name == "Joe"
+    assert obj_found.age is None
+    assert obj_found.address.street is None
+    assert obj_found.address.city.name == "Rio"
+    assert obj_found.address.city.state is None
+
+    docs = await async_engine.find_many(Model=Person, fields=[Person.age], as_dict=True)
+    assert docs == [{"_id": ObjectId(obj_person.id), "age": 30}]
+
+    obj_found.name = "Joseph"
+    await async_engine.save(obj_found)
+    obj_found = await async_engine.find_one(Model=Person)
+    assert obj_found.name == "Joseph"
+    assert obj_found.age == 30
+    assert obj_found.address.street == "Main"
+
+    obj_found = await async_engine.find_one(Model=Person, fields=[Person.age])
+    obj_found.age = 31
+    await async_engine.save(obj_found, populate=True)
+    obj_found = await async_engine.find_one(Model=Person)
+    assert obj_found.name == "Joseph"
+    assert obj_found.age == 31
+    assert obj_found.address.street == "Main"
+    assert obj_found.address.city == obj_city.id
@@ -0,0 +1,60 @@
+from pyodmongo.services.query_cache import (
+    pipeline_collections,
+    query_cache_key,
+    version_key,
+)
+from bson import ObjectId
+from bson.codec_options import CodecOptions
+from datetime import timezone, timedelta
+
+
+def test_pipeline_collections():
+    pipeline = [
+        {"$match": {"attr_0": "zero"}},
+        {
+            "$lookup": {
+                "from": "b",
+                "localField": "b",
+                "foreignField": "_id",
+                "as": "b",
+                "pipeline": [{"$lookup": {"from": "c", "as": "c", "pipeline": []}}],
+            }
+        },
+        {"$graphLookup": {"from": "a", "startWith": "$parent", "as": "parents"}},
+        {"$unionWith": "e"},
+        {"$unionWith": {"coll": "d", "pipeline": [{"$match": {}}]}},
+    ]
+    assert pipeline_collections("a", pipeline) == ["a", "b", "c", "d", "e"]
+    assert pipeline_collections("a", []) == ["a"]
+    assert version_key("a") == "query_version/a"
+
+
+def test_query_cache_key():
+    pipeline = [{"$match": {"attr_0": "zero"}}, {"$sort": {"a": 1, "b": -1}}]
+    versions = [ObjectId()]
+    codec_options = CodecOptions()
+    key = query_cache_key("a", pipeline, codec_options, versions)
+    assert key.startswith("query/a/")
+    assert key == query_cache_key(
+        "a",
+        [{"$match": {"attr_0": "zero"}}, {"$sort": {"a": 1, "b": -1}}],
+        CodecOptions(),
+        list(versions),
+    )
+    other_keys = [
+        query_cache_key("b", pipeline, codec_options, versions),
+        query_cache_key(
+            "a",
+            [{"$match": {"attr_0": "zero"}}, {"$sort": {"b": -1, "a": 1}}],
+            codec_options,
+            versions,
+        ),
+        query_cache_key(
+            "a",
+            pipeline,
+            CodecOptions(tz_aware=True, tzinfo=timezone(timedelta(hours=-3))),
+            versions,
+        ),
+        query_cache_key("a", pipeline, codec_options, [ObjectId()]),
+    ]
+    assert len({key, *other_keys}) == 5
@@ -0,0 +1,147 @@
+from pyodmongo import (
+    DbEngine,
+    DbModel,
+    ReadCache,
+    MemoryCacheBackend,
+    SqliteCacheBackend,
+)
+from bson import ObjectId
+from typing import ClassVar
+import pytest
+import sqlite3
+import time
+
+
+def test_read_cache_lru_ttl_and_stats():
+    read_cache = ReadCache(max_size=2, ttl=None)
+    read_cache.set("a", {"v": 1})
+    read_cache.set("b", {"v": 2})
+    assert read_cache.get("a") == {"v": 1}
+    read_cache.set("c", {"v": 3})
+    assert read_cache.get("b") is None
+    assert read_cache.get("a") == {"v": 1}
+    assert read_cache.get("c") == {"v": 3}
+    assert read_cache.get("c") is not read_cache.get("c")
+    assert read_cache.stats() == {"hits": 5, "misses": 1, "evictions": 1, "size": 2}
+
+    read_cache.delete(["a", "missing"])
+    assert read_cache.get("a") is None
+    read_cache.clear()
+    assert len(read_cache) == 0
+
+    short_ttl_cache = ReadCache(ttl=0.01)
+    short_ttl_cache.set("a", {"v": 1})
+    time.sleep(0.02)
+    assert short_ttl_cache.get("a") is None
+    assert len(short_ttl_cache) == 0
+
+    with pytest.raises(ValueError):
+        ReadCache(max_size=0)
+
+
+def test_read_cache_versions_discard_stale_stores():
+    read_cache = ReadCache()
+    key = read_cache.versioned_key("my_class/1")
+    assert key.startswith("my_class/1/")
+    assert read_cache.versioned_key("my_class/1") == key
+    read_cache.set(key, {"attr_0": "zero"})
+    assert read_cache.get(read_cache.versioned_key("my_class/1")) == {"attr_0": "zero"}
+
+    stale_key = read_cache.versioned_key("my_class/1")
+    read_cache.delete(["my_class/1"])
+    assert len(read_cache) == 0
+    read_cache.set(stale_key, {"attr_0": "stale"})
+    current_key = read_cache.versioned_key("my_class/1")
+    assert current_key != stale_key
+    assert read_cache.get(current_key) is None
+
+    read_cache.set(current_key, {"attr_0": "one"})
+    read_cache.clear(prefix="my_class/")
+    assert len(read_cache) == 0
+
+
+def test_read_cache_on_shared_backend(tmp_path):
+    path = str(tmp_path / "cache.sqlite")
+    read_cache_0 = ReadCache(backend=SqliteCacheBackend(path=path))
+    read_cache_1 = ReadCache(backend=SqliteCacheBackend(path=path))
+    read_cache_0.set("my_class/1", {"attr_0": "zero"})
+    assert read_cache_1.get("my_class/1") == {"attr_0": "zero"}
+    read_cache_1.clear(prefix="my_class/")
+    assert read_cache_0.get("my_class/1") is None
+    assert read_cache_0.stats()["evictions"] == 0
+
+
+def test_engine_does_not_store_documents_read_before_a_write(engine: DbEngine):
+    class MyClass(DbModel):
+        attr_0: str
+        _collection: ClassVar = "my_class"
+        _read_cache: ClassVar = ReadCache()
+
+    _id = ObjectId()
+    key = engine._read_cache_key(
+        Model=MyClass,
+        query=None,
+        raw_query={"_id": _id},
+        populate=False,
+        pipeline=None,
+        fields=None,
+    )
+    engine._invalidate_read_cache(Model=MyClass, ids=[str(_id)])
+    engine._store_read_cache(
+        Model=MyClass, key=key, docs=[{"_id": _id, "attr_0": "stale"}]
+    )
+    key = engine._read_cache_key(
+        Model=MyClass,
+        query=MyClass.id == _id,
+        raw_query=None,
+        populate=False,
+        pipeline=None,
+        fields=None,
+    )
+    assert engine._read_cached(Model=MyClass, key=key, tz_info=None) is None
+
+
+class FlakyBackend(MemoryCacheBackend):
+    failing = False
+
+    def __getattribute__(self, name):
+        if name in ("get", "get_many", "set", "set_many", "delete", "clear"):
+            if object.__getattribute__(self, "failing"):
+                raise sqlite3.OperationalError("database is locked")
+        return super().__getattribute__(name)
+
+
+def test_engine_degrades_to_misses_when_the_cache_fails(engine: DbEngine):
+    backend = FlakyBackend()
+
+    class MyClass(DbModel):
+        attr_0: str
+        _collection: ClassVar = "my_class"
+        _read_cache: ClassVar = ReadCache(backend=backend)
+
+    def read_cache_key():
+        return engine._read_cache_key(
+            Model=MyClass,
+            query=None,
+            raw_query={"_id": _id},
+            populate=False,
+            pipeline=None,
+            fields=None,
+        )
+
+    _id = ObjectId()
+    engine._store_read_cache(
+        Model=MyClass, key=read_cache_key(), docs=[{"_id": _id, "attr_0": "zero"}]
+    )
+    assert engine._read_cached(Model=MyClass, key=read_cache_key(), tz_info=None)
+
+    backend.failing = True
+    assert read_cache_key() is None
+    engine._invalidate_read_cache(Model=MyClass, ids=[str(_id)])
+    engine._invalidate_query_cache(collection_name="my_class")
+    assert len(engine._pending_invalidations) == 2
+
+    backend.failing = False
+    key = read_cache_key()
+    assert not engine._pending_invalidations
+    assert engine._read_cached(Model=MyClass, key=key, tz_info=None) is None
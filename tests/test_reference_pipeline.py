@@ -4,7 +4,16 @@ from typing import ClassVar
 from pyodmongo.services.reference_pipeline import (
     resolve_reference_pipeline,
     _paths_to_ref_ids,
+    reference_pipeline_template,
+    resolve_array_reference_pipeline,
 )
+from pyodmongo.services.client_populate import (
+    reference_paths,
+    collect_reference_ids,
+    stitch_references,
+)
+from pyodmongo.engines.utils import mount_base_pipeline
+from bson import ObjectId
 import pytest
 
 
@@ -335,3 +344,209 @@ def test_main_base_model_usage_recommendation():
         match="The X class inherits from Pydantic's BaseModel class. Try switching to PyODMongo's MainBaseModel class",
     ):
         _paths_to_ref_ids(cls=X, paths=[], db_field_path=[], populate_db_fields=None)
+
+
+def test_pagination_stages_placed_before_populate_lookups():
+    class A(DbModel):
+        a1: str
+        _collection: ClassVar = "a"
+
+    class Item(MainBaseModel):
+        a: A | Id
+
+    class B(DbModel):
+        b1: A | Id
+        b2: list[Item]
+        b3: str
+        _collection: ClassVar = "b"
+
+    reference_stage = resolve_reference_pipeline(
+        cls=B, pipeline=[], populate_db_fields=None
+    )
+
+    def mount(sort):
+        return mount_base_pipeline(
+            Model=B,
+            query={},
+            sort=sort,
+            populate=True,
+            pipeline=None,
+            populate_db_fields=None,
+            paginate=True,
+            current_page=2,
+            docs_per_page=10,
+            no_paginate_limit=None,
+        )
+
+    assert any("$group" in stage for stage in reference_stage)
+    assert mount(sort={"b3": 1}) == [
+        {"$match": {}},
+        {"$sort": {"b3": 1}},
+        {"$skip": 10},
+        {"$limit": 10},
+        *reference_stage,
+        {"$sort": {"b3": 1}},
+    ]
+    assert mount(sort={"b1.a1": 1}) == [
+        {"$match": {}},
+        *reference_stage,
+        {"$sort": {"b1.a1": 1}},
+        {"$skip": 10},
+        {"$limit": 10},
+    ]
+
+
+def test_facet_pagination_counts_after_match_and_custom_pipeline():
+    class A(DbModel):
+        a1: str
+        _collection: ClassVar = "a"
+
+    class B(DbModel):
+        b1: A | Id
+        b2: str
+        _collection: ClassVar = "b"
+
+    def mount(pipeline):
+        return mount_base_pipeline(
+            Model=B,
+            query={"b2": "x"},
+            sort={"b2": 1},
+            populate=True,
+            pipeline=pipeline,
+            populate_db_fields=None,
+            paginate=True,
+            current_page=3,
+            docs_per_page=5,
+            no_paginate_limit=None,
+            facet=True,
+        )
+
+    reference_stage = resolve_reference_pipeline(
+        cls=B, pipeline=[], populate_db_fields=None
+    )
+    assert mount(pipeline=None) == [
+        {"$match": {"b2": "x"}},
+        {
+            "$facet": {
+                "docs": [
+                    {"$sort": {"b2": 1}},
+                    {"$skip": 10},
+                    {"$limit": 5},
+                    *reference_stage,
+                ],
+                "total": [{"$count": "count"}],
+            }
+        },
+    ]
+    custom_pipeline = [{"$match": {"b1": {"$ne": None}}}]
+    assert mount(pipeline=custom_pipeline) == [
+        {"$match": {"b2": "x"}},
+        *custom_pipeline,
+        {
+            "$facet": {
+                "docs": [{"$sort": {"b2": 1}}, {"$skip": 10}, {"$limit": 5}],
+                "total": [{"$count": "count"}],
+            }
+        },
+    ]
+
+
+def test_reference_pipeline_template_is_memoized():
+    class A(DbModel):
+        a1: str
+        _collection: ClassVar = "a"
+
+    class B(DbModel):
+        b1: A | Id
+        b2: A | Id
+        _collection: ClassVar = "b"
+
+    template = reference_pipeline_template(cls=B, populate_db_fields=None)
+    assert template[0] == resolve_reference_pipeline(
+        cls=B, pipeline=[], populate_db_fields=None
+    )
+    assert template[1] == ("b1", "b2")
+    template[0][0]["$lookup"]["from"] = "changed"
+    template[0].append({"$limit": 1})
+    assert reference_pipeline_template(cls=B, populate_db_fields=None) == (
+        resolve_reference_pipeline(cls=B, pipeline=[], populate_db_fields=None),
+        ("b1", "b2"),
+    )
+
+    selected = reference_pipeline_template(cls=B, populate_db_fields=[B.b2])
+    assert selected[1] == ("b2",)
+    assert reference_pipeline_template(cls=B, populate_db_fields=[B.b2]) == selected
+    assert reference_pipeline_template(cls=B, populate_db_fields=[]) == ([], ())
+    assert len(B.__dict__["__pyodmongo_reference_pipelines__"]) == 3
+
+
+def test_array_reference_pipeline_keeps_arrays_intact():
+    class A(DbModel):
+        a1: str
+        _collection: ClassVar = "a"
+
+    class Item(MainBaseModel):
+        a: A | Id
+        a_list: list[A | Id]
+
+    class B(DbModel):
+        items: list[Item]
+        _collection: ClassVar = "b"
+
+    pipeline = resolve_array_reference_pipeline(
+        cls=B, pipeline=[], populate_db_fields=None
+    )
+    assert [list(stage) for stage in pipeline] == [
+        ["$lookup"],
+        ["$set"],
+        ["$unset"],
+        ["$lookup"],
+        ["$set"],
+        ["$unset"],
+    ]
+    assert pipeline[0]["$lookup"]["localField"] == "items.a"
+    assert pipeline[0]["$lookup"]["as"] == "__populate_0"
+    assert pipeline[3]["$lookup"]["localField"] == "items.a_list"
+    assert list(pipeline[1]["$set"]) == ["items"]
+    assert pipeline[2] == {"$unset": ["__populate_0"]}
+
+    template = reference_pipeline_template(
+        cls=B, populate_db_fields=None, populate_strategy="array"
+    )
+    assert template[0] == pipeline
+    assert reference_pipeline_template(cls=B, populate_db_fields=None) != template
+
+
+def test_collect_and_stitch_client_references():
+    class A(DbModel):
+        a1: str
+        _collection: ClassVar = "a"
+
+    class Item(MainBaseModel):
+        a: A | Id | None = None
+        a_list: list[A | Id] = []
+
+    class B(DbModel):
+        b1: A | Id
+        items: list[Item]
+        _collection: ClassVar = "b"
+
+    id_1, id_2, missing_id = ObjectId(), ObjectId(), ObjectId()
+    docs = [
+        {"b1": id_1, "items": [{"a": id_2, "a_list": [id_2, id_1, missing_id]}]},
+        {"b1": id_1, "items": [{"a": None}, {"a": missing_id}]},
+        {"b1": id_2, "items": None},
+    ]
+    paths = reference_paths(cls=B, populate_db_fields=None)
+    assert collect_reference_ids(docs=docs, paths=paths) == {
+        A: [id_1, id_2, missing_id]
+    }
+
+    doc_1 = {"_id": id_1, "a1": "a1"}
+    doc_2 = {"_id": id_2, "a1": "a2"}
+    stitch_references(docs=docs, paths=paths, found={A: {id_1: doc_1, id_2: doc_2}})
+    assert docs == [
+        {"b1": doc_1, "items": [{"a": doc_2, "a_list": [doc_2, doc_1]}]},
+        {"b1": doc_1, "items": [{"a": None}, {"a": None}]},
+        {"b1": doc_2, "items": None},
+    ]
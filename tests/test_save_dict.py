@@ -2,7 +2,7 @@ from pydantic import BaseModel
 from pyodmongo import DbModel, Field, Id, MainBaseModel
 from typing import ClassVar
 from bson import ObjectId
-from pyodmongo.engines.utils import consolidate_dict
+from pyodmongo.engines.utils import consolidate_dict, changed_fields
 import pytest
 
 
@@ -458,3 +458,68 @@ def test_basemodel_exception():
         match="The PydanticModel class inherits from Pydantic's BaseModel class. Try switching to PyODMongo's MainBaseModel class",
     ):
         consolidate_dict(obj=obj, dct={}, populate=False)
+
+
+def test_changed_fields():
+    old = {
+        "_id": ObjectId("64e8fe13e6dcc2a63c365df4"),
+        "name": "name",
+        "counter": 1,
+        "address": {"street": "street", "city": "city", "geo": {"lat": 1, "lng": 2}},
+        "tags": ["a", "b"],
+        "removed": "removed",
+        "embedded": None,
+    }
+    new = {
+        "_id": ObjectId("64e8fe13e6dcc2a63c365df4"),
+        "name": "name",
+        "counter": 2,
+        "address": {"street": "street", "city": "city", "geo": {"lat": 1, "lng": 3}},
+        "tags": ["a", "b", "c"],
+        "embedded": {"attr": "attr"},
+    }
+    to_set, to_unset = changed_fields(old=old, new=new)
+    assert to_set == {
+        "counter": 2,
+        "address.geo.lng": 3,
+        "tags": ["a", "b", "c"],
+        "embedded": {"attr": "attr"},
+    }
+    assert to_unset == {"removed": ""}
+    assert changed_fields(old=new, new=new) == ({}, {})
+
+
+def test_serializer_plan_is_compiled_once_per_class():
+    class Embedded(MainBaseModel):
+        attr: str
+
+    class MyModel(DbModel):
+        attr: str = Field(alias="attrAlias")
+        embedded: Embedded
+        _collection: ClassVar = "my_model"
+
+    class MySonModel(MyModel):
+        son_attr: str
+
+    obj = MyModel(attr="attr", embedded=Embedded(attr="attr"))
+    consolidate_dict(obj=obj, dct={}, populate=False)
+    plan = MyModel.__dict__["__pyodmongo_serializer_plans__"][False]
+    assert [alias for _, alias, _ in plan] == [
+        "_id",
+        "created_at",
+        "updated_at",
+        "attrAlias",
+        "embedded",
+    ]
+    assert consolidate_dict(obj=obj, dct={}, populate=False) == {
+        "_id": None,
+        "created_at": None,
+        "updated_at": None,
+        "attrAlias": "attr",
+        "embedded": {"attr": "attr"},
+    }
+    assert MyModel.__dict__["__pyodmongo_serializer_plans__"][False] is plan
+    assert "__pyodmongo_serializer_plans__" not in MySonModel.__dict__
+
+    son = MySonModel(attr="attr", embedded=Embedded(attr="attr"), son_attr="son")
+    assert consolidate_dict(obj=son, dct={}, populate=False)["son_attr"] == "son"